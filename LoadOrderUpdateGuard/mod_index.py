@@ -0,0 +1,169 @@
+# mod_index.py
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+class ModIndex(NamedTuple):
+    light: bool
+    index: int
+
+    def __str__(self) -> str:
+        # Light plugins share the FE prefix and are addressed by a 3 digit slot (FE:xxx), full plugins use a 2 digit index
+        if self.light:
+            return "FE:{0:03X}".format(self.index)
+        return "{0:02X}".format(self.index)
+
+class SlotShift(NamedTuple):
+    name: str
+    old_index: ModIndex
+    new_index: ModIndex
+    moved: bool  # True if the plugin itself was moved, False if it was shifted by plugins added/removed/moved above it
+
+    @property
+    def delta(self) -> int:
+        return self.new_index.index - self.old_index.index
+
+class ModIndexReport:
+    stable_indexes: Dict[str, ModIndex]
+    current_indexes: Dict[str, ModIndex]
+    shifts: List[SlotShift]
+    added: List[str]
+    removed: List[str]
+
+    def __init__(self):
+        self.stable_indexes = {}
+        self.current_indexes = {}
+        self.shifts = []
+        self.added = []
+        self.removed = []
+
+class OrderedPlugin(NamedTuple):
+    name: str
+    priority: int
+    esl: bool
+    extension: str
+
+def loadOrderFromLists(plugins: Sequence[str], light_plugins: Sequence[str]) -> List[OrderedPlugin]:
+    # Saves only record the order within the full and light plugin lists, which is all the mod indexes depend on
+    load_order: List[OrderedPlugin] = [OrderedPlugin(name, priority, False, Path(name).suffix) for (priority, name) in enumerate(plugins)]
+    load_order.extend(OrderedPlugin(name, len(plugins) + priority, True, Path(name).suffix) for (priority, name) in enumerate(light_plugins))
+    return load_order
+
+def isLightPlugin(plugin) -> bool:
+    # '.esl' files are always loaded as light plugins regardless of their header flag
+    return bool(plugin.esl) or plugin.extension.lower() == ".esl"
+
+def sortLoadOrder(plugins: Iterable) -> List:
+    # Plugins that are not in the load order (priority of -1) don't take a mod index
+    return sorted((plugin for plugin in plugins if plugin.priority != -1), key=lambda plugin: plugin.priority)
+
+def computeModIndexes(plugins: Iterable) -> Dict[str, ModIndex]:
+    mod_indexes: Dict[str, ModIndex] = {}
+    (full_index, light_index) = (0, 0)
+    for plugin in sortLoadOrder(plugins):
+        if isLightPlugin(plugin):
+            mod_indexes[plugin.name] = ModIndex(True, light_index)
+            light_index += 1
+        else:
+            mod_indexes[plugin.name] = ModIndex(False, full_index)
+            full_index += 1
+    return mod_indexes
+
+def myersDiff(old: Sequence[str], new: Sequence[str]) -> List[Tuple[int, int]]:
+    # Returns the (old index, new index) pairs of a longest common subsequence using Myers' O((N + M) * D) algorithm.
+    # Load order changes are usually a handful of edits, so after trimming the common prefix and suffix this is near-linear.
+    start: int = 0
+    while start < len(old) and start < len(new) and old[start] == new[start]:
+        start += 1
+
+    (old_end, new_end) = (len(old), len(new))
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    pairs: List[Tuple[int, int]] = [(index, index) for index in range(start)]
+    pairs.extend((start + old_index, start + new_index) for (old_index, new_index) in _myersMiddle(old[start:old_end], new[start:new_end]))
+    pairs.extend((old_end + offset, new_end + offset) for offset in range(len(old) - old_end))
+    return pairs
+
+def _myersMiddle(old: Sequence[str], new: Sequence[str]) -> List[Tuple[int, int]]:
+    (old_size, new_size) = (len(old), len(new))
+    if old_size == 0 or new_size == 0:
+        return []
+
+    # furthest reaching x per diagonal k (x - y), a snapshot is kept per edit distance to backtrack the path
+    furthest: Dict[int, int] = {1: 0}
+    trace: List[Dict[int, int]] = []
+    for distance in range(old_size + new_size + 1):
+        trace.append(dict(furthest))
+        for diagonal in range(-distance, distance + 1, 2):
+            if diagonal == -distance or (diagonal != distance and furthest[diagonal - 1] < furthest[diagonal + 1]):
+                x = furthest[diagonal + 1]  # insertion
+            else:
+                x = furthest[diagonal - 1] + 1  # deletion
+            y = x - diagonal
+            while x < old_size and y < new_size and old[x] == new[y]:
+                x += 1
+                y += 1
+            furthest[diagonal] = x
+            if x >= old_size and y >= new_size:
+                return _myersBacktrack(trace, old_size, new_size)
+    return []
+
+def _myersBacktrack(trace: List[Dict[int, int]], old_size: int, new_size: int) -> List[Tuple[int, int]]:
+    pairs: List[Tuple[int, int]] = []
+    (x, y) = (old_size, new_size)
+    for distance in range(len(trace) - 1, -1, -1):
+        furthest = trace[distance]
+        diagonal = x - y
+        if diagonal == -distance or (diagonal != distance and furthest.get(diagonal - 1, -1) < furthest.get(diagonal + 1, -1)):
+            previous_diagonal = diagonal + 1
+        else:
+            previous_diagonal = diagonal - 1
+        previous_x = furthest[previous_diagonal]
+        previous_y = previous_x - previous_diagonal
+
+        # walk back along the snake of matching entries
+        while x > previous_x and y > previous_y:
+            x -= 1
+            y -= 1
+            pairs.append((x, y))
+        (x, y) = (previous_x, previous_y)
+
+    pairs.reverse()
+    return pairs
+
+def compareLoadOrders(stable_plugins: Iterable, current_plugins: Iterable, addsForms: Optional[Callable[[str], bool]] = None) -> ModIndexReport:
+    stable_plugins = list(stable_plugins)
+    current_plugins = list(current_plugins)
+
+    report = ModIndexReport()
+    report.stable_indexes = computeModIndexes(stable_plugins)
+    report.current_indexes = computeModIndexes(current_plugins)
+
+    # Only the light plugins' order determines their FE:xxx slots, so align those two sequences
+    stable_light: List[str] = [plugin.name for plugin in sortLoadOrder(stable_plugins) if isLightPlugin(plugin)]
+    current_light: List[str] = [plugin.name for plugin in sortLoadOrder(current_plugins) if isLightPlugin(plugin)]
+    stable_keys: List[str] = [name.lower() for name in stable_light]
+    current_keys: List[str] = [name.lower() for name in current_light]
+    aligned = set(stable_keys[old_index] for (old_index, _) in myersDiff(stable_keys, current_keys))
+
+    stable_names: Dict[str, str] = dict(zip(stable_keys, stable_light))
+    current_names: Dict[str, str] = dict(zip(current_keys, current_light))
+    report.added = [name for (key, name) in zip(current_keys, current_light) if key not in stable_names]
+    report.removed = [name for (key, name) in zip(stable_keys, stable_light) if key not in current_names]
+
+    for (key, stable_name) in stable_names.items():
+        if key not in current_names:
+            continue
+        current_name: str = current_names[key]
+        old_index: ModIndex = report.stable_indexes[stable_name]
+        new_index: ModIndex = report.current_indexes[current_name]
+        if old_index == new_index:
+            continue
+        if addsForms is not None and not addsForms(current_name):
+            # Plugins without forms of their own have nothing baked into saves by their mod index
+            continue
+        report.shifts.append(SlotShift(current_name, old_index, new_index, key not in aligned))
+
+    return report
@@ -1,11 +1,14 @@
 from ast import Dict
-from typing import Sequence, Union, List
+from typing import Sequence, Tuple, Union, List
 from pathlib import Path
 
 from PyQt6.QtWidgets import QMessageBox
-from bethesda_structs.plugin.fnv import FNVPlugin
+
+# NOTE: bethesda_structs (and construct) are imported on first use instead of here so LOUG adds next to nothing to MO2 startup
+from .mod_index import ModIndexReport, compareLoadOrders, loadOrderFromLists
 
 import mobase
+import struct
 import json
 import re
 
@@ -38,16 +41,22 @@ class LoadOrderUpdateGuard(mobase.IPluginDiagnose):
         self._new_plugins: Dict[str, LOUG_Plugin] = {}
         self._missing_plugins: Dict[str, LOUG_Plugin] = {}
         self._save_file_name: str = "stable_load_order_LOUG.json"
+        self._save_index_file_name: str = "save_index_LOUG.json"
+        self._masters_file_name: str = "masters_LOUG.json"
         
         self._detected_master_flag_added: bool = False
         self._detected_master_flag_removed: bool = False
         self._detected_esl_flag_added: bool = False
         self._detected_esl_flag_removed: bool = False
         self._detected_esl_priority_shift: bool = False
+        self._detected_esl_index_shift: bool = False
+        self._detected_save_index_shift: bool = False
         
         self._detected_missing: bool = False
         self._detected_new: bool = False
         self._detected_changed_extension: bool = False
+        self._mod_index_report: Union[ModIndexReport, None] = None
+        self._adds_forms_cache: Dict[str, bool] = {}
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         self._organizer = organizer
@@ -140,18 +149,15 @@ class LoadOrderUpdateGuard(mobase.IPluginDiagnose):
         if not self._organizer.pluginSetting(self.name(), "more_accurate_load_order_moves"):
             return False
         
-        parsed_plugin_header = FNVPlugin.parse_header(file_path)
-
-        header_data = parsed_plugin_header.subrecords[0].parsed.value
-        num_records: int = header_data.num_records
-        next_object_id: int = header_data.next_object_id
-
-        esl_first_object_id: int = 0x801
-        is_patch: bool = num_records > 0 and next_object_id <= esl_first_object_id
-        is_dummy: bool = num_records == 0
-
-        # return is_patch or is_dummy
-        return is_patch or is_dummy
+        from bethesda_structs.plugin.fnv import FNVPlugin
+
+        try:
+            # Count the forms whose FormID master index is the plugin's own index, only record headers are read
+            form_scan = FNVPlugin.scan_forms(file_path)
+            return not form_scan.adds_forms
+        except (OSError, ValueError, struct.error):
+            # A plugin whose records can't be walked is treated as adding forms so load order moves are still guarded
+            return False
     
     
     # @TODO - Add a system for tracking specific save file load orders
@@ -222,6 +228,7 @@ class LoadOrderUpdateGuard(mobase.IPluginDiagnose):
         self._new_plugins: Dict[str, LOUG_Plugin] = {}
         self._missing_plugins: Dict[str, LOUG_Plugin] = {}
         self._changed_plugin_list: Dict[str, LOUG_Plugin] = {}
+        self._adds_forms_cache: Dict[str, bool] = {}
 
         self._detected_master_flag_added: bool = False
         self._detected_master_flag_removed: bool = False
@@ -229,6 +236,8 @@ class LoadOrderUpdateGuard(mobase.IPluginDiagnose):
         self._detected_esl_flag_added: bool = False
         self._detected_esl_flag_removed: bool = False
         self._detected_esl_priority_shift: bool = False
+        self._detected_esl_index_shift: bool = False
+        self._detected_save_index_shift: bool = False
 
         self._detected_missing: bool = False
         self._detected_new: bool = False
@@ -293,6 +302,106 @@ class LoadOrderUpdateGuard(mobase.IPluginDiagnose):
             self._changed_plugin_list[plugin.name] = plugin
             self._detected_missing = True
 
+        # Compare the actual light plugin slots (FE:xxx) of the stable and current load orders
+        if self._organizer.pluginSetting(self.name(), "report_esl_index_shifts"):
+            self.__reportModIndexShifts(loadOrder)
+
+        # Compare against the ESL slots baked into the newest saves, which may predate the last game launch
+        if self._organizer.pluginSetting(self.name(), "check_all_saves"):
+            self.__reportSaveIndexShifts(loadOrder, self._getIndexedSaveLoadOrders())
+        else:
+            saves_to_check: int = self._organizer.pluginSetting(self.name(), "saves_to_check")
+            if saves_to_check > 0:
+                from bethesda_structs.save import get_newest_saves
+                save_load_orders = [
+                    (save_info.plugins, save_info.light_plugins, [Path(save_info.filepath).name])
+                    for save_info in get_newest_saves(str(self._getSavesDirectory()), count=saves_to_check)
+                ]
+                self.__reportSaveIndexShifts(loadOrder, save_load_orders)
+
+        # Plugins requiring a changed plugin as a master are affected by the change as well
+        if len(self._changed_plugin_list) > 0 and self._organizer.pluginSetting(self.name(), "report_dependents"):
+            self.__reportDependents(loadOrder)
+
+    def __reportModIndexShifts(self, loadOrder: List[LOUG_Plugin]) -> None:
+        current_plugins: Dict[str, LOUG_Plugin] = {plugin.name: plugin for plugin in loadOrder}
+        self._mod_index_report = compareLoadOrders(self._stable_plugin_list.values(), loadOrder, addsForms=self._addsForms)
+        for slot_shift in self._mod_index_report.shifts:
+            if slot_shift.name in self._changed_plugin_list:
+                # Already reported with a more specific problem
+                continue
+            plugin: LOUG_Plugin = current_plugins[slot_shift.name]
+            plugin.problem_desc = "ESL Mod Index {0} from {1} to {2} ({3:+d})".format(
+                "moved" if slot_shift.moved else "shifted", slot_shift.old_index, slot_shift.new_index, slot_shift.delta
+            )
+            self._changed_plugin_list[plugin.name] = plugin
+            self._detected_esl_index_shift = True
+
+    def __reportSaveIndexShifts(self, loadOrder: List[LOUG_Plugin], save_load_orders: List[Tuple[Sequence[str], Sequence[str], List[str]]]) -> None:
+        # save_load_orders holds (plugins, light plugins, names of the saves sharing them) with the newest saves first
+        current_plugins: Dict[str, LOUG_Plugin] = {plugin.name: plugin for plugin in loadOrder}
+        affected_saves: Dict[str, List[str]] = {}
+        for (plugins, light_plugins, save_names) in save_load_orders:
+            save_load_order = loadOrderFromLists(plugins, light_plugins)
+            save_report: ModIndexReport = compareLoadOrders(save_load_order, loadOrder, addsForms=self._addsForms)
+            for slot_shift in save_report.shifts:
+                if slot_shift.name in self._changed_plugin_list and slot_shift.name not in affected_saves:
+                    continue
+                if slot_shift.name not in affected_saves:
+                    # Describe the shift against the newest save it affects
+                    plugin: LOUG_Plugin = current_plugins[slot_shift.name]
+                    plugin.problem_desc = "ESL Mod Index was {0} in save '{1}' but is now {2} ({3:+d})".format(
+                        slot_shift.old_index, save_names[0], slot_shift.new_index, slot_shift.delta
+                    )
+                    self._changed_plugin_list[plugin.name] = plugin
+                    self._detected_save_index_shift = True
+                affected_saves.setdefault(slot_shift.name, []).extend(save_names)
+
+        for (plugin_name, save_names) in affected_saves.items():
+            if len(save_names) > 1:
+                self._changed_plugin_list[plugin_name].problem_desc += " and {0} other save(s)".format(len(save_names) - 1)
+
+    def __reportDependents(self, loadOrder: List[LOUG_Plugin]) -> None:
+        # Only the header record (MAST subrecords) of new or changed plugins is read, the rest come from the persisted graph
+        from bethesda_structs.plugin import MasterGraph
+
+        plugin_paths: List[str] = [self._organizer.resolvePath(plugin.name) for plugin in sorted(loadOrder, key=lambda plugin: plugin.priority)]
+        graph_file = Path(self._organizer.profilePath()) / self._masters_file_name
+        try:
+            master_graph = MasterGraph.build([plugin_path for plugin_path in plugin_paths if plugin_path], cache_path=str(graph_file))
+        except (OSError, ValueError, struct.error):
+            # A plugin could not be read, the report stays without dependents
+            return
+
+        for plugin in self._changed_plugin_list.values():
+            dependents: List[str] = master_graph.get_dependents(plugin.name)
+            if len(dependents) > 0:
+                plugin.problem_desc += " ({0} dependent plugin(s): {1}{2})".format(
+                    len(dependents), ", ".join(dependents[:3]), ", ..." if len(dependents) > 3 else ""
+                )
+
+    def _getIndexedSaveLoadOrders(self) -> List[Tuple[Sequence[str], Sequence[str], List[str]]]:
+        # Only saves that are new or changed since the last refresh are read, the rest come from the persisted index
+        from bethesda_structs.save import SaveIndex
+
+        index_file = Path(self._organizer.profilePath()) / self._save_index_file_name
+        save_index = SaveIndex.build(str(self._getSavesDirectory()), cache_path=str(index_file))
+        return [
+            (plugins, light_plugins, [entry.filename for entry in entries])
+            for ((plugins, light_plugins), entries) in save_index.iter_load_orders()
+        ]
+
+    def _getSavesDirectory(self) -> Path:
+        if self._organizer.profile().localSavesEnabled():
+            return Path(self._organizer.profilePath()) / "saves"
+        return Path(self._organizer.managedGame().documentsDirectory().absolutePath()) / "Saves"
+
+    def _addsForms(self, plugin_name: str) -> bool:
+        plugin_path: str = self._organizer.resolvePath(plugin_name)
+        if plugin_path not in self._adds_forms_cache:
+            self._adds_forms_cache[plugin_path] = not self._isPatchOrDummy(plugin_path)
+        return self._adds_forms_cache[plugin_path]
+
     def __checkChanged(self, oldPlugin: LOUG_Plugin, newPlugin: LOUG_Plugin) -> Union[str, bool]:
         if newPlugin.esl != oldPlugin.esl:
             if newPlugin.esl:
@@ -412,6 +521,23 @@ class LoadOrderUpdateGuard(mobase.IPluginDiagnose):
             outputString += "   This will ensure Mod Index consistency for any ESLs currently in your load order."
             outputString += "</div>"
         
+        if self._detected_esl_index_shift:
+            outputString += "  • <b><span style=\"color: indianred\">ESL Mod Index changed</span></b> - For form adding ESL plugins whose FE:xxx slot is different from the stable load order"
+            outputString += "<div style=\"margin-left: 8px; margin-top: 0px; margin-bottom: 0px;\">"
+            outputString += "   <b style=\"color: lightseagreen;\">Recommended Fix:</b>"
+            outputString += "   Plugins reported as 'moved' were moved themselves, move them back to their previous priority."
+            outputString += "   Plugins reported as 'shifted' kept their place but ESLs added, removed or moved above them changed their slot,"
+            outputString += "   restore (or replace with an empty ESL flagged plugin) the ESLs above them until the slot matches the stable load order again."
+            outputString += "</div>"
+        
+        if self._detected_save_index_shift:
+            outputString += "  • <b><span style=\"color: indianred\">ESL Mod Index differs from a recent save</span></b> - For form adding ESL plugins whose FE:xxx slot is different from the one baked into one of your newest saves"
+            outputString += "<div style=\"margin-left: 8px; margin-top: 0px; margin-bottom: 0px;\">"
+            outputString += "   <b style=\"color: lightseagreen;\">Recommended Fix:</b>"
+            outputString += "   The save was made with a different ESL load order than the current one, even if the game was launched with the current order since."
+            outputString += "   Restore the ESL order of that save before loading it, or only continue from saves made with the current load order."
+            outputString += "</div>"
+        
         if self._detected_esl_priority_shift:
             outputString += "  • <b><span style=\"color: indianred\">An ESL plugin(s) changed priority</span></b> - For ESL plugins that have been moved in the load order"
             outputString += "<div style=\"margin-left: 8px; margin-top: 0px; margin-bottom: 0px;\">"
@@ -454,6 +580,10 @@ class LoadOrderUpdateGuard(mobase.IPluginDiagnose):
         return [
             mobase.PluginSetting("enabled", "enable this plugin", True),
             mobase.PluginSetting("report_on_esl_moved", "report manual load order changes", False),
+            mobase.PluginSetting("saves_to_check", "number of newest saves whose ESL load order is compared against the current load order (0 to disable)", 1),
+            mobase.PluginSetting("check_all_saves", "compare the ESL load order of every save on disk (indexed incrementally) instead of only the newest saves", False),
+            mobase.PluginSetting("report_esl_index_shifts", "report form adding ESLs whose FE:xxx mod index differs from the stable load order", True),
+            mobase.PluginSetting("report_dependents", "list the plugins requiring a reported plugin as a master (read from plugin headers only)", True),
             mobase.PluginSetting("more_accurate_load_order_moves", "*Experimental* adjusts what is considered the \"safe\" priority to move plugins above to ignore the lowest ordered ESLs that do not add any new forms to the game.", False)
         ]
 
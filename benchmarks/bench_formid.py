@@ -0,0 +1,90 @@
+"""Form id decoding micro-benchmark for bethesda_structs.
+
+Decodes an array of form id fields through ``FNVFormID`` and compares the compact
+``FormID`` against the previous attrs class (validating its forms on every
+instantiation). The best of several runs is reported.
+
+Usage:
+    python benchmarks/bench_formid.py [--count 200000] [--runs 5]
+"""
+
+import sys
+import timeit
+import argparse
+from typing import Any, List
+from pathlib import Path
+
+import attr
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "plugin_python" / "libs"))
+
+from construct import Array, Int32ul  # noqa: E402
+
+from bethesda_structs.plugin._common import FormID  # noqa: E402
+from bethesda_structs.plugin.fnv._common import FNVFormID  # noqa: E402
+
+FORMS = ["ACTI", "ALCH", "AMMO", "ARMO", "BOOK", "MISC", "NPC_", "WEAP"]
+
+
+@attr.s
+class AttrsFormID(object):
+    """The previous attrs form id, validating its forms on every instantiation.
+    """
+
+    form_id = attr.ib(type=int)
+    forms = attr.ib(type=List[str], default=attr.Factory(list))
+
+    @forms.validator
+    def validate(self, attribute: str, value: Any):
+        if not isinstance(value, list) or not all(
+            isinstance(entry, str) and entry.upper() == entry for entry in value
+        ):
+            raise ValueError("forms must be a list of uppercase strings")
+
+
+class AttrsFNVFormID(FNVFormID):
+    """``FNVFormID`` decoding to the previous attrs form id.
+    """
+
+    def __init__(self, forms: List[str]):
+        super().__init__(forms)
+        self.forms = forms
+
+    def _decode(self, obj: int, context: Any, path: str) -> AttrsFormID:
+        return AttrsFormID(obj, self.forms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000, help="form id fields")
+    parser.add_argument("--runs", type=int, default=5, help="runs per case")
+    args = parser.parse_args()
+
+    data = Array(args.count, Int32ul).build(range(0x01000800, 0x01000800 + args.count))
+    interned = FormID(0, FORMS).forms
+    cases = {
+        "attrs FormID (previous)": lambda: Array(
+            args.count, AttrsFNVFormID(FORMS)
+        ).parse(data),
+        "compact FormID": lambda: Array(args.count, FNVFormID(FORMS)).parse(data),
+        "raw Int32ul": lambda: Array(args.count, Int32ul).parse(data),
+        "AttrsFormID(...) only": lambda: [
+            AttrsFormID(form_id, FORMS) for form_id in range(args.count)
+        ],
+        "FormID(...) only": lambda: [
+            FormID(form_id, FORMS) for form_id in range(args.count)
+        ],
+        "FormID.from_interned(...) only": lambda: [
+            FormID.from_interned(form_id, interned) for form_id in range(args.count)
+        ],
+    }
+
+    print(f"{'case':<32} {'best ms':>10} {'ns / form id':>14}")
+    for (name, case) in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.runs))
+        print(f"{name:<32} {best * 1000:>10.2f} {best * 1e9 / args.count:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
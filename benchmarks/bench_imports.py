@@ -0,0 +1,107 @@
+"""Import time benchmark for LOUG and bethesda_structs.
+
+Every case runs in a fresh interpreter (so nothing is already imported) and the
+median of several runs is reported.
+
+Usage:
+    python benchmarks/bench_imports.py [--runs 15]
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+LIBS = ROOT / "plugin_python" / "libs"
+
+# NOTE: outside of MO2 the host modules LOUG imports do not exist, minimal stand-ins
+# are registered for them so only LOUG's own import cost is measured
+HOST_SETUP = """
+import sys, types
+try:
+    import mobase
+except ImportError:
+    mobase = types.ModuleType("mobase")
+    mobase.IPluginDiagnose = type("IPluginDiagnose", (object,), {})
+    for name in ("IOrganizer", "IProfile", "VersionInfo", "PluginSetting", "ReleaseType"):
+        setattr(mobase, name, object)
+    sys.modules["mobase"] = mobase
+try:
+    import PyQt6.QtWidgets
+except ImportError:
+    widgets = types.ModuleType("PyQt6.QtWidgets")
+    widgets.QMessageBox = object
+    sys.modules["PyQt6"] = types.ModuleType("PyQt6")
+    sys.modules["PyQt6.QtWidgets"] = widgets
+"""
+
+CASES = {
+    "LoadOrderUpdateGuard": (HOST_SETUP, "import LoadOrderUpdateGuard"),
+    "bethesda_structs.plugin.fnv": ("", "import bethesda_structs.plugin.fnv"),
+    "first record lookup (WEAP)": (
+        "import bethesda_structs.plugin.fnv.records as records",
+        "records.RecordMapping['WEAP']",
+    ),
+    "all record lookups": (
+        "import bethesda_structs.plugin.fnv.records as records",
+        "[records.RecordMapping[record_type] for record_type in records.RecordMapping]",
+    ),
+    "bethesda_structs.save": ("", "import bethesda_structs.save"),
+}
+
+TEMPLATE = """
+import sys, time
+sys.path[:0] = [{root!r}, {libs!r}]
+{setup}
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(elapsed, "construct" in sys.modules)
+"""
+
+
+def run_case(setup: str, statement: str) -> tuple:
+    """Runs a single case in a fresh interpreter.
+
+    Args:
+        setup (str): The code run before timing starts
+        statement (str): The code to time
+
+    Returns:
+        tuple: A tuple of (elapsed seconds, True if construct was imported)
+    """
+
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            TEMPLATE.format(
+                root=str(ROOT), libs=str(LIBS), setup=setup, statement=statement
+            ),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return (float(output[0]), output[1] == "True")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="runs per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<32} {'median ms':>10} {'min ms':>8}  construct loaded")
+    for (name, (setup, statement)) in CASES.items():
+        results = [run_case(setup, statement) for _ in range(args.runs)]
+        timings = [elapsed * 1000 for (elapsed, _) in results]
+        print(
+            f"{name:<32} {statistics.median(timings):>10.2f} {min(timings):>8.2f}  "
+            f"{results[0][1]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
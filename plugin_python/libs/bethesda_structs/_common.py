@@ -4,9 +4,86 @@
 import io
 import os
 import abc
-from typing import TypeVar
+import mmap
+import collections
+from typing import (
+    Any,
+    List,
+    Type,
+    Union,
+    TypeVar,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    Generator,
+)
+from concurrent.futures import ThreadPoolExecutor
+
+from construct import Construct, Container
 
 T_BaseFiletype = TypeVar("BaseFiletype")
+T_Content = Union[bytes, mmap.mmap]
+
+SNIFF_SIZE = 24
+"""The number of leading bytes read to determine the type of a file.
+
+Note:
+    This covers both archive headers and the header of the leading plugin record.
+"""
+
+
+def parallel_map(
+    func: Callable[[Any], Any], items: Iterable[Any], max_workers: int = None
+) -> Generator[Any, None, None]:
+    """Maps a function over items across a thread pool, yielding results in order.
+
+    Note:
+        At most ``2 * max_workers`` items are in flight at once, so results are
+        consumed as they are produced instead of being collected in memory.
+        Work such as (de)compression, hashing and file reads releases the GIL and
+        runs concurrently.
+
+    Args:
+        func (Callable[[Any], Any]): The function to apply to each item
+        items (Iterable[Any]): The items to map over
+        max_workers (int, optional): Defaults to None. The number of worker threads,
+            defaults to the number of available cores
+
+    Yields:
+        Any: The result of the function for each item (in order of `items`)
+    """
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = collections.deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= (max_workers * 2):
+                yield pending.popleft().result()
+        while len(pending) > 0:
+            yield pending.popleft().result()
+
+
+def parse_content(struct: Construct, content: T_Content) -> Container:
+    """Parses content with a given structure.
+
+    Note:
+        Memory mapped content is parsed as a stream, so only the parts of the file
+        the structure reads are paged in instead of copying the entire file.
+
+    Args:
+        struct (Construct): The structure to parse with
+        content (T_Content): The byte content (or memory map) to parse
+
+    Returns:
+        Container: The parsed container
+    """
+
+    if isinstance(content, mmap.mmap):
+        content.seek(0)
+        return struct.parse_stream(content)
+    return struct.parse(content)
 
 
 class BaseFiletype(abc.ABC):
@@ -25,6 +102,22 @@ class BaseFiletype(abc.ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def can_handle_header(cls, header: bytes) -> bool:
+        """Determines if a file can be handled given its first :data:`SNIFF_SIZE`
+            bytes.
+
+        Args:
+            header (bytes): The leading bytes of the file
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+
+        Returns:
+            bool: True if the file can be handled, otherwise False
+        """
+        raise NotImplementedError
+
     @abc.abstractclassmethod
     def parse_header(cls, filepath: str) -> bool:
         """Determines if a given `filepath` can be handled by the archive.
@@ -97,3 +190,117 @@ class BaseFiletype(abc.ABC):
 
         with open(filepath, "rb") as stream:
             return cls.parse_stream(stream, filepath)
+
+    def close(self):
+        """Closes the memory map the filetype was parsed from (if any).
+
+        Note:
+            If views of the content are still in use (such as the segments of
+            archive files) the map is only released once those views and the
+            filetype are garbage collected.
+            Nothing can be read from a closed filetype.
+        """
+
+        content = getattr(self, "content", None)
+        if isinstance(content, mmap.mmap):
+            try:
+                content.close()
+            except BufferError:
+                pass
+
+    def __enter__(self) -> T_BaseFiletype:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def open_filetype(
+    filepath: str,
+    filetypes: Sequence[Type[BaseFiletype]],
+    use_mmap: bool = True,
+) -> Optional[BaseFiletype]:
+    """Opens a file as the first of the given filetypes that can handle it.
+
+    The file is opened once, its first :data:`SNIFF_SIZE` bytes are used to
+    dispatch on the magic and version of the file (see
+    :func:`~BaseFiletype.can_handle_header`) and the same handle is then memory
+    mapped (or read) for the parse.
+    Memory mapped filetypes should be closed (see :func:`~BaseFiletype.close`) or
+    used as a context manager.
+
+    Args:
+        filepath (str): The filepath to open
+        filetypes (Sequence[Type[BaseFiletype]]): The candidate filetypes (in order
+            of preference)
+        use_mmap (bool, optional): Defaults to True. Memory maps the file instead of
+            reading its content
+
+    Raises:
+        FileNotFoundError: If the given filepath does not exist
+
+    Returns:
+        Optional[BaseFiletype]: The filetype instance, or None if no filetype can
+            handle the file
+    """
+
+    with open(filepath, "rb") as stream:
+        header = stream.read(SNIFF_SIZE)
+        for filetype in filetypes:
+            if filetype.can_handle_header(header):
+                break
+        else:
+            return None
+
+        stream.seek(0)
+        content: T_Content = None
+        if use_mmap and len(header) > 0:
+            try:
+                content = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                content = None
+        if content is None:
+            content = stream.read()
+        try:
+            return filetype.parse(content, filepath=filepath)
+        except Exception:
+            if isinstance(content, mmap.mmap):
+                try:
+                    content.close()
+                except BufferError:
+                    pass
+            raise
+
+
+def open_filetypes(
+    filepaths: Iterable[str],
+    filetypes: Sequence[Type[BaseFiletype]],
+    use_mmap: bool = True,
+    max_workers: int = None,
+) -> List[Optional[BaseFiletype]]:
+    """Opens many files concurrently (see :func:`open_filetype`).
+
+    Args:
+        filepaths (Iterable[str]): The filepaths to open
+        filetypes (Sequence[Type[BaseFiletype]]): The candidate filetypes (in order
+            of preference)
+        use_mmap (bool, optional): Defaults to True. Memory maps the files instead of
+            reading their content
+        max_workers (int, optional): Defaults to None. The number of threads used to
+            open files
+
+    Raises:
+        FileNotFoundError: If a given filepath does not exist
+
+    Returns:
+        List[Optional[BaseFiletype]]: The filetype instances (in order of
+            `filepaths`), None for files no filetype can handle
+    """
+
+    return list(
+        parallel_map(
+            lambda filepath: open_filetype(filepath, filetypes, use_mmap=use_mmap),
+            filepaths,
+            max_workers,
+        )
+    )
@@ -1,18 +1,42 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://choosealicense.com/licenses/mit/>
 
+from typing import List, Iterable
+
+from construct import ConstructError
+
 from .bsa import BSAArchive
 from .btdx import BTDXArchive
-from ._common import BaseArchive
+from .index import AssetIndex, AssetProvider
+from ._common import (
+    PathFilter,
+    BaseArchive,
+    ArchiveFile,
+    ArchiveSegment,
+    ExtractionReport,
+    ArchiveFileReader,
+    VerificationIssue,
+    VerificationReport,
+)
+from .._common import parallel_map, open_filetype, open_filetypes
+from .duplicates import AssetSource, DuplicateGroup, DuplicateReport, find_duplicates
 
 AVAILABLE_ARCHIVES = (BSAArchive, BTDXArchive)
 
 
-def get_archive(filepath: str) -> BaseArchive:
+def get_archive(filepath: str, use_mmap: bool = True) -> BaseArchive:
     """Get an instance of the first archive that can handle a given file.
 
+    Note:
+        The file is opened once, the archive type is determined from its leading
+        bytes and the file is memory mapped for parsing (see
+        :func:`~bethesda_structs._common.open_filetype`).
+        The archive can be used as a context manager to close the memory map.
+
     Args:
         filepath (str): The path of the file to handle
+        use_mmap (bool, optional): Defaults to True. Memory maps the archive instead
+            of reading its content
 
     Returns:
         BaseArchive: The base archive
@@ -27,6 +51,72 @@ def get_archive(filepath: str) -> BaseArchive:
         BSAArchive(filepath=PosixPath(...))
     """
 
-    for arch in AVAILABLE_ARCHIVES:
-        if arch.can_handle(filepath):
-            return arch.parse_file(filepath)
+    return open_filetype(filepath, AVAILABLE_ARCHIVES, use_mmap=use_mmap)
+
+
+def get_archives(
+    filepaths: Iterable[str], use_mmap: bool = True, max_workers: int = None
+) -> List[BaseArchive]:
+    """Get instances of the archives handling the given files concurrently.
+
+    Args:
+        filepaths (Iterable[str]): The paths of the files to handle
+        use_mmap (bool, optional): Defaults to True. Memory maps the archives instead
+            of reading their content
+        max_workers (int, optional): Defaults to None. The number of threads used to
+            open archives
+
+    Returns:
+        List[BaseArchive]: The archives (in order of `filepaths`), None for files no
+            archive can handle
+    """
+
+    return open_filetypes(
+        filepaths, AVAILABLE_ARCHIVES, use_mmap=use_mmap, max_workers=max_workers
+    )
+
+
+def verify_archives(
+    filepaths: Iterable[str], max_workers: int = None
+) -> List[VerificationReport]:
+    """Verifies the integrity of many archives in parallel.
+
+    Note:
+        Archives are verified concurrently with each other, files within a single
+        archive are then checked sequentially.
+        Archives which cannot be parsed are reported with a ``header`` issue.
+
+    Args:
+        filepaths (Iterable[str]): The filepaths of the archives to verify
+        max_workers (int, optional): Defaults to None. The number of threads used to
+            verify archives
+
+    Returns:
+        List[VerificationReport]: The reports of the archives (in order of
+            `filepaths`)
+
+    Example:
+        >>> reports = bethesda_structs.archive.verify_archives(
+        ...     glob.glob("/home/username/Downloads/*.ba2")
+        ... )
+        >>> [report.filepath for report in reports if not report.is_valid]
+        [PosixPath('/home/username/Downloads/broken.ba2')]
+    """
+
+    def verify_archive(filepath: str) -> VerificationReport:
+        try:
+            archive = get_archive(filepath)
+        except (OSError, ValueError, ConstructError) as exc:
+            return VerificationReport(
+                filepath=filepath,
+                issues=[VerificationIssue("header", None, f"cannot parse, {exc}")],
+            )
+        if archive is None:
+            return VerificationReport(
+                filepath=filepath,
+                issues=[VerificationIssue("header", None, "unsupported archive")],
+            )
+        with archive:
+            return archive.verify(max_workers=1)
+
+    return list(parallel_map(verify_archive, filepaths, max_workers))
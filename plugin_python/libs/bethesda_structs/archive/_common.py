@@ -1,17 +1,383 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://choosealicense.com/licenses/mit/>
 
+import io
 import os
+import re
 import abc
-from typing import Generic, TypeVar, Callable, Generator
-from pathlib import Path
+import sys
+import json
+import mmap
+import zlib
+import time
+import bisect
+import hashlib
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    BinaryIO,
+    Generic,
+    TypeVar,
+    Mapping,
+    Pattern,
+    Callable,
+    Iterable,
+    Optional,
+    Generator,
+    NamedTuple,
+)
+from pathlib import Path, PureWindowsPath
 
 import attr
+import lz4.frame
 from construct import Construct, Container, StreamError
 
-from .._common import BaseFiletype
+from .._common import T_Content, BaseFiletype, parallel_map, parse_content
 
 T_BaseArchive = TypeVar("BaseArchive")
+T_PackSource = Union[bytes, str, os.PathLike]
+T_PathPattern = Union[str, Pattern]
+T_PathPatterns = Union[T_PathPattern, Iterable[T_PathPattern]]
+
+
+READ_BLOCK_SIZE = 2 ** 16
+"""The size of compressed blocks fed to decompressors while streaming archived files.
+"""
+
+MANIFEST_NAME = ".extraction_manifest.json"
+"""The name of the manifest incremental extractions keep in the output directory.
+"""
+
+MANIFEST_VERSION = 3
+"""The version of extraction manifests, manifests of other versions are ignored.
+"""
+
+
+class ArchiveSegment(NamedTuple):
+    """A contiguous part of an archived file's content.
+
+    Archived files are described as a sequence of segments, each is either a raw
+    slice of the archive (``codec`` of None) or a compressed slice which inflates to
+    ``size`` bytes using the given ``codec`` (``zlib`` or ``lz4``).
+    """
+
+    data: memoryview
+    size: int
+    codec: str = None
+
+
+class SegmentInflater(object):
+    """Incrementally inflates a single compressed :class:`ArchiveSegment`.
+
+    Compressed data is fed to the decompressor in blocks of :data:`READ_BLOCK_SIZE`
+    and output is produced only as far as it is requested.
+    """
+
+    def __init__(self, segment: ArchiveSegment):
+        """Initializes the inflater.
+
+        Args:
+            segment (ArchiveSegment): The compressed segment to inflate
+
+        Raises:
+            ValueError: If the segment's codec is not supported
+        """
+
+        if segment.codec == "zlib":
+            self._decompressor = zlib.decompressobj()
+        elif segment.codec == "lz4":
+            self._decompressor = lz4.frame.LZ4FrameDecompressor()
+        else:
+            raise ValueError(f"unsupported segment codec {segment.codec!r}")
+
+        self.segment = segment
+        self.position = 0
+        self._consumed = 0
+        self._pending = b""
+
+    @property
+    def eof(self) -> bool:
+        """True if the end of the compressed stream has been reached.
+
+        Returns:
+            bool: True if the end of the compressed stream has been reached
+        """
+
+        return self._decompressor.eof
+
+    def _next_block(self) -> bytes:
+        """Gets the next block of compressed data.
+
+        Returns:
+            bytes: The next block of compressed data, empty if exhausted
+        """
+
+        block = self.segment.data[self._consumed : (self._consumed + READ_BLOCK_SIZE)]
+        self._consumed += len(block)
+        return block
+
+    def read(self, size: int) -> bytes:
+        """Inflates up to `size` bytes of the segment.
+
+        Args:
+            size (int): The maximum number of bytes to inflate
+
+        Returns:
+            bytes: The inflated bytes, empty if the segment is exhausted
+        """
+
+        size = min(size, self.segment.size - self.position)
+        while size > 0 and not self._decompressor.eof:
+            if isinstance(self._decompressor, lz4.frame.LZ4FrameDecompressor):
+                if self._decompressor.needs_input:
+                    self._pending = self._next_block()
+                    if not self._pending:
+                        break
+                output = self._decompressor.decompress(self._pending, max_length=size)
+                self._pending = b""
+            else:
+                if not self._pending:
+                    self._pending = self._next_block()
+                    if not self._pending:
+                        break
+                output = self._decompressor.decompress(self._pending, size)
+                self._pending = self._decompressor.unconsumed_tail
+
+            if output:
+                self.position += len(output)
+                return output
+        return b""
+
+    def skip(self, size: int):
+        """Inflates and discards up to `size` bytes of the segment.
+
+        Args:
+            size (int): The number of bytes to skip
+        """
+
+        while size > 0:
+            output = self.read(min(size, READ_BLOCK_SIZE))
+            if not output:
+                break
+            size -= len(output)
+
+
+def get_inflated_size(segment: ArchiveSegment) -> int:
+    """Inflates a segment completely (discarding its output) to measure its size.
+
+    Note:
+        Unlike reading through a :class:`SegmentInflater` this is not limited to the
+        segment's declared size, so oversized compressed data can be detected.
+
+    Args:
+        segment (ArchiveSegment): The segment to measure
+
+    Raises:
+        ValueError: If the compressed data is corrupt or truncated
+
+    Returns:
+        int: The number of inflated bytes
+    """
+
+    if segment.codec is None:
+        return len(segment.data)
+
+    inflater = SegmentInflater(segment._replace(size=sys.maxsize))
+    try:
+        while inflater.read(READ_BLOCK_SIZE):
+            pass
+    except (zlib.error, RuntimeError) as exc:
+        raise ValueError(f"corrupt {segment.codec} data, {exc}")
+    if not inflater.eof:
+        raise ValueError(f"truncated {segment.codec} data")
+    return inflater.position
+
+
+def iter_segment_blocks(
+    segments: List[ArchiveSegment]
+) -> Generator[bytes, None, None]:
+    """Iterates over the content of the given segments in blocks.
+
+    Raw segments are yielded as a single view of the archive, compressed segments
+    are yielded block by block as they are inflated.
+
+    Args:
+        segments (List[ArchiveSegment]): The segments to iterate over
+
+    Yields:
+        bytes: The next block of content
+    """
+
+    for segment in segments:
+        if segment.codec is None:
+            yield segment.data
+        else:
+            inflater = SegmentInflater(segment)
+            while True:
+                block = inflater.read(READ_BLOCK_SIZE)
+                if not block:
+                    break
+                yield block
+
+
+class ArchiveFileReader(io.RawIOBase):
+    """A seekable, read-only, file-like object over an archived file.
+
+    Compressed segments are only inflated as far as they are read, so reading the
+    first few bytes of a large compressed file only inflates its first block.
+    Raw segments are served directly from the archive's content.
+
+    Note:
+        Seeking backwards into a compressed segment restarts its inflation.
+
+    Examples:
+        >>> FILEPATH = ""  # absolute path to BSA/BTDX archive
+        >>> archive = bethesda_structs.archive.get_archive(FILEPATH)
+        >>> archive_file = next(archive.iter_files())
+        >>> with archive_file.open() as stream:
+        ...     magic = stream.read(4)
+    """
+
+    def __init__(self, segments: List[ArchiveSegment]):
+        """Initializes the reader.
+
+        Args:
+            segments (List[ArchiveSegment]): The segments of the archived file
+        """
+
+        super().__init__()
+        self._segments = segments
+        self._starts = []
+        offset = 0
+        for segment in segments:
+            self._starts.append(offset)
+            offset += segment.size
+        self._size = offset
+        self._position = 0
+        self._inflater: SegmentInflater = None
+        self._inflater_index: int = None
+
+    @property
+    def size(self) -> int:
+        """The size of the archived file.
+
+        Returns:
+            int: The size of the archived file
+        """
+
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Changes the stream position to the given offset.
+
+        Args:
+            offset (int): The offset relative to the position indicated by `whence`
+            whence (int, optional): Defaults to ``io.SEEK_SET``. The reference point
+
+        Raises:
+            ValueError: If `whence` is invalid or the resulting position is negative
+
+        Returns:
+            int: The new absolute position
+        """
+
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"invalid whence {whence!r}")
+
+        if position < 0:
+            raise ValueError(f"negative seek position {position!r}")
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer: bytearray) -> int:
+        """Reads bytes into a pre-allocated, writable buffer.
+
+        Note:
+            Unlike most raw streams, the buffer is always filled unless the end of
+            the archived file is reached.
+
+        Args:
+            buffer (bytearray): The buffer to read into
+
+        Returns:
+            int: The number of bytes read, 0 at the end of the archived file
+        """
+
+        if self.closed:
+            raise ValueError("I/O operation on closed reader")
+
+        view = memoryview(buffer).cast("B")
+        read = 0
+        while read < len(view) and self._position < self._size:
+            data = self._read_segment(len(view) - read)
+            if not data:
+                break
+            view[read : (read + len(data))] = data
+            read += len(data)
+            self._position += len(data)
+        return read
+
+    def _read_segment(self, size: int) -> bytes:
+        """Reads up to `size` bytes from the segment at the current position.
+
+        Args:
+            size (int): The maximum number of bytes to read
+
+        Returns:
+            bytes: The read bytes, empty if the segment is truncated
+        """
+
+        segment_index = bisect.bisect_right(self._starts, self._position) - 1
+        segment = self._segments[segment_index]
+        segment_offset = self._position - self._starts[segment_index]
+        size = min(size, segment.size - segment_offset)
+
+        if segment.codec is None:
+            return segment.data[segment_offset : (segment_offset + size)]
+
+        if (
+            self._inflater_index != segment_index
+            or self._inflater.position > segment_offset
+        ):
+            self._inflater = SegmentInflater(segment)
+            self._inflater_index = segment_index
+        self._inflater.skip(segment_offset - self._inflater.position)
+        return self._inflater.read(size)
+
+    def readall(self) -> bytes:
+        """Reads the remaining content of the archived file.
+
+        Returns:
+            bytes: The remaining content
+        """
+
+        content = bytearray(max(self._size - self._position, 0))
+        view = memoryview(content)
+        offset = 0
+        while offset < len(content):
+            read = self.readinto(view[offset:])
+            if read <= 0:
+                break
+            offset += read
+        return bytes(view[:offset])
 
 
 @attr.s
@@ -21,6 +387,13 @@ class ArchiveFile(object):
     The purpose of this object is to provide some generic format for
     :func:`~BaseArchive.iter_files` to yield so that the :func:`~BaseArchive.extract`
     method can be abstracted away from the archive subclasses.
+
+    Note:
+        Archives describe their files through ``segments`` (and optionally a
+        ``writer`` for files that have to be reassembled such as DX10 textures)
+        instead of providing the ``data``.
+        Nothing is sliced or decompressed until the file is opened, written or its
+        ``data`` is explicitly requested.
     """
 
     filepath = attr.ib(type=str, converter=Path)
@@ -30,13 +403,43 @@ class ArchiveFile(object):
         str: The relative filepath of the archived file
     """
 
-    data = attr.ib(type=bytes, repr=False)
-    """The raw data of the archived file.
+    _data = attr.ib(type=bytes, default=None, repr=False)
+    writer = attr.ib(type=Callable[[BinaryIO], None], default=None, repr=False)
+    """A callable which writes the raw data of the archived file to a given stream.
+
+    When called with ``None`` instead of a stream the writer must return the raw data.
+
+    Returns:
+        Callable[[BinaryIO], None]: The writer of the archived file, or None
+    """
+
+    _size = attr.ib(type=int, default=None, repr=False)
+    segments = attr.ib(type=List[ArchiveSegment], default=None, repr=False)
+    """The segments the archived file's content is built from.
 
     Returns:
-        bytes: The raw data of the archived file
+        List[ArchiveSegment]: The segments of the archived file, or None
     """
 
+    @property
+    def data(self) -> bytes:
+        """The raw data of the archived file.
+
+        Note:
+            Data built from a ``writer`` is collected into a single ``bytearray``
+            of the expected size.
+
+        Returns:
+            bytes: The raw data of the archived file
+        """
+        if self._data is None:
+            if callable(self.writer):
+                self._data = self.writer(None)
+            elif self.segments is not None:
+                with self.open() as stream:
+                    self._data = stream.readall()
+        return self._data
+
     @property
     def size(self) -> int:
         """The size of the raw data.
@@ -44,15 +447,482 @@ class ArchiveFile(object):
         Returns:
             int: The size of the raw data
         """
+        if self._size is not None:
+            return self._size
+        if self._data is None and self.segments is not None:
+            return sum(segment.size for segment in self.segments)
         return len(self.data)
 
+    def open(self) -> ArchiveFileReader:
+        """Opens the archived file as a lazily inflating, read-only stream.
+
+        Returns:
+            ArchiveFileReader: A file-like object over the archived file
+        """
+        if self._data is None and self.segments is not None:
+            return ArchiveFileReader(self.segments)
+        return ArchiveFileReader([ArchiveSegment(memoryview(self.data), self.size)])
+
+    def write_to(self, stream: BinaryIO):
+        """Writes the raw data of the archived file to a given stream.
+
+        Args:
+            stream (BinaryIO): The writable stream to write to
+        """
+        if self._data is None:
+            if callable(self.writer):
+                self.writer(stream)
+                return
+            elif self.segments is not None:
+                for block in iter_segment_blocks(self.segments):
+                    stream.write(block)
+                return
+        stream.write(self.data)
+
+
+def collect_pack_sources(
+    files: Union[str, os.PathLike, Mapping[str, T_PackSource]]
+) -> List[Tuple[str, T_PackSource]]:
+    """Collects the files to pack into an archive.
+
+    Args:
+        files (Union[str, os.PathLike, Mapping[str, T_PackSource]]): Either a directory
+            of loose files or a mapping of archived filepaths to either their content
+            or the path of the file to read the content from
+
+    Raises:
+        NotADirectoryError: If the given directory does not exist
+
+    Returns:
+        List[Tuple[str, T_PackSource]]: A list of (archived filepath, source) tuples
+            where the archived filepath is a relative windows path
+    """
+
+    if isinstance(files, (str, os.PathLike)):
+        from_dir = Path(files)
+        if not from_dir.is_dir():
+            raise NotADirectoryError(f"no directory {files!r} exists")
+        return [
+            (str(PureWindowsPath(filepath.relative_to(from_dir))), filepath)
+            for filepath in sorted(from_dir.rglob("*"))
+            if filepath.is_file()
+        ]
+
+    return [
+        (str(PureWindowsPath(archived_path)), source)
+        for (archived_path, source) in files.items()
+    ]
+
+
+def read_pack_source(source: T_PackSource) -> bytes:
+    """Reads the content of a file to pack.
+
+    Args:
+        source (T_PackSource): Either the content or the path of the file to read
+
+    Returns:
+        bytes: The content of the file
+    """
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    with open(source, "rb") as stream:
+        return stream.read()
+
+
+def normalize_path(filepath: Union[str, PureWindowsPath]) -> str:
+    """Normalizes an archived filepath for matching.
+
+    Args:
+        filepath (Union[str, PureWindowsPath]): The archived filepath
+
+    Returns:
+        str: The lowercased, forward slash separated filepath
+    """
+
+    if isinstance(filepath, PureWindowsPath):
+        filepath = str(filepath)
+    return filepath.replace("\\", "/").lower().strip("/")
+
+
+def translate_glob(pattern: str) -> str:
+    """Translates a glob pattern into a regular expression.
+
+    Note:
+        ``*`` and ``?`` never match across a ``/``, ``**`` matches any number of
+        (including zero) directories.
+
+    Args:
+        pattern (str): The glob pattern to translate
+
+    Returns:
+        str: The equivalent regular expression
+    """
+
+    (result, index) = ("", 0)
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            (result, index) = (result + "(?:.*/)?", index + 3)
+        elif pattern.startswith("**", index):
+            (result, index) = (result + ".*", index + 2)
+        elif pattern[index] == "*":
+            (result, index) = (result + "[^/]*", index + 1)
+        elif pattern[index] == "?":
+            (result, index) = (result + "[^/]", index + 1)
+        elif pattern[index] == "[" and "]" in pattern[index + 2 :]:
+            closing = pattern.index("]", index + 2)
+            chars = pattern[(index + 1) : closing].replace("\\", "\\\\")
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            (result, index) = (result + f"[{chars}]", closing + 1)
+        else:
+            (result, index) = (result + re.escape(pattern[index]), index + 1)
+    return result
+
+
+@attr.s
+class PathFilter(object):
+    """Include and exclude patterns for archived filepaths.
+
+    String patterns are case-insensitive globs matched against the full archived
+    filepath (using ``/`` as separator), compiled regular expressions are searched
+    for in the lowercased, ``/`` separated filepath.
+    A filepath matches if it matches any include pattern (or no include patterns are
+    given) and no exclude pattern.
+
+    Example:
+        >>> path_filter = PathFilter.create(
+        ...     include="meshes/actors/**", exclude=re.compile(r"\\.hkx$")
+        ... )
+        >>> path_filter.matches("Meshes\\Actors\\Character\\skeleton.nif")
+        True
+    """
+
+    include = attr.ib(type=List[T_PathPattern], default=attr.Factory(list))
+    """The patterns of filepaths to include.
+
+    Returns:
+        List[T_PathPattern]: The patterns of filepaths to include
+    """
+
+    exclude = attr.ib(type=List[T_PathPattern], default=attr.Factory(list))
+    """The patterns of filepaths to exclude.
+
+    Returns:
+        List[T_PathPattern]: The patterns of filepaths to exclude
+    """
+
+    _include_regexes = attr.ib(type=List[Pattern], init=False, repr=False)
+    _exclude_regexes = attr.ib(type=List[Pattern], init=False, repr=False)
+    _include_segments = attr.ib(type=List[List[str]], init=False, repr=False)
+    _exclude_prefixes = attr.ib(type=List[Pattern], init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        """Initializes the non-init attributes.
+        """
+
+        self._include_regexes = [self._compile(pattern) for pattern in self.include]
+        self._exclude_regexes = [self._compile(pattern) for pattern in self.exclude]
+
+        # NOTE: directories may only be pruned by glob includes (matched segment by
+        # segment) and by glob excludes which exclude a directory's full content
+        self._include_segments = [
+            (normalize_path(pattern).split("/") if isinstance(pattern, str) else None)
+            for pattern in self.include
+        ]
+        self._exclude_prefixes = [
+            re.compile(translate_glob(normalize_path(pattern)[:-3]), re.IGNORECASE)
+            for pattern in self.exclude
+            if isinstance(pattern, str) and normalize_path(pattern).endswith("/**")
+        ]
+
+    @classmethod
+    def create(
+        cls, include: T_PathPatterns = None, exclude: T_PathPatterns = None
+    ) -> Optional["PathFilter"]:
+        """Creates a filter from one or many include and exclude patterns.
+
+        Args:
+            include (T_PathPatterns, optional): Defaults to None. The pattern (or
+                patterns) of filepaths to include
+            exclude (T_PathPatterns, optional): Defaults to None. The pattern (or
+                patterns) of filepaths to exclude
+
+        Returns:
+            Optional[PathFilter]: The filter, or None if no patterns are given
+        """
+
+        def as_list(patterns: T_PathPatterns) -> List[T_PathPattern]:
+            if patterns is None:
+                return []
+            if isinstance(patterns, str) or hasattr(patterns, "search"):
+                return [patterns]
+            return list(patterns)
+
+        (include, exclude) = (as_list(include), as_list(exclude))
+        if len(include) <= 0 and len(exclude) <= 0:
+            return None
+        return cls(include=include, exclude=exclude)
+
+    @staticmethod
+    def _compile(pattern: T_PathPattern) -> Pattern:
+        """Compiles a pattern into a regular expression.
+
+        Args:
+            pattern (T_PathPattern): The glob or regular expression pattern
+
+        Returns:
+            Pattern: The regular expression to search for
+        """
+
+        if not isinstance(pattern, str):
+            return pattern
+        return re.compile(
+            "^" + translate_glob(normalize_path(pattern)) + "$", re.IGNORECASE
+        )
+
+    def matches(self, filepath: Union[str, PureWindowsPath]) -> bool:
+        """Determines if a given archived filepath passes the filter.
+
+        Args:
+            filepath (Union[str, PureWindowsPath]): The archived filepath
+
+        Returns:
+            bool: True if the filepath passes the filter
+        """
+
+        filepath = normalize_path(filepath)
+        if len(self._include_regexes) > 0 and not any(
+            regex.search(filepath) for regex in self._include_regexes
+        ):
+            return False
+        return not any(regex.search(filepath) for regex in self._exclude_regexes)
+
+    def matches_directory(self, directory: Union[str, PureWindowsPath]) -> bool:
+        """Determines if files directly within a given directory may pass the filter.
+
+        Note:
+            This is used to skip entire directory records before their files are
+            looked at.
+            A directory is only rejected if no file directly within it can possibly
+            pass the filter.
+
+        Args:
+            directory (Union[str, PureWindowsPath]): The archived directory path
+
+        Returns:
+            bool: False if no file directly within the directory can pass the filter
+        """
+
+        directory = normalize_path(directory)
+        directory_segments = directory.split("/") if len(directory) > 0 else []
+        for exclude_prefix in self._exclude_prefixes:
+            if any(
+                exclude_prefix.fullmatch("/".join(directory_segments[: (index + 1)]))
+                for index in range(len(directory_segments))
+            ):
+                return False
+
+        if len(self.include) <= 0:
+            return True
+        return any(
+            (
+                pattern_segments is None
+                or self._matches_segments(pattern_segments, directory_segments)
+            )
+            for pattern_segments in self._include_segments
+        )
+
+    @staticmethod
+    def _matches_segments(
+        pattern_segments: List[str], directory_segments: List[str]
+    ) -> bool:
+        """Determines if a glob pattern may match files directly within a directory.
+
+        Args:
+            pattern_segments (List[str]): The ``/`` separated glob pattern segments
+            directory_segments (List[str]): The ``/`` separated directory segments
+
+        Returns:
+            bool: True if the glob pattern may match files within the directory
+        """
+
+        for (index, directory_segment) in enumerate(directory_segments):
+            if index < len(pattern_segments) and "**" in pattern_segments[index]:
+                return True
+            if index >= (len(pattern_segments) - 1):
+                return False
+            if not re.match(
+                translate_glob(pattern_segments[index]) + "$", directory_segment
+            ):
+                return False
+        return (len(pattern_segments) - 1) == len(directory_segments) or any(
+            "**" in segment for segment in pattern_segments[:-1]
+        )
+
+
+class HashingWriter(object):
+    """A write-only stream which hashes everything written to it.
+
+    Note:
+        Written data is passed on to the wrapped `stream` (if given), so content can
+        be hashed while it is being extracted.
+
+    Args:
+        algorithm (str): The name of the :mod:`hashlib` algorithm to use
+        stream (BinaryIO, optional): Defaults to None. The stream to pass data on to
+    """
+
+    def __init__(self, algorithm: str, stream: BinaryIO = None):
+        self.hash = hashlib.new(algorithm)
+        self.stream = stream
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+        self.hash.update(data)
+        self.written += len(data)
+        if self.stream is not None:
+            self.stream.write(data)
+        return len(data)
+
+    def writelines(self, lines: Iterable[bytes]):
+        for line in lines:
+            self.write(line)
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
+
+
+def hash_filepath(filepath: str, algorithm: str) -> str:
+    """Hashes the content of a file on disk.
+
+    Args:
+        filepath (str): The path of the file to hash
+        algorithm (str): The name of the :mod:`hashlib` algorithm to use
+
+    Returns:
+        str: The hex digest of the file's content
+    """
+
+    writer = HashingWriter(algorithm)
+    with open(filepath, "rb") as stream:
+        for block in iter(lambda: stream.read(READ_BLOCK_SIZE), b""):
+            writer.write(block)
+    return writer.hexdigest()
+
+
+@attr.s
+class ExtractionReport(object):
+    """The summary of a single :func:`~BaseArchive.extract` run.
+    """
+
+    files_written = attr.ib(type=int, default=0)
+    """The number of files written.
+
+    Returns:
+        int: The number of files written
+    """
+
+    bytes_written = attr.ib(type=int, default=0)
+    """The number of bytes written.
+
+    Returns:
+        int: The number of bytes written
+    """
+
+    files_skipped = attr.ib(type=int, default=0)
+    """The number of files skipped as they were already extracted.
+
+    Returns:
+        int: The number of files skipped
+    """
+
+    bytes_skipped = attr.ib(type=int, default=0)
+    """The number of bytes of the skipped files.
+
+    Returns:
+        int: The number of bytes of the skipped files
+    """
+
+    elapsed = attr.ib(type=float, default=0.0)
+    """The number of seconds the extraction took.
+
+    Returns:
+        float: The number of seconds the extraction took
+    """
+
+    telemetry = attr.ib(type=dict, default=attr.Factory(dict))
+    """Additional archive specific statistics (such as cache hit rates).
+
+    Returns:
+        dict: Additional archive specific statistics
+    """
+
+
+class VerificationIssue(NamedTuple):
+    """A single problem found while verifying an archive.
+
+    The ``kind`` of an issue is one of ``header`` (the archive cannot be parsed),
+    ``bounds`` (data lies outside of the archive), ``inflate`` (compressed data is
+    corrupt), ``size`` (data does not inflate to the declared size) or ``hash`` (a
+    stored name hash does not match the name).
+    """
+
+    kind: str
+    filepath: str
+    message: str
+
+
+@attr.s
+class VerificationReport(object):
+    """The summary of a single :func:`~BaseArchive.verify` run.
+    """
+
+    filepath = attr.ib(type=str, default=None)
+    """The filepath of the verified archive.
+
+    Returns:
+        str: The filepath of the verified archive
+    """
+
+    files_checked = attr.ib(type=int, default=0)
+    """The number of archived files checked.
+
+    Returns:
+        int: The number of archived files checked
+    """
+
+    issues = attr.ib(type=List[VerificationIssue], default=attr.Factory(list))
+    """The problems found in the archive.
+
+    Returns:
+        List[VerificationIssue]: The problems found in the archive
+    """
+
+    elapsed = attr.ib(type=float, default=0.0)
+    """The number of seconds the verification took.
+
+    Returns:
+        float: The number of seconds the verification took
+    """
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no problems were found in the archive.
+
+        Returns:
+            bool: True if no problems were found
+        """
+
+        return len(self.issues) <= 0
+
 
 @attr.s
 class BaseArchive(BaseFiletype, abc.ABC, Generic[T_BaseArchive]):
     """The base class all Archives should subclass.
     """
 
-    content = attr.ib(type=bytes, repr=False)
+    content = attr.ib(type=T_Content, repr=False)
     filepath = attr.ib(type=str, default=None)
     container = attr.ib(type=Container, default=None, repr=False, init=False)
 
@@ -63,7 +933,7 @@ class BaseArchive(BaseFiletype, abc.ABC, Generic[T_BaseArchive]):
             self.filepath = Path(self.filepath)
 
         try:
-            self.container = self.archive_struct.parse(self.content)
+            self.container = parse_content(self.archive_struct, self.content)
         except StreamError as exc:
             raise ValueError(
                 (
@@ -85,11 +955,28 @@ class BaseArchive(BaseFiletype, abc.ABC, Generic[T_BaseArchive]):
         raise NotImplementedError
 
     @classmethod
-    def parse(cls, content: bytes, filepath: str = None) -> T_BaseArchive:
+    def parse_header(cls, filepath: str) -> Container:
+        """Parses only the header of a given `filepath`.
+
+        Args:
+            filepath (str): The filepath to parse the header of
+
+        Returns:
+            Container: The parsed header container
+        """
+        return cls.header_struct.parse_file(filepath)
+
+    @classmethod
+    def parse(cls, content: T_Content, filepath: str = None) -> T_BaseArchive:
         """Create a :class:`BaseArchive` from a byte array.
 
+        Note:
+            The content may also be a read-only :class:`mmap.mmap` of the archive,
+            in which case only the archive's header and records are read on
+            initialization.
+
         Args:
-            content (bytes): The byte content of the archive
+            content (T_Content): The byte content (or memory map) of the archive
             filepath (str, optional): Defaults to None.
                 Sets the filepath attribute for user's reference
 
@@ -99,7 +986,7 @@ class BaseArchive(BaseFiletype, abc.ABC, Generic[T_BaseArchive]):
         Returns:
             :class:`BaseArchive`: An archive instance
         """
-        if not isinstance(content, bytes):
+        if not isinstance(content, (bytes, mmap.mmap)):
             raise ValueError(
                 f"given content must be of bytes, recieved {type(content)!r}"
             )
@@ -107,20 +994,190 @@ class BaseArchive(BaseFiletype, abc.ABC, Generic[T_BaseArchive]):
         return cls(content, filepath=filepath)
 
     @abc.abstractmethod
-    def iter_files(self) -> Generator[ArchiveFile, None, None]:
+    def iter_files(
+        self, include: T_PathPatterns = None, exclude: T_PathPatterns = None
+    ) -> Generator[ArchiveFile, None, None]:
         """Iterates over the available files in the archive.
 
+        Note:
+            Subclasses must evaluate the filter (see :class:`PathFilter`) against the
+            archived filepaths before any file data is sliced or decompressed.
+
+        Args:
+            include (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to include
+            exclude (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to exclude
+
+        Yields:
+            ArchiveFile: An archive file
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_filepaths(
+        self, include: T_PathPatterns = None, exclude: T_PathPatterns = None
+    ) -> Generator[PureWindowsPath, None, None]:
+        """Iterates over the filepaths of the files in the archive.
+
+        Note:
+            Unlike :func:`~BaseArchive.iter_files`, every archived file is listed
+            (even those whose content cannot be reassembled) and only the archive's
+            names are read.
+
+        Args:
+            include (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to include
+            exclude (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to exclude
+
+        Yields:
+            PureWindowsPath: An archived filepath
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+        """
+        raise NotImplementedError
+
+    def _iter_stored_files(self) -> Generator[ArchiveFile, None, None]:
+        """Iterates over archive files for every archived file.
+
+        Note:
+            Files whose content cannot be reassembled by
+            :func:`~BaseArchive.iter_files` are described by their stored data
+            instead of being skipped.
+
         Yields:
             ArchiveFile: An archive file
+        """
+
+        return self.iter_files()
+
+    def _check_bounds(
+        self, filepath: str, offset: int, size: int
+    ) -> List[VerificationIssue]:
+        """Checks that a range of data lies within the archive.
+
+        Args:
+            filepath (str): The archived filepath the data belongs to
+            offset (int): The offset of the data
+            size (int): The size of the data
+
+        Returns:
+            List[VerificationIssue]: The found issues
+        """
+
+        if offset < 0 or (offset + size) > len(self.content):
+            return [
+                VerificationIssue(
+                    "bounds",
+                    filepath,
+                    (
+                        f"data at {offset} of size {size} exceeds the archive size "
+                        f"of {len(self.content)}"
+                    ),
+                )
+            ]
+        return []
+
+    def _check_segment(
+        self, filepath: str, segment: ArchiveSegment
+    ) -> List[VerificationIssue]:
+        """Checks that a segment inflates to its declared size.
+
+        Args:
+            filepath (str): The archived filepath the segment belongs to
+            segment (ArchiveSegment): The segment to check
+
+        Returns:
+            List[VerificationIssue]: The found issues
+        """
+
+        try:
+            inflated_size = get_inflated_size(segment)
+        except ValueError as exc:
+            return [VerificationIssue("inflate", filepath, str(exc))]
+        if inflated_size != segment.size:
+            return [
+                VerificationIssue(
+                    "size",
+                    filepath,
+                    f"data inflates to {inflated_size} bytes, expected {segment.size}",
+                )
+            ]
+        return []
+
+    def _iter_verification_checks(
+        self
+    ) -> Generator[Callable[[], List[VerificationIssue]], None, None]:
+        """Iterates over the independent checks verifying the archive's files.
 
         Raises:
             NotImplementedError: Subclasses must implement
+
+        Yields:
+            Callable[[], List[VerificationIssue]]: A check of a single archived file
+                returning the found issues
         """
         raise NotImplementedError
 
+    def verify(self, max_workers: int = None) -> VerificationReport:
+        """Verifies the integrity of the archive without extracting it.
+
+        Every record is checked to lie within the archive, compressed data is
+        inflated (and discarded) to check it matches the declared sizes and stored
+        name hashes are compared to the archived names.
+        Archived files are checked in parallel.
+
+        Args:
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to check files
+
+        Returns:
+            VerificationReport: The summary of the verification
+
+        Example:
+            >>> FILEPATH = ""  # absolute path to BSA/BTDX archive
+            >>> archive = bethesda_structs.archive.get_archive(FILEPATH)
+            >>> archive.verify().is_valid
+            True
+        """
+
+        started = time.perf_counter()
+        checks = list(self._iter_verification_checks())
+        report = VerificationReport(
+            filepath=self.filepath, files_checked=len(checks)
+        )
+        for issues in parallel_map(lambda check: check(), checks, max_workers):
+            report.issues.extend(issues)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _get_telemetry(self, since: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Gets archive specific statistics to include in extraction reports.
+
+        Args:
+            since (Dict[str, Any], optional): Defaults to None. The telemetry taken at
+                the start of an extraction, counters are reported as the difference
+                to it
+
+        Returns:
+            Dict[str, Any]: The extraction telemetry of the archive
+        """
+        return {}
+
     def extract(
-        self, to_dir: str, progress_hook: Callable[[int, int, str], None] = None
-    ):
+        self,
+        to_dir: str,
+        progress_hook: Callable[[int, int, str], None] = None,
+        incremental: bool = False,
+        hash_algorithm: str = None,
+        include: T_PathPatterns = None,
+        exclude: T_PathPatterns = None,
+    ) -> ExtractionReport:
         """Extracts the content of the `BaseArchive` to the given directory.
 
         Args:
@@ -128,6 +1185,18 @@ class BaseArchive(BaseFiletype, abc.ABC, Generic[T_BaseArchive]):
             progress_hook (Callable[[int, int, str], None], optional): Defaults to None.
                 A progress hook that should expect (``current``, ``total``,
                 ``current_filepath``) as arguments
+            incremental (bool, optional): Defaults to False. Skips files which are
+                already extracted (see :func:`~BaseArchive._is_extracted`)
+            hash_algorithm (str, optional): Defaults to None. The name of a
+                :mod:`hashlib` algorithm to also compare content hashes with in
+                incremental extractions
+            include (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to extract
+            exclude (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to skip
+
+        Returns:
+            ExtractionReport: The summary of the extraction
 
         Example:
             >>> FILEPATH = ""  # absolute path to BSA/BTDX archive
@@ -156,31 +1225,277 @@ class BaseArchive(BaseFiletype, abc.ABC, Generic[T_BaseArchive]):
             92.1
             100.0
 
+        Example:
+            >>> FILEPATH = ""  # absolute path to BSA/BTDX archive
+            >>> archive = bethesda_structs.archive.get_archive(FILEPATH)
+            >>> archive.extract(
+            ...     '/home/username/Downloads/extracted', incremental=True
+            ... )
+            ExtractionReport(files_written=3, ..., files_skipped=1204, ...)
+
+        Example:
+            >>> FILEPATH = ""  # absolute path to BSA/BTDX archive
+            >>> archive = bethesda_structs.archive.get_archive(FILEPATH)
+            >>> archive.extract(
+            ...     '/home/username/Downloads/extracted',
+            ...     include="meshes/actors/**",
+            ...     exclude=["**/*.hkx", re.compile(r"_1\\.nif$")],
+            ... )
+
         Note:
             The provided progress hook is simple and two-stage. It is called once
             before a file is being written and once after the same file is done
             being written.
         """
 
+        return self._extract_files(
+            to_dir,
+            self.iter_files(include=include, exclude=exclude),
+            progress_hook,
+            incremental=incremental,
+            hash_algorithm=hash_algorithm,
+        )
+
+    def _get_source_identity(self) -> List[Any]:
+        """Gets the identity of the archive recorded for incrementally extracted files.
+
+        Returns:
+            List[Any]: The (resolved filepath, size, modification time) of the
+                archive, or None if the archive was not read from a file
+        """
+
+        if self.filepath is None:
+            return None
+        try:
+            stat = self.filepath.stat()
+        except OSError:
+            return None
+        return [self.filepath.resolve().as_posix(), stat.st_size, stat.st_mtime_ns]
+
+    def _get_entry_fingerprint(self, entry: ArchiveFile) -> int:
+        """Gets the checksum of an archive file's stored (possibly compressed) data.
+
+        Note:
+            The stored data is only read, nothing is decompressed.
+
+        Args:
+            entry (ArchiveFile): The archive file to get the checksum of
+
+        Returns:
+            int: The CRC32 checksum of the archive file's stored data
+        """
+
+        checksum = 0
+        if entry.segments is None:
+            return zlib.crc32(entry.data)
+        for segment in entry.segments:
+            checksum = zlib.crc32(segment.data, checksum)
+        return checksum
+
+    def _is_extracted(
+        self,
+        entry: ArchiveFile,
+        to_path: Path,
+        manifest_entry: List[Any],
+        source: List[Any],
+        hash_algorithm: str = None,
+    ) -> Tuple[bool, List[Any]]:
+        """Determines if a given archive file is already extracted to `to_path`.
+
+        Note:
+            Files whose size and modification time on disk are unchanged since they
+            were recorded in the manifest are considered extracted if either the
+            identity of the archive they were extracted from or the checksum of
+            their stored data (see :func:`~BaseArchive._get_entry_fingerprint`) is
+            unchanged.
+            Otherwise files are only considered extracted if a `hash_algorithm` is
+            given and the content hash of the file on disk (taken from the manifest
+            while the file is unchanged) matches the archived file.
+
+        Args:
+            entry (ArchiveFile): The archive file to check
+            to_path (Path): The path the archive file is extracted to
+            manifest_entry (List[Any]): The manifest entry of the path (maybe None)
+            source (List[Any]): The identity of the archive (maybe None)
+            hash_algorithm (str, optional): Defaults to None. The name of the
+                :mod:`hashlib` algorithm to compare content hashes with
+
+        Returns:
+            Tuple[bool, List[Any]]: A tuple of (True if the file is extracted, the
+                current manifest entry of the path)
+        """
+
+        try:
+            stat = to_path.stat()
+        except OSError:
+            return (False, None)
+        if stat.st_size != entry.size:
+            return (False, None)
+
+        current_entry = [stat.st_size, stat.st_mtime_ns, None, source, None]
+        is_unchanged = (
+            manifest_entry is not None and manifest_entry[:2] == current_entry[:2]
+        )
+        if is_unchanged and source is not None and manifest_entry[3] == source:
+            current_entry[2:] = [manifest_entry[2], source, manifest_entry[4]]
+            return (True, current_entry)
+
+        current_entry[4] = self._get_entry_fingerprint(entry)
+        if is_unchanged and manifest_entry[4] == current_entry[4]:
+            current_entry[2] = manifest_entry[2]
+            return (True, current_entry)
+        if hash_algorithm is None:
+            return (False, None)
+
+        if is_unchanged and manifest_entry[2] is not None:
+            current_entry[2] = manifest_entry[2]
+        else:
+            current_entry[2] = hash_filepath(to_path, hash_algorithm)
+        writer = HashingWriter(hash_algorithm)
+        entry.write_to(writer)
+        return (writer.hexdigest() == current_entry[2], current_entry)
+
+    def _load_manifest(self, manifest_path: Path, hash_algorithm: str = None) -> dict:
+        """Loads the extraction manifest of an output directory.
+
+        Args:
+            manifest_path (Path): The path of the manifest
+            hash_algorithm (str, optional): Defaults to None. The hash algorithm the
+                manifest's hashes must have been built with
+
+        Returns:
+            dict: A mapping of relative filepaths to their (size, modification time,
+                content hash, archive identity, stored data checksum) entries
+        """
+
+        try:
+            with manifest_path.open("r", encoding="utf8") as stream:
+                manifest = json.load(stream)
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != MANIFEST_VERSION
+        ):
+            return {}
+        files = manifest.get("files", {})
+        if manifest.get("hash_algorithm") != hash_algorithm:
+            # NOTE: hashes of a different algorithm are useless, sizes still apply
+            for manifest_entry in files.values():
+                manifest_entry[2] = None
+        return files
+
+    def _extract_files(
+        self,
+        to_dir: str,
+        archive_files: Iterable[ArchiveFile],
+        progress_hook: Callable[[int, int, str], None] = None,
+        incremental: bool = False,
+        hash_algorithm: str = None,
+    ) -> ExtractionReport:
+        """Writes the given archive files to the given directory.
+
+        Note:
+            Incremental extractions keep a manifest of the written files' sizes,
+            modification times, (optional) content hashes, the identity of the
+            archive they came from and the checksum of their stored data in the
+            output directory so unchanged files are not hashed again.
+
+        Args:
+            to_dir (str): The directory to extract the content to
+            archive_files (Iterable[ArchiveFile]): The archive files to write
+            progress_hook (Callable[[int, int, str], None], optional): Defaults to None.
+                A progress hook that should expect (``current``, ``total``,
+                ``current_filepath``) as arguments
+            incremental (bool, optional): Defaults to False. Skips files which are
+                already extracted
+            hash_algorithm (str, optional): Defaults to None. The name of a
+                :mod:`hashlib` algorithm to also compare content hashes with in
+                incremental extractions
+
+        Raises:
+            NotADirectoryError: If the given directory does not exist
+
+        Returns:
+            ExtractionReport: The summary of the extraction
+        """
+
         if not os.path.isdir(to_dir):
             raise NotADirectoryError(f"no directory {to_dir!r} exists")
 
         to_dir = Path(to_dir)
+        started = time.perf_counter()
+        # NOTE: taken before the archive files are built, which builds DDS headers
+        telemetry = self._get_telemetry()
 
-        archive_files = list(self.iter_files())
+        archive_files = list(archive_files)
         total_size = sum(entry.size for entry in archive_files)
         current_size = 0
+        report = ExtractionReport()
+
+        manifest_path = to_dir.joinpath(MANIFEST_NAME)
+        manifest = (
+            self._load_manifest(manifest_path, hash_algorithm) if incremental else {}
+        )
+        source = self._get_source_identity() if incremental else None
 
         for entry in archive_files:
             to_path = to_dir.joinpath(entry.filepath)
+            manifest_key = entry.filepath.as_posix()
             if callable(progress_hook):
                 progress_hook(current_size, total_size, to_path.as_posix())
 
-            if not to_path.parent.is_dir():
-                to_path.parent.mkdir(parents=True)
-            with to_path.open("wb") as stream:
-                stream.write(entry.data)
+            is_extracted = False
+            if incremental:
+                (is_extracted, manifest_entry) = self._is_extracted(
+                    entry, to_path, manifest.get(manifest_key), source, hash_algorithm
+                )
+
+            if is_extracted:
+                manifest[manifest_key] = manifest_entry
+                report.files_skipped += 1
+                report.bytes_skipped += entry.size
+            else:
+                if not to_path.parent.is_dir():
+                    to_path.parent.mkdir(parents=True)
+                with to_path.open("wb") as stream:
+                    if incremental and hash_algorithm is not None:
+                        writer = HashingWriter(hash_algorithm, stream)
+                        entry.write_to(writer)
+                        digest = writer.hexdigest()
+                    else:
+                        entry.write_to(stream)
+                        digest = None
+                if incremental:
+                    stat = to_path.stat()
+                    manifest[manifest_key] = [
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        digest,
+                        source,
+                        self._get_entry_fingerprint(entry),
+                    ]
+                report.files_written += 1
+                report.bytes_written += entry.size
             current_size += entry.size
 
             if callable(progress_hook):
                 progress_hook(current_size, total_size, to_path.as_posix())
+
+        if incremental:
+            temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+            with temp_path.open("w", encoding="utf8") as stream:
+                json.dump(
+                    {
+                        "version": MANIFEST_VERSION,
+                        "hash_algorithm": hash_algorithm,
+                        "files": manifest,
+                    },
+                    stream,
+                )
+            os.replace(temp_path, manifest_path)
+
+        report.elapsed = time.perf_counter() - started
+        report.telemetry = self._get_telemetry(since=telemetry)
+        return report
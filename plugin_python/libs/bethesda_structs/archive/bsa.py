@@ -1,7 +1,12 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://choosealicense.com/licenses/mit/>
 
-from typing import Generator
+import os
+import zlib
+import struct
+import itertools
+from typing import Dict, List, Tuple, Union, Mapping, Callable, Generator
+from functools import partial
 from pathlib import PureWindowsPath
 
 import lz4.frame
@@ -23,7 +28,18 @@ from construct import (
     PascalString,
 )
 
-from ._common import ArchiveFile, BaseArchive
+from .._common import SNIFF_SIZE, parallel_map
+from ._common import (
+    PathFilter,
+    ArchiveFile,
+    BaseArchive,
+    T_PackSource,
+    ArchiveSegment,
+    T_PathPatterns,
+    read_pack_source,
+    VerificationIssue,
+    collect_pack_sources,
+)
 
 
 class LZ4CompressedAdapter(Adapter):
@@ -85,6 +101,30 @@ class BSAArchive(BaseArchive):
 
     SIZE_MASK = 0x3fffffff
     COMPRESSED_MASK = 0xc0000000
+    COMPRESSION_TOGGLE = 0x40000000
+
+    EXTENSION_FLAGS = {
+        ".nif": 0x001,
+        ".dds": 0x002,
+        ".xml": 0x004,
+        ".wav": 0x008,
+        ".mp3": 0x010,
+        ".txt": 0x020,
+        ".html": 0x020,
+        ".bat": 0x020,
+        ".scc": 0x020,
+        ".spt": 0x040,
+        ".tex": 0x080,
+        ".fnt": 0x080,
+        ".ctl": 0x100,
+    }
+    """The ``file_flags`` header flag of known file extensions.
+
+    Returns:
+        Dict[str, int]: A mapping of file extension to flag
+    """
+
+    HASH_EXTENSION_KEYS = {".nif": 1, ".kf": 2, ".dds": 3, ".wav": 4}
 
     header_struct = Struct(
         "magic" / Bytes(4),
@@ -222,47 +262,481 @@ class BSAArchive(BaseArchive):
 
         Args:
             filepath (str): The filepath to check if can be handled
+
+        Returns:
+            bool: True if the file can be handled, otherwise False (also when the
+                file does not exist)
         """
 
-        header = cls.header_struct.parse_file(filepath)
-        return header.magic == b"BSA\x00" and header.version in (103, 104, 105)
+        if not os.path.isfile(filepath):
+            return False
 
-    def iter_files(self) -> Generator[ArchiveFile, None, None]:
-        """Iterates over the parsed data and yields instances of :class:`.ArchiveFile`.
+        with open(filepath, "rb") as stream:
+            return cls.can_handle_header(stream.read(SNIFF_SIZE))
+
+    @classmethod
+    def can_handle_header(cls, header: bytes) -> bool:
+        """Determines if a file can be handled given its leading bytes.
+
+        Args:
+            header (bytes): The leading bytes of the file
+
+        Returns:
+            bool: True if the file can be handled, otherwise False
+        """
+
+        return (
+            len(header) >= 8
+            and header[:4] == b"BSA\x00"
+            and struct.unpack_from("<I", header, 4)[0] in (103, 104, 105)
+        )
+
+    def _iter_file_records(
+        self, path_filter: PathFilter = None
+    ) -> Generator[Tuple[PureWindowsPath, Container], None, None]:
+        """Iterates over the file records along with their archived filepaths.
+
+        Note:
+            Directories which cannot contain files passing the given `path_filter` are
+            skipped by their directory block name without looking at their files.
+
+        Args:
+            path_filter (PathFilter, optional): Defaults to None. The filter of
+                archived filepaths to yield
 
         Yields:
-            :class:`.ArchiveFile`: An file contained within the archive
+            Tuple[PureWindowsPath, Container]: A tuple of (filepath, file record)
         """
 
         file_index = 0
-        file_struct = self.uncompressed_file_struct
-        if self.container.header.archive_flags.files_compressed:
-            file_struct = self.compressed_file_struct
-
         for directory_block in self.container.directory_blocks:
             # get directory path from directory block
             directory_path = PureWindowsPath(directory_block.name[:-1])
+            if path_filter is not None and not path_filter.matches_directory(
+                directory_path
+            ):
+                file_index += len(directory_block.file_records)
+                continue
+
             for file_record in directory_block.file_records:
-                # choose the compressed file structure if compressed mask is set
-                if file_record.size > 0 and (
-                    self.container.header.archive_flags.files_compressed
-                    != bool(file_record.size & self.COMPRESSED_MASK)
-                ):
-                    file_struct = self.compressed_file_struct
-
-                file_container = file_struct.parse(
-                    self.content[
-                        file_record.offset : (
-                            file_record.offset + (file_record.size & self.SIZE_MASK)
-                        )
-                    ]
+                filepath = directory_path.joinpath(
+                    self.container.file_names[file_index]
                 )
+                file_index += 1
+                if path_filter is None or path_filter.matches(filepath):
+                    yield (filepath, file_record)
+
+    def _is_file_compressed(self, file_record: Container) -> bool:
+        """Determines if a given file record's data is compressed.
+
+        Note:
+            The compressed mask of a file record's size toggles the archive's default
+            compression for that single file.
+
+        Args:
+            file_record (Container): The file record to check
 
-                yield ArchiveFile(
-                    filepath=directory_path.joinpath(
-                        self.container.file_names[file_index]
-                    ),
-                    data=file_container.data,
+        Returns:
+            bool: True if the file's data is compressed, otherwise False
+        """
+
+        return self.container.header.archive_flags.files_compressed != bool(
+            file_record.size & self.COMPRESSED_MASK
+        )
+
+    def _get_file_segments(self, file_record: Container) -> List[ArchiveSegment]:
+        """Describes the content of a given file record as archive segments.
+
+        Note:
+            Only the embedded name prefix (if present) and the original size of
+            compressed files are read, the file data itself is left untouched.
+
+        Args:
+            file_record (Container): The file record to describe
+
+        Returns:
+            List[ArchiveSegment]: The segments of the file's content
+        """
+
+        content_view = memoryview(self.content)
+        offset = file_record.offset
+        size = file_record.size & self.SIZE_MASK
+        if (
+            self.container.header.version >= 104
+            and self.container.header.archive_flags.files_prefixed
+            and size > 0
+        ):
+            # files may be prefixed by their full path as a byte length string
+            prefix_size = content_view[offset] + 1
+            (offset, size) = (offset + prefix_size, size - prefix_size)
+
+        if size < 4 or not self._is_file_compressed(file_record):
+            return [ArchiveSegment(content_view[offset : (offset + size)], size)]
+
+        (original_size,) = struct.unpack_from("<I", content_view, offset)
+        return [
+            ArchiveSegment(
+                content_view[(offset + 4) : (offset + size)],
+                original_size,
+                ("lz4" if self.container.header.version >= 105 else "zlib"),
+            )
+        ]
+
+    def _verify_file(
+        self,
+        filepath: PureWindowsPath,
+        file_record: Container,
+        directory_record: Container = None,
+    ) -> List[VerificationIssue]:
+        """Verifies a single file record.
+
+        Args:
+            filepath (PureWindowsPath): The archived filepath of the file record
+            file_record (Container): The file record to verify
+            directory_record (Container, optional): Defaults to None. The directory
+                record to also verify the directory name hash of
+
+        Returns:
+            List[VerificationIssue]: The found issues
+        """
+
+        issues = []
+        if directory_record is not None and directory_record.hash != self.hash_name(
+            str(filepath.parent), is_directory=True
+        ):
+            issues.append(
+                VerificationIssue(
+                    "hash",
+                    str(filepath.parent),
+                    f"directory hash {directory_record.hash:#018x} does not match",
                 )
+            )
+        if file_record.hash != self.hash_name(filepath.name):
+            issues.append(
+                VerificationIssue(
+                    "hash",
+                    str(filepath),
+                    f"file hash {file_record.hash:#018x} does not match",
+                )
+            )
+
+        bounds_issues = self._check_bounds(
+            str(filepath), file_record.offset, file_record.size & self.SIZE_MASK
+        )
+        if len(bounds_issues) > 0:
+            return issues + bounds_issues
+        for segment in self._get_file_segments(file_record):
+            issues.extend(self._check_segment(str(filepath), segment))
+        return issues
 
+    def _iter_verification_checks(
+        self
+    ) -> Generator[Callable[[], List[VerificationIssue]], None, None]:
+        """Iterates over the checks verifying each file record.
+
+        Note:
+            Directory name hashes are verified along with the first file record of
+            each directory.
+
+        Yields:
+            Callable[[], List[VerificationIssue]]: A check of a single file record
+        """
+
+        file_index = 0
+        for (directory_record, directory_block) in zip(
+            self.container.directory_records, self.container.directory_blocks
+        ):
+            directory_path = PureWindowsPath(directory_block.name[:-1])
+            for (record_index, file_record) in enumerate(directory_block.file_records):
+                yield partial(
+                    self._verify_file,
+                    directory_path.joinpath(self.container.file_names[file_index]),
+                    file_record,
+                    (directory_record if record_index == 0 else None),
+                )
                 file_index += 1
+
+    def iter_files(
+        self, include: T_PathPatterns = None, exclude: T_PathPatterns = None
+    ) -> Generator[ArchiveFile, None, None]:
+        """Iterates over the parsed data and yields instances of :class:`.ArchiveFile`.
+
+        Note:
+            File data is not decompressed until it is requested through the yielded
+            :class:`.ArchiveFile`.
+
+        Args:
+            include (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to include
+            exclude (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to exclude
+
+        Yields:
+            :class:`.ArchiveFile`: An file contained within the archive
+        """
+
+        path_filter = PathFilter.create(include, exclude)
+        for (filepath, file_record) in self._iter_file_records(path_filter):
+            yield ArchiveFile(
+                filepath=filepath, segments=self._get_file_segments(file_record)
+            )
+
+    def iter_filepaths(
+        self, include: T_PathPatterns = None, exclude: T_PathPatterns = None
+    ) -> Generator[PureWindowsPath, None, None]:
+        """Iterates over the archived filepaths from the directory blocks and names.
+
+        Args:
+            include (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to include
+            exclude (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to exclude
+
+        Yields:
+            PureWindowsPath: An archived filepath
+        """
+
+        path_filter = PathFilter.create(include, exclude)
+        for (filepath, _) in self._iter_file_records(path_filter):
+            yield filepath
+
+    @classmethod
+    def hash_name(cls, name: str, is_directory: bool = False) -> int:
+        """Calculates the hash of a directory or file name as stored in BSA records.
+
+        Args:
+            name (str): The directory path or file name to hash
+            is_directory (bool, optional): Defaults to False. True if `name` is a
+                directory path (directories never have extensions)
+
+        Returns:
+            int: The 64 bit hash of the name
+
+        **Credit:**
+            - `UESP <https://en.uesp.net/wiki/Oblivion_Mod:Hash_Calculation>`_
+        """
+
+        def hash_chars(chars: bytes) -> int:
+            result = 0
+            for char in chars:
+                result = ((result * 0x1003F) + char) & 0xFFFFFFFF
+            return result
+
+        name = name.lower().replace("/", "\\").encode("utf8")
+        (root, extension) = (name, b"")
+        if not is_directory and b"." in name:
+            split_index = name.rindex(b".")
+            (root, extension) = (name[:split_index], name[split_index:])
+
+        result = 0
+        if len(root) > 0:
+            result = (
+                root[-1]
+                | ((root[-2] if len(root) > 2 else 0) << 8)
+                | (len(root) << 16)
+                | (root[0] << 24)
+            )
+
+        extension_key = cls.HASH_EXTENSION_KEYS.get(extension.decode("utf8"), 0)
+        if extension_key:
+            result = (
+                (result & 0x00FF0000)
+                | ((((extension_key & 0xFC) << 5) + (result >> 24)) & 0xFF) << 24
+                | ((((extension_key & 0xFE) << 6) + (result & 0xFF)) & 0xFF)
+                | (((extension_key << 7) + ((result >> 8) & 0xFF)) & 0xFF) << 8
+            )
+
+        upper = (hash_chars(root[1:-2]) if len(root) > 3 else 0) + hash_chars(
+            extension
+        )
+        return (result + ((upper & 0xFFFFFFFF) << 32)) & 0xFFFFFFFFFFFFFFFF
+
+    @classmethod
+    def pack(
+        cls,
+        to_file: str,
+        files: Union[str, os.PathLike, Mapping[str, T_PackSource]],
+        version: int = 105,
+        compress: bool = True,
+        max_workers: int = None,
+    ):
+        """Packs files into a new BSA archive.
+
+        Files are read and compressed in parallel (``zlib`` for v104 and ``LZ4`` for
+        v105 archives) while the data section is written in order.
+        Once all data is written the header, directory records, file records and name
+        tables are written in front of it.
+        Files which do not shrink when compressed are stored uncompressed.
+
+        Args:
+            to_file (str): The path of the archive to create
+            files (Union[str, os.PathLike, Mapping[str, T_PackSource]]): Either a
+                directory of loose files or a mapping of archived filepaths to either
+                their content or the path of the file to read the content from
+            version (int, optional): Defaults to 105. The BSA version (104 or 105)
+            compress (bool, optional): Defaults to True. Compresses the files
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to read and compress files
+
+        Raises:
+            ValueError:
+                - If the given version cannot be written
+                - If an archived name cannot be encoded or a directory name is
+                  longer than 254 bytes
+
+        Example:
+            >>> bethesda_structs.archive.BSAArchive.pack(
+            ...     "/home/username/Downloads/packed.bsa",
+            ...     "/home/username/Downloads/extracted",
+            ...     version=104,
+            ... )
+        """
+
+        if version not in (104, 105):
+            raise ValueError(
+                f"cannot write BSA version {version!r}, expects 104 or 105"
+            )
+
+        directories: Dict[str, List[Tuple[str, T_PackSource]]] = {}
+        # NOTE: all name lengths and offsets are counted in encoded bytes
+        encoded_names: Dict[str, bytes] = {}
+        for (archived_path, source) in collect_pack_sources(files):
+            archived_path = PureWindowsPath(archived_path.lower())
+            directory_name = str(archived_path.parent)
+            file_name = archived_path.name
+            for name in (directory_name, file_name):
+                if name not in encoded_names:
+                    try:
+                        encoded_names[name] = name.encode("utf8")
+                    except UnicodeEncodeError as exc:
+                        raise ValueError(f"cannot encode archived name {name!r}, {exc}")
+            if len(encoded_names[directory_name]) > 254:
+                raise ValueError(
+                    f"directory name {directory_name!r} is longer than 254 bytes"
+                )
+            directories.setdefault(directory_name, []).append((file_name, source))
+
+        directory_names = sorted(
+            directories, key=lambda name: cls.hash_name(name, is_directory=True)
+        )
+        for directory_name in directory_names:
+            directories[directory_name].sort(key=lambda entry: cls.hash_name(entry[0]))
+        file_entries = list(
+            itertools.chain.from_iterable(
+                directories[directory_name] for directory_name in directory_names
+            )
+        )
+
+        directory_names_length = sum(
+            len(encoded_names[name]) + 1 for name in directory_names
+        )
+        file_names_length = sum(
+            len(encoded_names[name]) + 1 for (name, _) in file_entries
+        )
+        directory_record_size = 24 if version >= 105 else 16
+        records_offset = 36 + (directory_record_size * len(directory_names))
+        data_offset = (
+            records_offset
+            + sum(
+                (
+                    len(encoded_names[directory_name])
+                    + 2
+                    + (16 * len(directories[directory_name]))
+                )
+                for directory_name in directory_names
+            )
+            + file_names_length
+        )
+
+        def pack_file(source: T_PackSource) -> Tuple[bytes, bool]:
+            data = read_pack_source(source)
+            if compress and len(data) > 0:
+                compressed = (
+                    lz4.frame.compress(data) if version >= 105 else zlib.compress(data)
+                )
+                if (len(compressed) + 4) < len(data):
+                    return (struct.pack("<I", len(data)) + compressed, False)
+            # toggle compression for files stored uncompressed in compressed archives
+            return (data, compress)
+
+        file_records = []
+        with open(to_file, "wb") as stream:
+            stream.seek(data_offset)
+            for (file_data, toggled) in parallel_map(
+                pack_file, (source for (_, source) in file_entries), max_workers
+            ):
+                file_records.append(
+                    (
+                        len(file_data) | (cls.COMPRESSION_TOGGLE if toggled else 0),
+                        stream.tell(),
+                    )
+                )
+                stream.write(file_data)
+
+            stream.seek(0)
+            stream.write(
+                b"BSA\x00"
+                + struct.pack(
+                    "<8I",
+                    version,
+                    36,
+                    (0x001 | 0x002 | (0x004 if compress else 0)),
+                    len(directory_names),
+                    len(file_entries),
+                    directory_names_length,
+                    file_names_length,
+                    cls._get_file_flags(name for (name, _) in file_entries),
+                )
+            )
+
+            directory_blocks = []
+            block_offset = records_offset
+            file_index = 0
+            for directory_name in directory_names:
+                file_count = len(directories[directory_name])
+                directory_hash = cls.hash_name(directory_name, is_directory=True)
+                # NOTE: directory name offsets include the total file names length
+                name_offset = block_offset + file_names_length
+                if version >= 105:
+                    stream.write(
+                        struct.pack("<QIIQ", directory_hash, file_count, 0, name_offset)
+                    )
+                else:
+                    stream.write(
+                        struct.pack("<QII", directory_hash, file_count, name_offset)
+                    )
+
+                block = bytearray()
+                block += struct.pack("<B", len(encoded_names[directory_name]) + 1)
+                block += encoded_names[directory_name] + b"\x00"
+                for (file_name, _) in directories[directory_name]:
+                    block += struct.pack(
+                        "<QII", cls.hash_name(file_name), *file_records[file_index]
+                    )
+                    file_index += 1
+                directory_blocks.append(block)
+                block_offset += len(block)
+
+            stream.writelines(directory_blocks)
+            stream.write(
+                b"".join(
+                    (encoded_names[file_name] + b"\x00")
+                    for (file_name, _) in file_entries
+                )
+            )
+
+    @classmethod
+    def _get_file_flags(cls, file_names: Generator[str, None, None]) -> int:
+        """Builds the ``file_flags`` header field for the given file names.
+
+        Args:
+            file_names (Generator[str, None, None]): The archived file names
+
+        Returns:
+            int: The file flags
+        """
+
+        file_flags = 0
+        for file_name in file_names:
+            file_flags |= cls.EXTENSION_FLAGS.get(os.path.splitext(file_name)[-1], 0)
+        return file_flags
@@ -1,8 +1,24 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://choosealicense.com/licenses/mit/>
 
+import os
+import zlib
+import shutil
+import struct
+import tempfile
 import warnings
-from typing import Tuple, Generator
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Mapping,
+    BinaryIO,
+    Callable,
+    Generator,
+)
+from functools import partial
 from pathlib import PureWindowsPath
 
 from construct import (
@@ -12,27 +28,35 @@ from construct import (
     Int8ul,
     Struct,
     Switch,
-    VarInt,
     Default,
     Int16ul,
     Int32ul,
     Int64ul,
     Container,
     FlagsEnum,
-    Compressed,
-    GreedyBytes,
     PaddedString,
-    PascalString,
 )
 
 from .. import __version__
-from ._common import ArchiveFile, BaseArchive
+from .._common import SNIFF_SIZE, parallel_map
+from ._common import (
+    PathFilter,
+    ArchiveFile,
+    BaseArchive,
+    T_PackSource,
+    ArchiveSegment,
+    T_PathPatterns,
+    ExtractionReport,
+    read_pack_source,
+    VerificationIssue,
+    collect_pack_sources,
+)
 from ..contrib.dds import (
-    DDS_HEADER,
-    MAKEFOURCC,
-    DDS_HEADER_DX10,
+    DDSInfo,
     DXGIFormats,
-    D3D10ResourceDimension,
+    DDSHeaderFactory,
+    get_mip_size,
+    read_dds_info,
 )
 
 
@@ -151,279 +175,783 @@ class BTDXArchive(BaseArchive):
         :class:`~construct.core.Struct`: The **partial** structure of BTDX archives
     """
 
+    DX10_CHUNK_SIZE = 2 ** 16
+    """The minimum size of a packed mip to be stored in its own DX10 chunk.
+
+    Returns:
+        int: The minimum size of a mip stored in its own chunk
+    """
+
+    def __attrs_post_init__(self):
+        """Initializes the archive's own DDS header factory.
+        """
+
+        # NOTE: each archive memoizes its own headers so the reported cache
+        # statistics only describe this archive
+        self.dds_header_factory = DDSHeaderFactory()
+        super().__attrs_post_init__()
+
     @classmethod
     def can_handle(cls, filepath: str) -> bool:
         """Determines if a given file can be handled by the current archive.
 
         Args:
             filepath (str): The filepath to check if can be handled
+
+        Returns:
+            bool: True if the file can be handled, otherwise False (also when the
+                file does not exist)
         """
-        header = cls.header_struct.parse_file(filepath)
-        return header.magic == b"BTDX" and header.version >= 1
 
-    def _build_dds_headers(self, file_container: Container) -> Tuple[bytes, bytes]:
+        if not os.path.isfile(filepath):
+            return False
+
+        with open(filepath, "rb") as stream:
+            return cls.can_handle_header(stream.read(SNIFF_SIZE))
+
+    @classmethod
+    def can_handle_header(cls, header: bytes) -> bool:
+        """Determines if a file can be handled given its leading bytes.
+
+        Args:
+            header (bytes): The leading bytes of the file
+
+        Returns:
+            bool: True if the file can be handled, otherwise False
+        """
+
+        return (
+            len(header) >= 8
+            and header[:4] == b"BTDX"
+            and struct.unpack_from("<I", header, 4)[0] >= 1
+        )
+
+    def _build_dds_headers(
+        self, file_container: Container, warn: bool = True
+    ) -> Tuple[bytes, bytes]:
         """Builds DDS and DX10 secion headers for a given `file_container`.
 
+        Note:
+            Headers are memoized by the archive's own
+            :attr:`~BTDXArchive.dds_header_factory`, so textures with the same
+            format, dimensions, mips and cubemap flag only build their headers once.
+
         Args:
             file_container (Container): File container to build headers for
+            warn (bool, optional): Defaults to True. Warns if the texture format is
+                not supported
 
         Returns:
             Tuple[bytes, bytes]: A tuple of `DDS_HEADER` and `DX10_HEADER` (maybe None)
         """
 
-        header_data = {
-            "dwFlags": {
-                "DDSD_CAPS": True,
-                "DDSD_HEIGHT": True,
-                "DDSD_WIDTH": True,
-                "DDSD_PIXELFORMAT": True,
-                "DDSD_MIPMAPCOUNT": True,
-                "DDSD_LINEARSIZE": True,
-            },
-            "dwHeight": file_container.header.height,
-            "dwWidth": file_container.header.width,
-            "dwMipMapCount": file_container.header.mips_count,
-            "dwCaps": {
-                "DDSCAPS_COMPLEX": True,
-                "DDSCAPS_TEXTURE": True,
-                "DDSCAPS_MIPMAP": True,
-            },
-        }
-
-        # NOTE: I'm unsure what this field "is", but BAE has logic to build complete
-        # cubemaps for the DDS_HEADER if set to 2049
-        if file_container.header._unknown_1 == 2049:
-            header_data.update(
-                {
-                    "dwCaps2": {
-                        "DDSCAPS2_CUBEMAP": True,
-                        "DDSCAPS2_CUBEMAP_POSITIVEX": True,
-                        "DDSCAPS2_CUBEMAP_NEGATIVEX": True,
-                        "DDSCAPS2_CUBEMAP_POSITIVEY": True,
-                        "DDSCAPS2_CUBEMAP_NEGATIVEY": True,
-                        "DDSCAPS2_CUBEMAP_POSITIVEZ": True,
-                        "DDSCAPS2_CUBEMAP_NEGATIVEZ": True,
-                    }
-                }
+        headers = self.dds_header_factory.build(
+            file_container.header.format,
+            file_container.header.width,
+            file_container.header.height,
+            file_container.header.mips_count,
+            # NOTE: I'm unsure what this field "is", but BAE has logic to build
+            # complete cubemaps for the DDS_HEADER if set to 2049
+            cubemap=(file_container.header._unknown_1 == 2049),
+        )
+        if headers is None and warn:
+            warnings.warn(
+                (
+                    f"unsupported DXGI format "
+                    f"{DXGIFormats(file_container.header.format).name}, "
+                    f"please create an issue on {__version__.__repo__} if you see this"
+                ),
+                UserWarning,
             )
+        return headers
 
-        # TODO: find a cleaner more obvious way of implementing this logic
-        dx10_header_data = {}
-        pixel_data = {}
-        if file_container.header.format == DXGIFormats.DXGI_FORMAT_BC1_UNORM:
-            pixel_data.update(
-                dict(
-                    dwFlags=dict(DDPF_FOURCC=True),
-                    dwFourCC=MAKEFOURCC("D", "X", "T", "1"),
-                )
-            )
-            header_data.update(
-                dict(
-                    dwPitchOrLinearSize=(
-                        (file_container.header.width * file_container.header.height)
-                        // 2
-                    )
-                )
-            )
-        elif file_container.header.format == DXGIFormats.DXGI_FORMAT_BC2_UNORM:
-            pixel_data.update(
-                dict(
-                    dwFlags=dict(DDPF_FOURCC=True),
-                    dwFourCC=MAKEFOURCC("D", "X", "T", "3"),
-                )
-            )
-            header_data.update(
-                dict(
-                    dwPitchOrLinearSize=(
-                        file_container.header.width * file_container.header.height
-                    )
-                )
-            )
-        elif file_container.header.format == DXGIFormats.DXGI_FORMAT_BC3_UNORM:
-            pixel_data.update(
-                dict(
-                    dwFlags=dict(DDPF_FOURCC=True),
-                    dwFourCC=MAKEFOURCC("D", "X", "T", "5"),
-                )
-            )
-            header_data.update(
-                dict(
-                    dwPitchOrLinearSize=(
-                        file_container.header.width * file_container.header.height
-                    )
-                )
-            )
-        elif file_container.header.format == DXGIFormats.DXGI_FORMAT_BC5_UNORM:
-            pixel_data.update(
-                dict(
-                    dwFlags=dict(DDPF_FOURCC=True),
-                    dwFourCC=MAKEFOURCC("A", "T", "I", "2"),
-                )
-            )
-            header_data.update(
-                dict(
-                    dwPitchOrLinearSize=(
-                        file_container.header.width * file_container.header.height
-                    )
-                )
-            )
-        elif file_container.header.format in (
-            DXGIFormats.DXGI_FORMAT_BC7_UNORM,
-            DXGIFormats.DXGI_FORMAT_BC7_UNORM_SRGB,
-        ):
-            # FIXME: There may be a header differnce between BC7_UNORM and
-            # BC7_UNORM_SRGB, but I haven't noticed any
-            # (someone with more experience will have to let me know)
-            pixel_data.update(
-                dict(
-                    dwFlags=dict(DDPF_FOURCC=True),
-                    dwFourCC=MAKEFOURCC("D", "X", "1", "0"),
+    def _get_telemetry(self, since: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Gets the archive's DDS header cache statistics for extraction reports.
+
+        Args:
+            since (Dict[str, Any], optional): Defaults to None. The telemetry taken at
+                the start of an extraction, cache hits and misses are reported as the
+                difference to it
+
+        Returns:
+            Dict[str, Any]: The extraction telemetry of the archive
+        """
+
+        cache_info = self.dds_header_factory.cache_info()
+        if since is not None:
+            cache_info = cache_info.since(since["dds_header_cache"])
+        return {"dds_header_cache": cache_info}
+
+    def _iter_names(self) -> Generator[str, None, None]:
+        """Iterates over the names table of the archive.
+
+        Yields:
+            str: The next archived filepath
+        """
+
+        content_view = memoryview(self.content)
+        offset = self.container.header.names_offset
+        for _ in range(self.container.header.file_count):
+            (name_length,) = struct.unpack_from("<H", content_view, offset)
+            offset += 2
+            yield str(content_view[offset : (offset + name_length)], "utf8")
+            offset += name_length
+
+    def _get_gnrl_segments(self, file_container: Container) -> List[ArchiveSegment]:
+        """Describes the content of a given GNRL `file_container` as archive segments.
+
+        Args:
+            file_container (Container): The GNRL file container to describe
+
+        Returns:
+            List[ArchiveSegment]: The segments of the file's content
+        """
+
+        content_view = memoryview(self.content)
+        if file_container.packed_size > 0:
+            return [
+                ArchiveSegment(
+                    content_view[
+                        file_container.offset : (
+                            file_container.offset + file_container.packed_size
+                        )
+                    ],
+                    file_container.unpacked_size,
+                    "zlib",
                 )
-            )
-            header_data.update(
-                dict(
-                    dwPitchOrLinearSize=(
-                        file_container.header.width * file_container.header.height
+            ]
+        return [
+            ArchiveSegment(
+                content_view[
+                    file_container.offset : (
+                        file_container.offset + file_container.unpacked_size
                     )
-                )
+                ],
+                file_container.unpacked_size,
             )
-            dx10_header_data.update(
-                {
-                    "dxgiFormat": file_container.header.format,
-                    "resourceDimension": (
-                        D3D10ResourceDimension.D3D10_RESOURCE_DIMENSION_TEXTURE2D.value
-                    ),
-                    "miscFlag": 0,
-                    "arraySize": 1,
-                    "miscFlags2": 0,
-                }
-            )
-        elif file_container.header.format == DXGIFormats.DXGI_FORMAT_B8G8R8A8_UNORM:
-            pixel_data.update(
-                dict(
-                    dwFlags=dict(DDPF_ALPHA=True, DDPF_RBG=True),
-                    dwRGBBitCount=32,
-                    dwABitMask=0xFF000000,
-                    dwRBitMask=0x00FF0000,
-                    dwGBitMask=0x0000FF00,
-                    dwBBitMask=0x000000FF,
-                )
-            )
-            header_data.update(
-                dict(
-                    dwPitchOrLinearSize=(
-                        (file_container.header.width * file_container.header.height) * 4
+        ]
+
+    def _get_chunk_segments(self, file_container: Container) -> List[ArchiveSegment]:
+        """Describes the texture chunks of a given DX10 `file_container` as archive
+            segments.
+
+        Args:
+            file_container (Container): The DX10 file container to describe
+
+        Returns:
+            List[ArchiveSegment]: The segments of the texture chunks
+        """
+
+        segments = []
+        content_view = memoryview(self.content)
+        for tex_chunk in file_container.chunks:
+            if tex_chunk.packed_size > 0:
+                segments.append(
+                    ArchiveSegment(
+                        content_view[
+                            tex_chunk.offset : (
+                                tex_chunk.offset + tex_chunk.packed_size
+                            )
+                        ],
+                        tex_chunk.unpacked_size,
+                        "zlib",
                     )
                 )
-            )
-        elif file_container.header.format == DXGIFormats.DXGI_FORMAT_R8_UNORM:
-            pixel_data.update(
-                dict(
-                    dwFlags=dict(DDPF_RGB=True), dwRGBBitCount=8, dwRBitMask=0x000000FF
-                )
-            )
-            header_data.update(
-                dict(
-                    dwPitchOrLinearSize=(
-                        file_container.header.width * file_container.header.height
+            else:
+                segments.append(
+                    ArchiveSegment(
+                        content_view[
+                            tex_chunk.offset : (
+                                tex_chunk.offset + tex_chunk.unpacked_size
+                            )
+                        ],
+                        tex_chunk.unpacked_size,
                     )
                 )
-            )
-        else:
-            warnings.warn(
-                (
-                    f"unsupported DXGI format "
-                    f"{DXGIFormats(file_container.header.format).name}, "
-                    f"please create an issue on {__version__.__repo__} if you see this"
-                ),
-                UserWarning,
-            )
-            return
+        return segments
+
+    def _get_dds_segments(
+        self, file_container: Container, dds_header: bytes, dx10_header: bytes
+    ) -> List[ArchiveSegment]:
+        """Describes the reassembled DDS file of a given DX10 `file_container` as
+            archive segments.
+
+        Args:
+            file_container (Container): The DX10 file container to describe
+            dds_header (bytes): The prebuilt DDS header
+            dx10_header (bytes): The prebuilt DX10 header (maybe None)
+
+        Returns:
+            List[ArchiveSegment]: The segments of the DDS file
+        """
+
+        headers = b"DDS " + dds_header + (dx10_header or b"")
+        return [ArchiveSegment(memoryview(headers), len(headers))] + (
+            self._get_chunk_segments(file_container)
+        )
 
-        header_data.update({"ddspf": pixel_data})
-        dx10_header = None
-        if len(dx10_header_data) > 0:
-            dx10_header = DDS_HEADER_DX10.build(dx10_header_data)
-        return (DDS_HEADER.build(header_data), dx10_header)
+    def _iter_file_containers(
+        self, path_filter: PathFilter = None
+    ) -> Generator[Tuple[Container, str], None, None]:
+        """Iterates over the file containers along with their archived filepaths.
 
-    def _iter_gnrl_files(self) -> Generator[ArchiveFile, None, None]:
+        Args:
+            path_filter (PathFilter, optional): Defaults to None. The filter of
+                archived filepaths to yield
+
+        Yields:
+            Tuple[Container, str]: A tuple of (file container, filepath)
+        """
+
+        for (file_container, filepath) in zip(
+            self.container.files, self._iter_names()
+        ):
+            if path_filter is None or path_filter.matches(filepath):
+                yield (file_container, filepath)
+
+    def _iter_gnrl_files(
+        self, path_filter: PathFilter = None
+    ) -> Generator[ArchiveFile, None, None]:
         """Iterates over the parsed data for GNRL fiels and yields instances of
             `ArchiveFile`.
 
+        Args:
+            path_filter (PathFilter, optional): Defaults to None. The filter of
+                archived filepaths to yield
+
         Raises:
             ValueError: If a filename cannot be determined for a specific file record
 
         Yields:
             :class:`.ArchiveFile`: A file contained within the archive
         """
-        filename_offset = 0
-        for file_container in self.container.files:
-            filepath_content = self.content[
-                (self.container.header.names_offset + filename_offset) :
-            ]
-            filepath = PascalString(VarInt, "utf8").parse(filepath_content)
-            # filename offset increased by length of parsed string accounting for
-            # prefix and suffix bytes
-            filename_offset += len(filepath) + 2
-
-            file_data = self.content[
-                file_container.offset : (
-                    file_container.offset + file_container.unpacked_size
+        for (file_container, filepath) in self._iter_file_containers(path_filter):
+            yield ArchiveFile(
+                filepath=PureWindowsPath(filepath),
+                segments=self._get_gnrl_segments(file_container),
+            )
+
+    def _iter_dds_parts(
+        self, file_container: Container, dds_header: bytes, dx10_header: bytes
+    ) -> Generator[bytes, None, None]:
+        """Iterates over the consecutive parts of a DDS file for a given
+            `file_container`.
+
+        Args:
+            file_container (Container): File container to build the DDS parts for
+            dds_header (bytes): The prebuilt DDS header
+            dx10_header (bytes): The prebuilt DX10 header (maybe None)
+
+        Yields:
+            bytes: The next part of the DDS file
+        """
+
+        yield b"DDS "
+        yield dds_header
+        if dx10_header:
+            yield dx10_header
+
+        content_view = memoryview(self.content)
+        for tex_chunk in file_container.chunks:
+            if tex_chunk.packed_size > 0:
+                yield zlib.decompress(
+                    content_view[
+                        tex_chunk.offset : (tex_chunk.offset + tex_chunk.packed_size)
+                    ]
                 )
-            ]
-            if file_container.packed_size > 0:
-                file_data = Compressed(GreedyBytes, "zlib").parse(file_data)
+            else:
+                yield content_view[
+                    tex_chunk.offset : (tex_chunk.offset + tex_chunk.unpacked_size)
+                ]
 
-            yield ArchiveFile(filepath=PureWindowsPath(filepath[1:]), data=file_data)
+    def write_dds(
+        self,
+        file_container: Container,
+        stream: BinaryIO = None,
+        headers: Tuple[bytes, bytes] = None,
+    ) -> bytearray:
+        """Writes the reassembled DDS file of a given DX10 `file_container`.
 
-    def _iter_dx10_files(self) -> Generator[ArchiveFile, None, None]:
+        Each chunk is decompressed and handed to the stream on its own, so the texture
+        is never concatenated in memory.
+        Streams providing ``writelines`` receive all parts through a single call.
+
+        Args:
+            file_container (Container): The DX10 file container to write
+            stream (BinaryIO, optional): Defaults to None. The stream to write to,
+                if None the DDS file is collected into a single preallocated
+                ``bytearray``
+            headers (Tuple[bytes, bytes], optional): Defaults to None.
+                Prebuilt ``(DDS_HEADER, DX10_HEADER)`` tuple for the file container
+
+        Returns:
+            bytearray: The DDS file if no `stream` was given, otherwise None
+        """
+
+        if headers is None:
+            headers = self._build_dds_headers(file_container)
+        (dds_header, dx10_header) = headers
+        parts = self._iter_dds_parts(file_container, dds_header, dx10_header)
+
+        if stream is None:
+            dds_content = bytearray(
+                self._get_dds_size(file_container, dds_header, dx10_header)
+            )
+            offset = 0
+            for part in parts:
+                dds_content[offset : (offset + len(part))] = part
+                offset += len(part)
+            # NOTE: only truncates if chunks inflated smaller than their recorded size
+            del dds_content[offset:]
+            return dds_content
+
+        if hasattr(stream, "writelines"):
+            stream.writelines(parts)
+        else:
+            for part in parts:
+                stream.write(part)
+
+    def _get_dds_size(
+        self, file_container: Container, dds_header: bytes, dx10_header: bytes
+    ) -> int:
+        """Calculates the size of the reassembled DDS file for a given
+            `file_container`.
+
+        Args:
+            file_container (Container): File container to calculate the size for
+            dds_header (bytes): The prebuilt DDS header
+            dx10_header (bytes): The prebuilt DX10 header (maybe None)
+
+        Returns:
+            int: The size of the reassembled DDS file
+        """
+
+        return (
+            4
+            + len(dds_header)
+            + (len(dx10_header) if dx10_header else 0)
+            + sum(tex_chunk.unpacked_size for tex_chunk in file_container.chunks)
+        )
+
+    def _iter_dx10_files(
+        self, path_filter: PathFilter = None
+    ) -> Generator[ArchiveFile, None, None]:
         """Iterates over the parsed data for DX10 archives and yields instances of
             `ArchiveFile`.
 
+        Note:
+            The yielded files are written through :func:`~BTDXArchive.write_dds`,
+            chunks are only decompressed once the file's data is requested.
+
+        Args:
+            path_filter (PathFilter, optional): Defaults to None. The filter of
+                archived filepaths to yield
+
         Raises:
             ValueError: If a filename cannot be determined for a specific file record
 
         Yields:
             :class:`.ArchiveFile`: A file contained within the archive
         """
-        filename_offset = 0
-        for file_container in self.container.files:
+        for (file_container, filepath) in self._iter_file_containers(path_filter):
+            archive_file = self._get_dx10_file(file_container, filepath)
+            if archive_file is not None:
+                yield archive_file
+
+    def _get_dx10_file(
+        self,
+        file_container: Container,
+        filepath: str,
+        headers: Tuple[bytes, bytes] = None,
+    ) -> ArchiveFile:
+        """Builds the archive file of a given DX10 `file_container`.
+
+        Args:
+            file_container (Container): The DX10 file container
+            filepath (str): The archived filepath of the file container
+            headers (Tuple[bytes, bytes], optional): Defaults to None.
+                Prebuilt ``(DDS_HEADER, DX10_HEADER)`` tuple for the file container
+
+        Returns:
+            :class:`.ArchiveFile`: The archive file, or None if the texture format is
+                not supported
+        """
+
+        if headers is None:
+            headers = self._build_dds_headers(file_container)
+        if headers:
+            return ArchiveFile(
+                filepath=PureWindowsPath(filepath),
+                writer=partial(self.write_dds, file_container, headers=headers),
+                size=self._get_dds_size(file_container, *headers),
+                segments=self._get_dds_segments(file_container, *headers),
+            )
+
+    def _get_preview_mip(
+        self, file_container: Container, mips_count: int = None, max_size: int = None
+    ) -> int:
+        """Determines the first (largest) mip level to keep in a texture preview.
+
+        Args:
+            file_container (Container): The DX10 file container to preview
+            mips_count (int, optional): Defaults to None. The number of smallest mips
+                to keep
+            max_size (int, optional): Defaults to None. The largest width or height
+                the preview may have
+
+        Returns:
+            int: The index of the first mip level to keep
+        """
+
+        last_mip = max(file_container.header.mips_count - 1, 0)
+        first_mip = 0
+        if mips_count is not None:
+            first_mip = max(first_mip, last_mip + 1 - max(mips_count, 1))
+        if max_size is not None:
+            largest = max(file_container.header.width, file_container.header.height)
+            while first_mip < last_mip and (largest >> first_mip) > max_size:
+                first_mip += 1
+        return min(first_mip, last_mip)
+
+    def _iter_preview_chunks(
+        self, file_container: Container, first_mip: int
+    ) -> Generator[Tuple[Container, int], None, None]:
+        """Iterates over the chunks covering the mips from `first_mip` onwards.
+
+        Args:
+            file_container (Container): The DX10 file container to preview
+            first_mip (int): The index of the first mip level to keep
+
+        Raises:
+            ValueError: If the chunk sizes do not match the expected mip sizes
+
+        Yields:
+            Tuple[Container, int]: A tuple of (chunk, number of leading inflated
+                bytes to skip)
+        """
+
+        header = file_container.header
+        for tex_chunk in file_container.chunks:
+            if tex_chunk.end_mip < first_mip:
+                continue
 
-            filepath_content = self.content[
-                (self.container.header.names_offset + filename_offset) :
+            mip_sizes = [
+                get_mip_size(header.format, header.width >> mip, header.height >> mip)
+                for mip in range(tex_chunk.start_mip, tex_chunk.end_mip + 1)
             ]
-            filepath = PascalString(Int16ul, "utf8").parse(filepath_content)
-            filename_offset += len(filepath) + 2
+            if None in mip_sizes or sum(mip_sizes) != tex_chunk.unpacked_size:
+                raise ValueError(
+                    f"chunk {tex_chunk!r} does not match the expected mip sizes"
+                )
+            yield (tex_chunk, sum(mip_sizes[: max(first_mip - tex_chunk.start_mip, 0)]))
+
+    def _build_preview_headers(
+        self, file_container: Container, first_mip: int
+    ) -> Tuple[bytes, bytes]:
+        """Builds DDS and DX10 headers describing the mips from `first_mip` onwards.
+
+        Args:
+            file_container (Container): The DX10 file container to build headers for
+            first_mip (int): The index of the first mip level to keep
+
+        Returns:
+            Tuple[bytes, bytes]: A tuple of `DDS_HEADER` and `DX10_HEADER` (maybe None)
+        """
+
+        header = file_container.header
+        return self.dds_header_factory.build(
+            header.format,
+            max(header.width >> first_mip, 1),
+            max(header.height >> first_mip, 1),
+            header.mips_count - first_mip,
+        )
+
+    def write_dds_preview(
+        self,
+        file_container: Container,
+        first_mip: int,
+        stream: BinaryIO = None,
+        headers: Tuple[bytes, bytes] = None,
+    ) -> bytearray:
+        """Writes a DDS file containing only the mips from `first_mip` onwards.
+
+        Only the chunks covering those mips are sliced and decompressed.
 
-            (dds_header, dx10_header) = self._build_dds_headers(file_container)
-            if dds_header:
-                dds_content = b"DDS "
-                dds_content += dds_header
+        Args:
+            file_container (Container): The DX10 file container to write
+            first_mip (int): The index of the first mip level to keep
+            stream (BinaryIO, optional): Defaults to None. The stream to write to,
+                if None the DDS file is collected into a ``bytearray``
+            headers (Tuple[bytes, bytes], optional): Defaults to None.
+                Prebuilt ``(DDS_HEADER, DX10_HEADER)`` tuple for the preview
+
+        Returns:
+            bytearray: The DDS file if no `stream` was given, otherwise None
+        """
+
+        if headers is None:
+            headers = self._build_preview_headers(file_container, first_mip)
+        (dds_header, dx10_header) = headers
 
-                if dx10_header:
-                    dds_content += dx10_header
+        def iter_parts() -> Generator[bytes, None, None]:
+            yield b"DDS "
+            yield dds_header
+            if dx10_header:
+                yield dx10_header
 
-                for tex_chunk in file_container.chunks:
-                    if tex_chunk.packed_size > 0:
-                        dds_content += Compressed(GreedyBytes, "zlib").parse(
-                            self.content[
+            content_view = memoryview(self.content)
+            for (tex_chunk, skip) in self._iter_preview_chunks(
+                file_container, first_mip
+            ):
+                if tex_chunk.packed_size > 0:
+                    chunk_data = memoryview(
+                        zlib.decompress(
+                            content_view[
                                 tex_chunk.offset : (
                                     tex_chunk.offset + tex_chunk.packed_size
                                 )
                             ]
                         )
-                    else:
-                        dds_content += self.content[
-                            tex_chunk.offset : (
-                                tex_chunk.offset + tex_chunk.unpacked_size
-                            )
-                        ]
+                    )
+                    yield chunk_data[skip:]
+                else:
+                    yield content_view[
+                        (tex_chunk.offset + skip) : (
+                            tex_chunk.offset + tex_chunk.unpacked_size
+                        )
+                    ]
+
+        if stream is None:
+            dds_content = bytearray()
+            for part in iter_parts():
+                dds_content += part
+            return dds_content
 
-                yield ArchiveFile(filepath=PureWindowsPath(filepath), data=dds_content)
+        if hasattr(stream, "writelines"):
+            stream.writelines(iter_parts())
+        else:
+            for part in iter_parts():
+                stream.write(part)
+
+    def iter_previews(
+        self, mips_count: int = None, max_size: int = None
+    ) -> Generator[ArchiveFile, None, None]:
+        """Iterates over low resolution previews of the archived DX10 textures.
+
+        Each preview is a valid DDS file which only contains the smallest mips of the
+        texture, its header is rewritten to the dimensions and mip count of the first
+        kept mip.
+
+        Note:
+            Cubemaps and textures whose chunks cannot be split into mips (unknown
+            format or unexpected chunk sizes) are yielded in full.
+
+        Args:
+            mips_count (int, optional): Defaults to None. The number of smallest mips
+                to keep
+            max_size (int, optional): Defaults to None. The largest width or height
+                the previews may have
+
+        Raises:
+            ValueError: If the archive is not a DX10 archive
+
+        Yields:
+            :class:`.ArchiveFile`: A preview of a texture contained within the archive
+        """
 
-    def iter_files(self) -> Generator[ArchiveFile, None, None]:
+        if self.container.header.type != "DX10":
+            raise ValueError(
+                f"previews require a DX10 archive, {self.filepath!r} is "
+                f"{self.container.header.type!r}"
+            )
+
+        for (file_container, filepath) in zip(
+            self.container.files, self._iter_names()
+        ):
+            archive_file = self._get_dx10_file(file_container, filepath)
+            if archive_file is None:
+                continue
+
+            first_mip = self._get_preview_mip(file_container, mips_count, max_size)
+            if first_mip <= 0 or file_container.header._unknown_1 == 2049:
+                yield archive_file
+                continue
+
+            try:
+                preview_size = sum(
+                    (tex_chunk.unpacked_size - skip)
+                    for (tex_chunk, skip) in self._iter_preview_chunks(
+                        file_container, first_mip
+                    )
+                )
+            except ValueError:
+                yield archive_file
+                continue
+
+            (dds_header, dx10_header) = self._build_preview_headers(
+                file_container, first_mip
+            )
+            yield ArchiveFile(
+                filepath=archive_file.filepath,
+                writer=partial(
+                    self.write_dds_preview,
+                    file_container,
+                    first_mip,
+                    headers=(dds_header, dx10_header),
+                ),
+                size=(
+                    4
+                    + len(dds_header)
+                    + (len(dx10_header) if dx10_header else 0)
+                    + preview_size
+                ),
+            )
+
+    def extract_previews(
+        self,
+        to_dir: str,
+        mips_count: int = None,
+        max_size: int = None,
+        progress_hook: Callable[[int, int, str], None] = None,
+    ) -> ExtractionReport:
+        """Extracts low resolution previews of the archived DX10 textures.
+
+        Args:
+            to_dir (str): The directory to extract the previews to
+            mips_count (int, optional): Defaults to None. The number of smallest mips
+                to keep
+            max_size (int, optional): Defaults to None. The largest width or height
+                the previews may have
+            progress_hook (Callable[[int, int, str], None], optional): Defaults to None.
+                A progress hook that should expect (``current``, ``total``,
+                ``current_filepath``) as arguments
+
+        Returns:
+            ExtractionReport: The summary of the extraction
+
+        Example:
+            >>> FILEPATH = ""  # absolute path to a DX10 BTDX archive
+            >>> archive = bethesda_structs.archive.get_archive(FILEPATH)
+            >>> archive.extract_previews('/home/username/thumbnails', max_size=128)
+        """
+
+        return self._extract_files(
+            to_dir, self.iter_previews(mips_count, max_size), progress_hook
+        )
+
+    def _verify_file(
+        self, file_container: Container, filepath: str
+    ) -> List[VerificationIssue]:
+        """Verifies a single GNRL or DX10 file container.
+
+        Args:
+            file_container (Container): The file container to verify
+            filepath (str): The archived filepath of the file container
+
+        Returns:
+            List[VerificationIssue]: The found issues
+        """
+
+        issues = []
+        record = (
+            file_container.header
+            if self.container.header.type == "DX10"
+            else file_container
+        )
+        (name_hash, extension, directory_hash) = self._get_record_hashes(filepath)
+        if record.hash != name_hash or record.directory_hash != directory_hash:
+            issues.append(
+                VerificationIssue(
+                    "hash",
+                    filepath,
+                    (
+                        f"name hashes {record.hash:#010x}/"
+                        f"{record.directory_hash:#010x} do not match"
+                    ),
+                )
+            )
+        if record.ext.lower() != extension.decode("utf8"):
+            issues.append(
+                VerificationIssue(
+                    "hash", filepath, f"extension {record.ext!r} does not match"
+                )
+            )
+
+        if self.container.header.type == "DX10":
+            ranges = [
+                (
+                    tex_chunk.offset,
+                    (tex_chunk.packed_size or tex_chunk.unpacked_size),
+                )
+                for tex_chunk in file_container.chunks
+            ]
+        else:
+            ranges = [
+                (
+                    file_container.offset,
+                    (file_container.packed_size or file_container.unpacked_size),
+                )
+            ]
+        bounds_issues = [
+            issue
+            for (offset, size) in ranges
+            for issue in self._check_bounds(filepath, offset, size)
+        ]
+        if len(bounds_issues) > 0:
+            return issues + bounds_issues
+
+        segments = (
+            self._get_chunk_segments(file_container)
+            if self.container.header.type == "DX10"
+            else self._get_gnrl_segments(file_container)
+        )
+        for segment in segments:
+            issues.extend(self._check_segment(filepath, segment))
+        return issues
+
+    def _iter_verification_checks(
+        self
+    ) -> Generator[Callable[[], List[VerificationIssue]], None, None]:
+        """Iterates over the checks verifying each file container.
+
+        Yields:
+            Callable[[], List[VerificationIssue]]: A check of a single file container
+        """
+
+        names_issues = self._check_bounds(
+            None, self.container.header.names_offset, 0
+        )
+        if len(names_issues) > 0:
+            yield lambda: names_issues
+            return
+
+        try:
+            filepaths = list(self._iter_names())
+        except (struct.error, UnicodeDecodeError) as exc:
+            names_issues = [
+                VerificationIssue("header", None, f"names table is corrupt, {exc}")
+            ]
+            yield lambda: names_issues
+            return
+
+        for (file_container, filepath) in zip(self.container.files, filepaths):
+            yield partial(self._verify_file, file_container, filepath)
+
+    def iter_files(
+        self, include: T_PathPatterns = None, exclude: T_PathPatterns = None
+    ) -> Generator[ArchiveFile, None, None]:
         """Iterates over the parsed data and yields instances of `ArchiveFile`
 
+        Note:
+            Filters are evaluated against the names table, records of filtered out
+            files are never sliced (nor are DDS headers built for them).
+
+        Args:
+            include (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to include
+            exclude (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to exclude
+
         Raises:
             ValueError: If a filename cannot be determined for a specific file record
 
@@ -433,5 +961,316 @@ class BTDXArchive(BaseArchive):
         iter_method = {"GNRL": self._iter_gnrl_files, "DX10": self._iter_dx10_files}[
             self.container.header.type
         ]
-        for archive_file in iter_method():
+        for archive_file in iter_method(PathFilter.create(include, exclude)):
             yield archive_file
+
+    def iter_filepaths(
+        self, include: T_PathPatterns = None, exclude: T_PathPatterns = None
+    ) -> Generator[PureWindowsPath, None, None]:
+        """Iterates over the archived filepaths from the names table.
+
+        Note:
+            Textures of DX10 archives are listed even if their format is not
+            supported by :func:`~BTDXArchive.iter_files`.
+
+        Args:
+            include (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to include
+            exclude (T_PathPatterns, optional): Defaults to None. The glob (or
+                compiled regex) patterns of filepaths to exclude
+
+        Yields:
+            PureWindowsPath: An archived filepath
+        """
+
+        path_filter = PathFilter.create(include, exclude)
+        for filepath in self._iter_names():
+            if path_filter is None or path_filter.matches(filepath):
+                yield PureWindowsPath(filepath)
+
+    def _iter_stored_files(self) -> Generator[ArchiveFile, None, None]:
+        """Iterates over archive files for every archived file.
+
+        Note:
+            Textures of DX10 archives whose format is not supported are described by
+            their (inflated) texture chunks without a DDS header.
+
+        Yields:
+            ArchiveFile: An archive file
+        """
+
+        if self.container.header.type != "DX10":
+            yield from self.iter_files()
+            return
+
+        for (file_container, filepath) in self._iter_file_containers():
+            headers = self._build_dds_headers(file_container, warn=False)
+            if headers:
+                yield self._get_dx10_file(file_container, filepath, headers=headers)
+            else:
+                yield ArchiveFile(
+                    filepath=PureWindowsPath(filepath),
+                    segments=self._get_chunk_segments(file_container),
+                )
+
+    @classmethod
+    def hash_name(cls, name: str) -> int:
+        """Calculates the hash of a directory path or file stem as stored in records.
+
+        Note:
+            BTDX archives use a CRC32 without the initial and final inversion over
+            the lowercased, backslash separated name.
+
+        Args:
+            name (str): The directory path or file stem to hash
+
+        Returns:
+            int: The 32 bit hash of the name
+        """
+
+        return (
+            zlib.crc32(name.lower().replace("/", "\\").encode("utf8"), 0xFFFFFFFF)
+            ^ 0xFFFFFFFF
+        )
+
+    @classmethod
+    def _get_record_hashes(cls, archived_path: str) -> Tuple[int, bytes, int]:
+        """Gets the name hash, extension and directory hash of an archived filepath.
+
+        Args:
+            archived_path (str): The archived filepath
+
+        Returns:
+            Tuple[int, bytes, int]: A tuple of (name hash, extension, directory hash)
+        """
+
+        archived_path = PureWindowsPath(archived_path)
+        return (
+            cls.hash_name(archived_path.stem),
+            archived_path.suffix.lower()[1:5].encode("utf8"),
+            cls.hash_name(str(archived_path.parent)),
+        )
+
+    @classmethod
+    def _split_mip_chunks(cls, content: bytes) -> Tuple[DDSInfo, List[tuple]]:
+        """Splits the content of a DDS file into the mip chunks of a DX10 record.
+
+        Note:
+            Mips of at least :attr:`~BTDXArchive.DX10_CHUNK_SIZE` bytes are stored in
+            their own chunk, the remaining smaller mips share the last chunk.
+            Cubemaps and textures whose data does not match the expected mip sizes are
+            stored as a single chunk.
+
+        Args:
+            content (bytes): The content of the DDS file
+
+        Raises:
+            ValueError: If the content is not a supported DDS file
+
+        Returns:
+            Tuple[DDSInfo, List[tuple]]: A tuple of the texture description and a list
+                of (start mip, end mip, chunk data) tuples
+        """
+
+        dds_info = read_dds_info(content)
+        data = memoryview(content)[dds_info.data_offset :]
+        mip_sizes = [
+            get_mip_size(
+                dds_info.dxgi_format, dds_info.width >> mip, dds_info.height >> mip
+            )
+            for mip in range(dds_info.mips_count)
+        ]
+        if dds_info.cubemap or None in mip_sizes or sum(mip_sizes) != len(data):
+            return (dds_info, [(0, dds_info.mips_count - 1, data)])
+
+        chunks = []
+        (start_mip, offset) = (0, 0)
+        for (mip, mip_size) in enumerate(mip_sizes):
+            if mip_size < cls.DX10_CHUNK_SIZE:
+                break
+            chunks.append((mip, mip, data[offset : (offset + mip_size)]))
+            (start_mip, offset) = (mip + 1, offset + mip_size)
+        if start_mip < dds_info.mips_count:
+            chunks.append((start_mip, dds_info.mips_count - 1, data[offset:]))
+        return (dds_info, chunks)
+
+    @classmethod
+    def pack(
+        cls,
+        to_file: str,
+        files: Union[str, os.PathLike, Mapping[str, T_PackSource]],
+        archive_type: str = "GNRL",
+        compress: bool = True,
+        max_workers: int = None,
+    ):
+        """Packs files into a new BTDX archive.
+
+        Files are read, split into mip chunks (for ``DX10`` archives) and compressed
+        in parallel while the data section is written in order.
+        Once all data is written the names table is appended and the header and
+        records are written in front of the data.
+        Files (or chunks) which do not shrink when compressed are stored uncompressed.
+
+        Args:
+            to_file (str): The path of the archive to create
+            files (Union[str, os.PathLike, Mapping[str, T_PackSource]]): Either a
+                directory of loose files or a mapping of archived filepaths to either
+                their content or the path of the file to read the content from
+            archive_type (str, optional): Defaults to "GNRL". The type of the archive
+                (``GNRL`` or ``DX10``)
+            compress (bool, optional): Defaults to True. Compresses the files
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to read and compress files
+
+        Raises:
+            ValueError: If the given archive type cannot be written or a file
+                cannot be packed into a ``DX10`` archive
+
+        Example:
+            >>> bethesda_structs.archive.BTDXArchive.pack(
+            ...     "/home/username/Downloads/packed - Textures.ba2",
+            ...     "/home/username/Downloads/extracted",
+            ...     archive_type="DX10",
+            ... )
+        """
+
+        if archive_type not in ("GNRL", "DX10"):
+            raise ValueError(
+                f"cannot write BTDX type {archive_type!r}, expects 'GNRL' or 'DX10'"
+            )
+
+        file_entries = collect_pack_sources(files)
+
+        def compress_data(data: bytes) -> Tuple[bytes, int]:
+            if compress and len(data) > 0:
+                compressed = zlib.compress(data)
+                if len(compressed) < len(data):
+                    return (compressed, len(compressed))
+            return (bytes(data), 0)
+
+        def pack_file(source: T_PackSource) -> Tuple[Any, List[tuple]]:
+            content = read_pack_source(source)
+            if archive_type == "GNRL":
+                return (None, [(0, 0, content)])
+            return cls._split_mip_chunks(content)
+
+        def pack_chunks(source: T_PackSource) -> Tuple[Any, List[tuple]]:
+            (dds_info, chunks) = pack_file(source)
+            return (
+                dds_info,
+                [
+                    (start_mip, end_mip, len(data), *compress_data(data))
+                    for (start_mip, end_mip, data) in chunks
+                ],
+            )
+
+        with open(to_file, "wb") as stream:
+            # NOTE: GNRL records are fixed size, so data can follow them immediately,
+            # DX10 record sizes depend on their chunk counts so data is spooled to a
+            # temporary file until all files are packed
+            stream.seek(24 + (36 * len(file_entries)))
+
+            records = []
+            data_stream = tempfile.TemporaryFile() if archive_type == "DX10" else stream
+            for ((archived_path, _), (dds_info, chunks)) in zip(
+                file_entries,
+                parallel_map(
+                    pack_chunks, (source for (_, source) in file_entries), max_workers
+                ),
+            ):
+                chunk_records = []
+                for (start_mip, end_mip, unpacked_size, data, packed_size) in chunks:
+                    chunk_records.append(
+                        (
+                            data_stream.tell(),
+                            packed_size,
+                            unpacked_size,
+                            start_mip,
+                            end_mip,
+                        )
+                    )
+                    data_stream.write(data)
+                records.append((archived_path, dds_info, chunk_records))
+
+            if archive_type == "DX10":
+                data_offset = 24 + sum(
+                    (24 + (24 * len(chunk_records)))
+                    for (_, _, chunk_records) in records
+                )
+                stream.seek(data_offset)
+                data_stream.seek(0)
+                shutil.copyfileobj(data_stream, stream)
+                data_stream.close()
+            else:
+                data_offset = 0
+
+            names_offset = stream.tell()
+            stream.writelines(
+                struct.pack("<H", len(encoded)) + encoded
+                for encoded in (
+                    archived_path.encode("utf8") for (archived_path, _, _) in records
+                )
+            )
+
+            stream.seek(0)
+            stream.write(
+                b"BTDX"
+                + struct.pack(
+                    "<I4sIQ",
+                    1,
+                    archive_type.encode("utf8"),
+                    len(records),
+                    names_offset,
+                )
+            )
+            for (archived_path, dds_info, chunk_records) in records:
+                (name_hash, extension, directory_hash) = cls._get_record_hashes(
+                    archived_path
+                )
+                if archive_type == "GNRL":
+                    ((offset, packed_size, unpacked_size, _, _),) = chunk_records
+                    stream.write(
+                        struct.pack(
+                            "<I4sIIQIII",
+                            name_hash,
+                            extension,
+                            directory_hash,
+                            0x00100100,
+                            offset,
+                            packed_size,
+                            unpacked_size,
+                            0xBAADF00D,
+                        )
+                    )
+                    continue
+
+                stream.write(
+                    struct.pack(
+                        "<I4sIBBHHHBBH",
+                        name_hash,
+                        extension,
+                        directory_hash,
+                        0,
+                        len(chunk_records),
+                        24,
+                        dds_info.height,
+                        dds_info.width,
+                        dds_info.mips_count,
+                        dds_info.dxgi_format,
+                        (2049 if dds_info.cubemap else 2048),
+                    )
+                )
+                for (offset, packed_size, unpacked_size, start_mip, end_mip) in (
+                    chunk_records
+                ):
+                    stream.write(
+                        struct.pack(
+                            "<QIIHHI",
+                            data_offset + offset,
+                            packed_size,
+                            unpacked_size,
+                            start_mip,
+                            end_mip,
+                            0xBAADF00D,
+                        )
+                    )
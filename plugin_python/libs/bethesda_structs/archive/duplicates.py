@@ -0,0 +1,297 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import os
+import time
+from typing import Dict, List, Tuple, Iterable, Generator, NamedTuple
+
+import attr
+
+from .._common import parallel_map
+from ._common import HashingWriter, hash_filepath
+
+
+class AssetSource(NamedTuple):
+    """The location of an asset within an archive or loose file directory.
+    """
+
+    provider: str
+    asset_path: str
+
+
+@attr.s
+class DuplicateGroup(object):
+    """A group of assets with identical content.
+    """
+
+    digest = attr.ib(type=str)
+    """The hex digest of the shared content.
+
+    Returns:
+        str: The hex digest of the shared content
+    """
+
+    size = attr.ib(type=int)
+    """The size of the shared content.
+
+    Returns:
+        int: The size of the shared content
+    """
+
+    sources = attr.ib(type=List[AssetSource], default=attr.Factory(list))
+    """The locations of the assets sharing the content.
+
+    Returns:
+        List[AssetSource]: The locations of the assets sharing the content
+    """
+
+    @property
+    def wasted_bytes(self) -> int:
+        """The number of bytes taken by all but one copy of the content.
+
+        Returns:
+            int: The number of redundant bytes
+        """
+
+        return self.size * (len(self.sources) - 1)
+
+
+@attr.s
+class DuplicateReport(object):
+    """The summary of a duplicate content scan.
+    """
+
+    groups = attr.ib(type=List[DuplicateGroup], default=attr.Factory(list))
+    """The groups of assets with identical content (largest waste first).
+
+    Returns:
+        List[DuplicateGroup]: The groups of assets with identical content
+    """
+
+    files_scanned = attr.ib(type=int, default=0)
+    """The number of assets whose sizes were compared.
+
+    Returns:
+        int: The number of assets whose sizes were compared
+    """
+
+    files_hashed = attr.ib(type=int, default=0)
+    """The number of assets whose content had to be hashed.
+
+    Returns:
+        int: The number of assets whose content had to be hashed
+    """
+
+    bytes_hashed = attr.ib(type=int, default=0)
+    """The number of (decompressed) bytes hashed.
+
+    Returns:
+        int: The number of bytes hashed
+    """
+
+    elapsed = attr.ib(type=float, default=0.0)
+    """The number of seconds the scan took.
+
+    Returns:
+        float: The number of seconds the scan took
+    """
+
+    @property
+    def wasted_bytes(self) -> int:
+        """The number of bytes taken by redundant copies across all groups.
+
+        Returns:
+            int: The number of redundant bytes
+        """
+
+        return sum(group.wasted_bytes for group in self.groups)
+
+
+def _iter_loose_files(path: str) -> Generator[Tuple[str, str, int], None, None]:
+    """Iterates over all files within a loose file directory.
+
+    Args:
+        path (str): The directory to iterate over
+
+    Yields:
+        Tuple[str, str, int]: A tuple of (relative asset path, filepath, size)
+    """
+
+    pending = [(path, "")]
+    while len(pending) > 0:
+        (directory, prefix) = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append((entry.path, prefix + entry.name + "/"))
+                elif entry.is_file():
+                    yield (prefix + entry.name, entry.path, entry.stat().st_size)
+
+
+def _list_sizes(provider: str) -> List[Tuple[str, int]]:
+    """Lists the sizes of all assets of an archive or loose file directory.
+
+    Note:
+        Archived sizes are taken from the archive's records, nothing is decompressed.
+        DX10 textures whose format is not supported are sized (and hashed) by their
+        texture chunks alone (see :func:`~.btdx.BTDXArchive._iter_stored_files`).
+
+    Args:
+        provider (str): The path of the archive or loose file directory
+
+    Raises:
+        ValueError: If the given file is not a supported archive
+
+    Returns:
+        List[Tuple[str, int]]: A list of (asset path, size) tuples
+    """
+
+    if os.path.isdir(provider):
+        return [
+            (asset_path, size) for (asset_path, _, size) in _iter_loose_files(provider)
+        ]
+
+    # NOTE: imported here to avoid a circular import of the archive package
+    from . import get_archive
+
+    archive = get_archive(provider)
+    if archive is None:
+        raise ValueError(f"no archive can handle {provider!r}")
+    with archive:
+        return [
+            (archive_file.filepath.as_posix(), archive_file.size)
+            for archive_file in archive._iter_stored_files()
+        ]
+
+
+def _hash_assets(
+    provider: str, asset_paths: Iterable[str], algorithm: str
+) -> List[Tuple[str, str, int]]:
+    """Hashes the content of the given assets of an archive or loose file directory.
+
+    Note:
+        Archived content is inflated block by block into the hash, archived files are
+        never fully held in memory.
+
+    Args:
+        provider (str): The path of the archive or loose file directory
+        asset_paths (Iterable[str]): The asset paths to hash
+        algorithm (str): The name of the :mod:`hashlib` algorithm to use
+
+    Returns:
+        List[Tuple[str, str, int]]: A list of (asset path, hex digest, hashed size)
+            tuples
+    """
+
+    asset_paths = set(asset_paths)
+    results = []
+    if os.path.isdir(provider):
+        for (asset_path, filepath, size) in _iter_loose_files(provider):
+            if asset_path not in asset_paths:
+                continue
+            results.append((asset_path, hash_filepath(filepath, algorithm), size))
+        return results
+
+    from . import get_archive
+
+    with get_archive(provider) as archive:
+        for archive_file in archive._iter_stored_files():
+            asset_path = archive_file.filepath.as_posix()
+            if asset_path not in asset_paths:
+                continue
+            writer = HashingWriter(algorithm)
+            archive_file.write_to(writer)
+            results.append((asset_path, writer.hexdigest(), writer.written))
+    return results
+
+
+def find_duplicates(
+    providers: Iterable[str],
+    algorithm: str = "sha1",
+    min_size: int = 1,
+    max_workers: int = None,
+) -> DuplicateReport:
+    """Finds assets with identical content within and across archives and loose files.
+
+    Assets are first grouped by their recorded sizes, only assets sharing a size with
+    another asset are hashed.
+    Both listing and hashing run in parallel across providers.
+
+    Args:
+        providers (Iterable[str]): The paths of the archives and loose file
+            directories to scan
+        algorithm (str, optional): Defaults to "sha1". The name of the
+            :mod:`hashlib` algorithm used to compare content
+        min_size (int, optional): Defaults to 1. The minimum size of assets to compare
+        max_workers (int, optional): Defaults to None. The number of threads used to
+            scan providers
+
+    Raises:
+        ValueError: If a given file is not a supported archive
+
+    Returns:
+        DuplicateReport: The summary of the scan
+
+    Example:
+        >>> report = bethesda_structs.archive.find_duplicates(
+        ...     [
+        ...         "/home/username/Fallout 4/Data/MyMod - Textures.ba2",
+        ...         "/home/username/Fallout 4/Data/OtherMod - Textures.ba2",
+        ...     ]
+        ... )
+        >>> report.wasted_bytes
+        104857600
+    """
+
+    started = time.perf_counter()
+    providers = [os.fspath(provider) for provider in providers]
+
+    sized_sources: Dict[int, List[AssetSource]] = {}
+    files_scanned = 0
+    for (provider, sizes) in zip(
+        providers, parallel_map(_list_sizes, providers, max_workers)
+    ):
+        for (asset_path, size) in sizes:
+            files_scanned += 1
+            if size >= min_size:
+                sized_sources.setdefault(size, []).append(
+                    AssetSource(provider, asset_path)
+                )
+
+    candidates: Dict[str, List[str]] = {}
+    for sources in sized_sources.values():
+        if len(sources) > 1:
+            for source in sources:
+                candidates.setdefault(source.provider, []).append(source.asset_path)
+
+    hashed_providers = [provider for provider in providers if provider in candidates]
+    grouped_sources: Dict[Tuple[str, int], List[AssetSource]] = {}
+    (files_hashed, bytes_hashed) = (0, 0)
+    for (provider, results) in zip(
+        hashed_providers,
+        parallel_map(
+            lambda provider: _hash_assets(provider, candidates[provider], algorithm),
+            hashed_providers,
+            max_workers,
+        ),
+    ):
+        for (asset_path, digest, size) in results:
+            files_hashed += 1
+            bytes_hashed += size
+            grouped_sources.setdefault((digest, size), []).append(
+                AssetSource(provider, asset_path)
+            )
+
+    groups = [
+        DuplicateGroup(digest, size, sources)
+        for ((digest, size), sources) in grouped_sources.items()
+        if len(sources) > 1
+    ]
+    groups.sort(key=lambda group: group.wasted_bytes, reverse=True)
+    return DuplicateReport(
+        groups=groups,
+        files_scanned=files_scanned,
+        files_hashed=files_hashed,
+        bytes_hashed=bytes_hashed,
+        elapsed=(time.perf_counter() - started),
+    )
@@ -0,0 +1,433 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import os
+import json
+import bisect
+from typing import Dict, List, Tuple, Iterable, Optional, Generator
+from pathlib import Path
+
+import attr
+
+from .._common import parallel_map
+
+INDEX_VERSION = 1
+"""The version of persisted asset indexes, indexes of other versions are rebuilt.
+"""
+
+
+def normalize_asset_path(asset_path: str) -> str:
+    """Normalizes an asset path for lookups in an :class:`AssetIndex`.
+
+    Args:
+        asset_path (str): The relative path of the asset (either separator)
+
+    Returns:
+        str: The lowercased, forward slash separated asset path
+    """
+
+    return asset_path.replace("\\", "/").lower().strip("/")
+
+
+@attr.s
+class AssetProvider(object):
+    """An archive or loose file directory which provides assets.
+    """
+
+    path = attr.ib(type=str)
+    """The path of the archive or loose file directory.
+
+    Returns:
+        str: The path of the archive or loose file directory
+    """
+
+    is_archive = attr.ib(type=bool)
+    """True if the provider is an archive, False if it is a loose file directory.
+
+    Returns:
+        bool: True if the provider is an archive
+    """
+
+    size = attr.ib(type=int, default=0)
+    """The size of the archive when its assets were listed.
+
+    Returns:
+        int: The size of the archive (0 for loose file directories)
+    """
+
+    mtime = attr.ib(type=float, default=0.0)
+    """The modification time of the archive when its assets were listed.
+
+    Returns:
+        float: The modification time of the archive (0 for loose file directories)
+    """
+
+    assets = attr.ib(type=List[str], default=attr.Factory(list), repr=False)
+    """The normalized paths of the provided assets.
+
+    Returns:
+        List[str]: The normalized paths of the provided assets
+    """
+
+    @classmethod
+    def from_path(cls, path: str) -> "AssetProvider":
+        """Lists the assets of an archive or loose file directory.
+
+        Args:
+            path (str): The path of the archive or loose file directory
+
+        Raises:
+            FileNotFoundError: If the given path does not exist
+            ValueError: If the given file is not a supported archive
+
+        Returns:
+            AssetProvider: The provider of the listed assets
+        """
+
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            return cls(path, False, assets=cls._list_directory(path))
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"no such file or directory {path!r} exists")
+
+        # NOTE: imported here to avoid a circular import of the archive package
+        from . import get_archive
+
+        archive = get_archive(path)
+        if archive is None:
+            raise ValueError(f"no archive can handle {path!r}")
+
+        stat = os.stat(path)
+        with archive:
+            assets = [
+                normalize_asset_path(filepath.as_posix())
+                for filepath in archive.iter_filepaths()
+            ]
+        return cls(path, True, size=stat.st_size, mtime=stat.st_mtime, assets=assets)
+
+    @staticmethod
+    def _list_directory(path: str) -> List[str]:
+        """Lists the normalized paths of all files within a directory.
+
+        Args:
+            path (str): The directory to list
+
+        Returns:
+            List[str]: The normalized relative paths of the files in the directory
+        """
+
+        assets = []
+        pending = [(path, "")]
+        while len(pending) > 0:
+            (directory, prefix) = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative_path = prefix + entry.name.lower()
+                    if entry.is_dir():
+                        pending.append((entry.path, relative_path + "/"))
+                    elif entry.is_file():
+                        assets.append(relative_path)
+        return assets
+
+    def is_current(self) -> bool:
+        """Determines if the listed assets are still current.
+
+        Note:
+            Archives are considered current while their size and modification time
+            are unchanged.
+            Loose file directories are never considered current as changes to nested
+            files are not reflected by any single modification time.
+
+        Returns:
+            bool: True if the listed assets are still current
+        """
+
+        if not self.is_archive:
+            return False
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    def to_dict(self) -> dict:
+        """Serializes the provider for persisting.
+
+        Returns:
+            dict: The serialized provider
+        """
+
+        return attr.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AssetProvider":
+        """Deserializes a persisted provider.
+
+        Args:
+            data (dict): The serialized provider
+
+        Returns:
+            AssetProvider: The deserialized provider
+        """
+
+        return cls(**data)
+
+
+@attr.s
+class AssetIndex(object):
+    """A load order wide index of which archives and loose files provide each asset.
+
+    Providers are given in ascending priority (the order of the load order), so the
+    last provider of an asset is the one the game uses.
+    Only archives whose size or modification time changed are listed again on
+    :func:`~AssetIndex.update`, and lookups are single dictionary lookups.
+
+    Example:
+        >>> index = bethesda_structs.archive.AssetIndex.build(
+        ...     [
+        ...         "/home/username/Fallout 4/Data/Fallout4 - Textures1.ba2",
+        ...         "/home/username/Fallout 4/Data/MyMod - Textures.ba2",
+        ...         "/home/username/Fallout 4/Data",
+        ...     ],
+        ...     cache_path="/home/username/.cache/asset_index.json",
+        ... )
+        >>> index.get_winner("textures/x.dds")
+        '/home/username/Fallout 4/Data/MyMod - Textures.ba2'
+    """
+
+    providers = attr.ib(type=List[AssetProvider], default=attr.Factory(list))
+    """The asset providers in ascending priority.
+
+    Returns:
+        List[AssetProvider]: The asset providers in ascending priority
+    """
+
+    _index = attr.ib(
+        type=Dict[str, List[int]], default=attr.Factory(dict), init=False, repr=False
+    )
+
+    def __attrs_post_init__(self):
+        """Initializes the non-init attributes.
+        """
+
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Rebuilds the asset path to provider indexes mapping.
+        """
+
+        self._index = {}
+        for (provider_index, provider) in enumerate(self.providers):
+            for asset_path in provider.assets:
+                self._index.setdefault(asset_path, []).append(provider_index)
+
+    def _remove_assets(self, provider_index: int):
+        """Removes the assets of a provider from the index.
+
+        Args:
+            provider_index (int): The index of the provider
+        """
+
+        for asset_path in self.providers[provider_index].assets:
+            provider_indexes = self._index.get(asset_path)
+            if provider_indexes is None:
+                continue
+            provider_indexes.remove(provider_index)
+            if len(provider_indexes) <= 0:
+                del self._index[asset_path]
+
+    def _add_assets(self, provider_index: int):
+        """Adds the assets of a provider to the index.
+
+        Args:
+            provider_index (int): The index of the provider
+        """
+
+        for asset_path in self.providers[provider_index].assets:
+            bisect.insort(self._index.setdefault(asset_path, []), provider_index)
+
+    @classmethod
+    def build(
+        cls, paths: Iterable[str], cache_path: str = None, max_workers: int = None
+    ) -> "AssetIndex":
+        """Builds an index for the given archives and loose file directories.
+
+        Args:
+            paths (Iterable[str]): The archives and loose file directories in
+                ascending priority
+            cache_path (str, optional): Defaults to None. The path of a persisted
+                index to reuse the listings of unchanged archives from (and to save
+                the built index to)
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to list archives and directories
+
+        Returns:
+            AssetIndex: The built index
+        """
+
+        index = cls()
+        if cache_path is not None and os.path.isfile(cache_path):
+            index = cls.load(cache_path)
+        index.update(paths, max_workers=max_workers)
+        if cache_path is not None:
+            index.save(cache_path)
+        return index
+
+    def update(
+        self, paths: Iterable[str] = None, max_workers: int = None
+    ) -> List[str]:
+        """Updates the index for the given (or current) providers.
+
+        Note:
+            Unchanged archives keep their listings.
+            If the order of providers is unchanged only the assets of changed
+            providers are replaced in the index, otherwise the index is rebuilt from
+            the listings.
+
+        Args:
+            paths (Iterable[str], optional): Defaults to None. The archives and loose
+                file directories in ascending priority, defaults to the current
+                providers
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to list archives and directories
+
+        Raises:
+            FileNotFoundError: If a given provider does not exist
+            ValueError: If a given file is not a supported archive
+
+        Returns:
+            List[str]: The paths of the providers which were listed again
+        """
+
+        paths = (
+            [provider.path for provider in self.providers]
+            if paths is None
+            else [os.fspath(path) for path in paths]
+        )
+        current = {provider.path: provider for provider in self.providers}
+        stale = [
+            path
+            for path in paths
+            if path not in current or not current[path].is_current()
+        ]
+        listed = dict(
+            zip(stale, parallel_map(AssetProvider.from_path, stale, max_workers))
+        )
+
+        if paths == [provider.path for provider in self.providers]:
+            for (provider_index, path) in enumerate(paths):
+                if path in listed:
+                    self._remove_assets(provider_index)
+                    self.providers[provider_index] = listed[path]
+                    self._add_assets(provider_index)
+        else:
+            self.providers = [listed.get(path, current.get(path)) for path in paths]
+            self._rebuild_index()
+
+        return stale
+
+    def get_providers(self, asset_path: str) -> List[str]:
+        """Gets the providers of an asset.
+
+        Args:
+            asset_path (str): The relative path of the asset
+
+        Returns:
+            List[str]: The paths of the providers of the asset, the winning provider
+                first
+        """
+
+        return [
+            self.providers[provider_index].path
+            for provider_index in reversed(
+                self._index.get(normalize_asset_path(asset_path), ())
+            )
+        ]
+
+    def get_winner(self, asset_path: str) -> Optional[str]:
+        """Gets the provider whose version of an asset is used.
+
+        Args:
+            asset_path (str): The relative path of the asset
+
+        Returns:
+            Optional[str]: The path of the winning provider, or None if no provider
+                provides the asset
+        """
+
+        provider_indexes = self._index.get(normalize_asset_path(asset_path))
+        if not provider_indexes:
+            return None
+        return self.providers[provider_indexes[-1]].path
+
+    def iter_conflicts(self) -> Generator[Tuple[str, List[str]], None, None]:
+        """Iterates over assets provided by more than one provider.
+
+        Yields:
+            Tuple[str, List[str]]: A tuple of (asset path, provider paths with the
+                winning provider first)
+        """
+
+        for (asset_path, provider_indexes) in self._index.items():
+            if len(provider_indexes) > 1:
+                yield (
+                    asset_path,
+                    [
+                        self.providers[provider_index].path
+                        for provider_index in reversed(provider_indexes)
+                    ],
+                )
+
+    def __contains__(self, asset_path: str) -> bool:
+        return normalize_asset_path(asset_path) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def save(self, filepath: str):
+        """Persists the index as JSON.
+
+        Args:
+            filepath (str): The path of the file to persist the index to
+        """
+
+        filepath = Path(filepath)
+        temp_filepath = filepath.with_name(filepath.name + ".tmp")
+        with temp_filepath.open("w", encoding="utf8") as stream:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "providers": [provider.to_dict() for provider in self.providers],
+                },
+                stream,
+            )
+        os.replace(temp_filepath, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "AssetIndex":
+        """Loads a persisted index.
+
+        Note:
+            Indexes persisted by a different version (or which cannot be read) are
+            loaded as empty indexes.
+
+        Args:
+            filepath (str): The path of the persisted index
+
+        Returns:
+            AssetIndex: The loaded index
+        """
+
+        try:
+            with open(filepath, "r", encoding="utf8") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return cls()
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(
+            providers=[
+                AssetProvider.from_dict(provider) for provider in data["providers"]
+            ]
+        )
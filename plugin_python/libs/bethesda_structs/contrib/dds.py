@@ -1,7 +1,10 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://choosealicense.com/licenses/mit/>
 
+import struct
+import threading
 from enum import IntEnum
+from typing import Dict, Tuple, NamedTuple
 
 from construct import Enum, Array, Const, Struct, Default, Int32ul, FlagsEnum
 
@@ -300,3 +303,403 @@ DDS_HEADER_DX10 = Struct(
 **Reference**:
     `Microsoft <https://goo.gl/1RM6MV>`__
 """
+
+
+DDS_HEADER_PACKER = struct.Struct("<7I44x13I")
+"""Precompiled packing of the ``DDS_HEADER`` structure.
+
+Packs the same 124 bytes as :data:`DDS_HEADER` from the values
+(``dwSize``, ``dwFlags``, ``dwHeight``, ``dwWidth``, ``dwPitchOrLinearSize``,
+``dwDepth``, ``dwMipMapCount``, ``ddspf`` (8 values), ``dwCaps``, ``dwCaps2``,
+``dwCaps3``, ``dwCaps4``, ``dwReserved2``).
+"""
+
+DDS_HEADER_DX10_PACKER = struct.Struct("<5I")
+"""Precompiled packing of the ``DDS_HEADER_DX10`` structure.
+"""
+
+# DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT | DDSD_MIPMAPCOUNT |
+# DDSD_LINEARSIZE
+DDSD_TEXTURE_FLAGS = 0x000A1007
+# DDSCAPS_COMPLEX | DDSCAPS_TEXTURE | DDSCAPS_MIPMAP
+DDSCAPS_TEXTURE_FLAGS = 0x00401008
+# DDSCAPS2_CUBEMAP and all six DDSCAPS2_CUBEMAP_(POSITIVE|NEGATIVE)(X|Y|Z) faces
+DDSCAPS2_CUBEMAP_FLAGS = 0x0000FE00
+
+
+class DDSPixelFormat(NamedTuple):
+    """The ``DDS_PIXELFORMAT`` and linear size description of a DXGI format.
+    """
+
+    flags: int
+    fourcc: int = 0
+    rgb_bit_count: int = 0
+    r_bit_mask: int = 0
+    g_bit_mask: int = 0
+    b_bit_mask: int = 0
+    a_bit_mask: int = 0
+    linear_size_factor: float = 1
+    dx10: bool = False
+
+
+DDS_PIXEL_FORMATS: Dict[int, DDSPixelFormat] = {
+    DXGIFormats.DXGI_FORMAT_BC1_UNORM: DDSPixelFormat(
+        0x4, MAKEFOURCC("D", "X", "T", "1"), linear_size_factor=0.5
+    ),
+    DXGIFormats.DXGI_FORMAT_BC2_UNORM: DDSPixelFormat(
+        0x4, MAKEFOURCC("D", "X", "T", "3")
+    ),
+    DXGIFormats.DXGI_FORMAT_BC3_UNORM: DDSPixelFormat(
+        0x4, MAKEFOURCC("D", "X", "T", "5")
+    ),
+    DXGIFormats.DXGI_FORMAT_BC5_UNORM: DDSPixelFormat(
+        0x4, MAKEFOURCC("A", "T", "I", "2")
+    ),
+    # FIXME: There may be a header differnce between BC7_UNORM and
+    # BC7_UNORM_SRGB, but I haven't noticed any
+    DXGIFormats.DXGI_FORMAT_BC7_UNORM: DDSPixelFormat(
+        0x4, MAKEFOURCC("D", "X", "1", "0"), dx10=True
+    ),
+    DXGIFormats.DXGI_FORMAT_BC7_UNORM_SRGB: DDSPixelFormat(
+        0x4, MAKEFOURCC("D", "X", "1", "0"), dx10=True
+    ),
+    DXGIFormats.DXGI_FORMAT_B8G8R8A8_UNORM: DDSPixelFormat(
+        0x2 | 0x40,
+        rgb_bit_count=32,
+        r_bit_mask=0x00FF0000,
+        g_bit_mask=0x0000FF00,
+        b_bit_mask=0x000000FF,
+        a_bit_mask=0xFF000000,
+        linear_size_factor=4,
+    ),
+    DXGIFormats.DXGI_FORMAT_R8_UNORM: DDSPixelFormat(
+        0x40, rgb_bit_count=8, r_bit_mask=0x000000FF
+    ),
+}
+"""The pixel formats of the DXGI formats DDS headers can be built for.
+"""
+
+
+DXGI_BLOCK_SIZES: Dict[int, int] = {
+    **{
+        dxgi_format: 8
+        for dxgi_format in (
+            DXGIFormats.DXGI_FORMAT_BC1_TYPELESS,
+            DXGIFormats.DXGI_FORMAT_BC1_UNORM,
+            DXGIFormats.DXGI_FORMAT_BC1_UNORM_SRGB,
+            DXGIFormats.DXGI_FORMAT_BC4_TYPELESS,
+            DXGIFormats.DXGI_FORMAT_BC4_UNORM,
+            DXGIFormats.DXGI_FORMAT_BC4_SNORM,
+        )
+    },
+    **{
+        dxgi_format: 16
+        for dxgi_format in (
+            DXGIFormats.DXGI_FORMAT_BC2_TYPELESS,
+            DXGIFormats.DXGI_FORMAT_BC2_UNORM,
+            DXGIFormats.DXGI_FORMAT_BC2_UNORM_SRGB,
+            DXGIFormats.DXGI_FORMAT_BC3_TYPELESS,
+            DXGIFormats.DXGI_FORMAT_BC3_UNORM,
+            DXGIFormats.DXGI_FORMAT_BC3_UNORM_SRGB,
+            DXGIFormats.DXGI_FORMAT_BC5_TYPELESS,
+            DXGIFormats.DXGI_FORMAT_BC5_UNORM,
+            DXGIFormats.DXGI_FORMAT_BC5_SNORM,
+            DXGIFormats.DXGI_FORMAT_BC6H_TYPELESS,
+            DXGIFormats.DXGI_FORMAT_BC6H_UF16,
+            DXGIFormats.DXGI_FORMAT_BC6H_SF16,
+            DXGIFormats.DXGI_FORMAT_BC7_TYPELESS,
+            DXGIFormats.DXGI_FORMAT_BC7_UNORM,
+            DXGIFormats.DXGI_FORMAT_BC7_UNORM_SRGB,
+        )
+    },
+}
+"""The number of bytes per 4x4 block of block compressed DXGI formats.
+"""
+
+DXGI_PIXEL_SIZES: Dict[int, int] = {
+    DXGIFormats.DXGI_FORMAT_R8G8B8A8_UNORM: 4,
+    DXGIFormats.DXGI_FORMAT_R8G8B8A8_UNORM_SRGB: 4,
+    DXGIFormats.DXGI_FORMAT_B8G8R8A8_UNORM: 4,
+    DXGIFormats.DXGI_FORMAT_B8G8R8A8_UNORM_SRGB: 4,
+    DXGIFormats.DXGI_FORMAT_B8G8R8X8_UNORM: 4,
+    DXGIFormats.DXGI_FORMAT_R8G8_UNORM: 2,
+    DXGIFormats.DXGI_FORMAT_R8_UNORM: 1,
+    DXGIFormats.DXGI_FORMAT_A8_UNORM: 1,
+}
+"""The number of bytes per pixel of uncompressed DXGI formats.
+"""
+
+
+def get_mip_size(dxgi_format: int, width: int, height: int) -> int:
+    """Calculates the number of bytes of a single mip level.
+
+    Args:
+        dxgi_format (int): The DXGI format of the texture
+        width (int): The width of the mip level
+        height (int): The height of the mip level
+
+    Returns:
+        int: The number of bytes of the mip level, or None if the format is unknown
+    """
+
+    (width, height) = (max(1, width), max(1, height))
+    if dxgi_format in DXGI_BLOCK_SIZES:
+        return (
+            max(1, (width + 3) // 4)
+            * max(1, (height + 3) // 4)
+            * DXGI_BLOCK_SIZES[dxgi_format]
+        )
+    elif dxgi_format in DXGI_PIXEL_SIZES:
+        return width * height * DXGI_PIXEL_SIZES[dxgi_format]
+
+
+FOURCC_FORMATS: Dict[int, int] = {
+    MAKEFOURCC("D", "X", "T", "1"): DXGIFormats.DXGI_FORMAT_BC1_UNORM,
+    MAKEFOURCC("D", "X", "T", "3"): DXGIFormats.DXGI_FORMAT_BC2_UNORM,
+    MAKEFOURCC("D", "X", "T", "5"): DXGIFormats.DXGI_FORMAT_BC3_UNORM,
+    MAKEFOURCC("A", "T", "I", "1"): DXGIFormats.DXGI_FORMAT_BC4_UNORM,
+    MAKEFOURCC("B", "C", "4", "U"): DXGIFormats.DXGI_FORMAT_BC4_UNORM,
+    MAKEFOURCC("A", "T", "I", "2"): DXGIFormats.DXGI_FORMAT_BC5_UNORM,
+    MAKEFOURCC("B", "C", "5", "U"): DXGIFormats.DXGI_FORMAT_BC5_UNORM,
+}
+"""The DXGI formats of legacy ``dwFourCC`` pixel formats.
+"""
+
+
+class DDSInfo(NamedTuple):
+    """The texture description read from the headers of a DDS file.
+    """
+
+    width: int
+    height: int
+    mips_count: int
+    dxgi_format: int
+    cubemap: bool
+    data_offset: int
+
+
+def read_dds_info(content: bytes) -> DDSInfo:
+    """Reads the texture description from the headers of a DDS file.
+
+    Args:
+        content (bytes): The content of the DDS file (at least its headers)
+
+    Raises:
+        ValueError: If the content is not a DDS file or its format is unsupported
+
+    Returns:
+        DDSInfo: The texture description
+    """
+
+    if content[:4] != b"DDS " or len(content) < (4 + DDS_HEADER_PACKER.size):
+        raise ValueError("content is not a DDS file")
+
+    (
+        _,
+        _,
+        height,
+        width,
+        _,
+        _,
+        mips_count,
+        _,
+        pixel_flags,
+        fourcc,
+        rgb_bit_count,
+        r_bit_mask,
+        _,
+        _,
+        _,
+        _,
+        caps2,
+        _,
+        _,
+        _,
+    ) = DDS_HEADER_PACKER.unpack_from(content, 4)
+    data_offset = 4 + DDS_HEADER_PACKER.size
+
+    if (pixel_flags & 0x4) and fourcc == MAKEFOURCC("D", "X", "1", "0"):
+        (dxgi_format, *_) = DDS_HEADER_DX10_PACKER.unpack_from(content, data_offset)
+        data_offset += DDS_HEADER_DX10_PACKER.size
+    elif (pixel_flags & 0x4) and fourcc in FOURCC_FORMATS:
+        dxgi_format = FOURCC_FORMATS[fourcc]
+    elif rgb_bit_count == 32:
+        dxgi_format = (
+            DXGIFormats.DXGI_FORMAT_B8G8R8A8_UNORM
+            if r_bit_mask == 0x00FF0000
+            else DXGIFormats.DXGI_FORMAT_R8G8B8A8_UNORM
+        )
+    elif rgb_bit_count == 8:
+        dxgi_format = DXGIFormats.DXGI_FORMAT_R8_UNORM
+    else:
+        raise ValueError(f"unsupported DDS pixel format {fourcc:#x}/{rgb_bit_count}")
+
+    return DDSInfo(
+        width,
+        height,
+        max(mips_count, 1),
+        int(dxgi_format),
+        bool(caps2 & 0x00000200),
+        data_offset,
+    )
+
+
+class DDSHeaderCacheInfo(NamedTuple):
+    """Statistics of a :class:`DDSHeaderFactory` cache.
+    """
+
+    hits: int
+    misses: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of header requests answered from the cache.
+
+        Returns:
+            float: The hit rate between 0.0 and 1.0
+        """
+        total = self.hits + self.misses
+        return (self.hits / total) if total > 0 else 0.0
+
+    def since(self, previous: "DDSHeaderCacheInfo") -> "DDSHeaderCacheInfo":
+        """Gets the statistics of the requests made since previous statistics.
+
+        Args:
+            previous (DDSHeaderCacheInfo): The previous statistics of the same cache
+
+        Returns:
+            DDSHeaderCacheInfo: The hits and misses since `previous` (along with the
+                current size of the cache)
+        """
+
+        return DDSHeaderCacheInfo(
+            self.hits - previous.hits, self.misses - previous.misses, self.currsize
+        )
+
+
+class DDSHeaderFactory(object):
+    """Builds and memoizes ``DDS_HEADER`` and ``DDS_HEADER_DX10`` bytes.
+
+    Headers only depend on a texture's format, dimensions, mip count and whether it
+    is a cubemap, so textures sharing those fields share the same prebuilt headers.
+    Headers are packed through :data:`DDS_HEADER_PACKER` instead of building the
+    :data:`DDS_HEADER` construct.
+    The cache and its statistics are guarded by a lock so archive files can be
+    extracted from several threads.
+    """
+
+    def __init__(self):
+        """Initializes the factory with an empty cache.
+        """
+
+        self._cache: Dict[Tuple[int, int, int, int, bool], Tuple[bytes, bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def build(
+        self,
+        dxgi_format: int,
+        width: int,
+        height: int,
+        mips_count: int,
+        cubemap: bool = False,
+    ) -> Tuple[bytes, bytes]:
+        """Gets the DDS and DX10 headers for a texture.
+
+        Args:
+            dxgi_format (int): The DXGI format of the texture
+            width (int): The width of the texture
+            height (int): The height of the texture
+            mips_count (int): The number of mips of the texture
+            cubemap (bool, optional): Defaults to False. True if texture is a cubemap
+
+        Returns:
+            Tuple[bytes, bytes]: A tuple of `DDS_HEADER` and `DX10_HEADER` (maybe None),
+                or None if the format is not supported
+        """
+
+        key = (dxgi_format, width, height, mips_count, cubemap)
+        with self._lock:
+            try:
+                headers = self._cache[key]
+                self.hits += 1
+                return headers
+            except KeyError:
+                self.misses += 1
+                headers = self._cache[key] = self._pack(*key)
+                return headers
+
+    def _pack(
+        self, dxgi_format: int, width: int, height: int, mips_count: int, cubemap: bool
+    ) -> Tuple[bytes, bytes]:
+        """Packs the DDS and DX10 headers for a texture.
+
+        Args:
+            dxgi_format (int): The DXGI format of the texture
+            width (int): The width of the texture
+            height (int): The height of the texture
+            mips_count (int): The number of mips of the texture
+            cubemap (bool): True if texture is a cubemap
+
+        Returns:
+            Tuple[bytes, bytes]: A tuple of `DDS_HEADER` and `DX10_HEADER` (maybe None),
+                or None if the format is not supported
+        """
+
+        pixel_format = DDS_PIXEL_FORMATS.get(dxgi_format)
+        if pixel_format is None:
+            return None
+
+        dds_header = DDS_HEADER_PACKER.pack(
+            124,
+            DDSD_TEXTURE_FLAGS,
+            height,
+            width,
+            int((width * height) * pixel_format.linear_size_factor),
+            0,
+            mips_count,
+            32,
+            pixel_format.flags,
+            pixel_format.fourcc,
+            pixel_format.rgb_bit_count,
+            pixel_format.r_bit_mask,
+            pixel_format.g_bit_mask,
+            pixel_format.b_bit_mask,
+            pixel_format.a_bit_mask,
+            DDSCAPS_TEXTURE_FLAGS,
+            (DDSCAPS2_CUBEMAP_FLAGS if cubemap else 0),
+            0,
+            0,
+            0,
+        )
+        dx10_header = None
+        if pixel_format.dx10:
+            dx10_header = DDS_HEADER_DX10_PACKER.pack(
+                dxgi_format,
+                D3D10ResourceDimension.D3D10_RESOURCE_DIMENSION_TEXTURE2D.value,
+                0,
+                1,
+                0,
+            )
+        return (dds_header, dx10_header)
+
+    def cache_info(self) -> DDSHeaderCacheInfo:
+        """Gets the statistics of the factory's cache.
+
+        Returns:
+            DDSHeaderCacheInfo: The cache statistics
+        """
+
+        with self._lock:
+            return DDSHeaderCacheInfo(self.hits, self.misses, len(self._cache))
+
+    def cache_clear(self):
+        """Clears the factory's cache and statistics.
+        """
+
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
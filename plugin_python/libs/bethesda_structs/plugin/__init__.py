@@ -1,18 +1,35 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://choosealicense.com/licenses/mit/>
 
+from typing import List, Iterable
+
 from .fnv import FNVPlugin
 from .fo3 import FO3Plugin
-from ._common import BasePlugin
+from .diff import PluginDiff, RecordChange
+from .index import PluginForms, OverrideIndex
+from .masters import MasterGraph, PluginMasters
+from .cache import CachedPlugin, PluginCache
+from .columns import export_columns
+from .resolver import FormIDResolver
+from ._common import BasePlugin, FormScanReport
+from .._common import open_filetype, open_filetypes
 
 AVAILABLE_PLUGINS = (FNVPlugin, FO3Plugin)
 
 
-def get_plugin(filepath: str) -> BasePlugin:
+def get_plugin(filepath: str, use_mmap: bool = True) -> BasePlugin:
     """Get an instance of the first plugin that can handle a given file.
 
+    Note:
+        The file is opened once, the plugin type is determined from its leading
+        bytes and the file is memory mapped for parsing (see
+        :func:`~bethesda_structs._common.open_filetype`).
+        The plugin can be used as a context manager to close the memory map.
+
     Args:
         filepath (str): The path of the file to handle
+        use_mmap (bool, optional): Defaults to True. Memory maps the plugin instead
+            of reading its content
 
     Returns:
         BasePlugin: The base plugin
@@ -27,6 +44,26 @@ def get_plugin(filepath: str) -> BasePlugin:
         FNVPlugin(filepath=PosixPath(...))
     """
 
-    for plug in AVAILABLE_PLUGINS:
-        if plug.can_handle(filepath):
-            return plug.parse_file(filepath)
+    return open_filetype(filepath, AVAILABLE_PLUGINS, use_mmap=use_mmap)
+
+
+def get_plugins(
+    filepaths: Iterable[str], use_mmap: bool = True, max_workers: int = None
+) -> List[BasePlugin]:
+    """Get instances of the plugins handling the given files concurrently.
+
+    Args:
+        filepaths (Iterable[str]): The paths of the files to handle
+        use_mmap (bool, optional): Defaults to True. Memory maps the plugins instead
+            of reading their content
+        max_workers (int, optional): Defaults to None. The number of threads used to
+            open plugins
+
+    Returns:
+        List[BasePlugin]: The plugins (in order of `filepaths`), None for files no
+            plugin can handle
+    """
+
+    return open_filetypes(
+        filepaths, AVAILABLE_PLUGINS, use_mmap=use_mmap, max_workers=max_workers
+    )
@@ -3,7 +3,24 @@
 
 import re
 import abc
-from typing import Any, Dict, List, Tuple, Union, Generic, TypeVar, Generator
+import mmap
+from itertools import islice, groupby
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Generic,
+    Mapping,
+    Iterable,
+    TypeVar,
+    Callable,
+    Iterator,
+    Optional,
+    Generator,
+    NamedTuple,
+)
 
 import attr
 from attr.validators import instance_of
@@ -11,44 +28,138 @@ from construct import Construct, Container, GreedyBytes
 from multidict import CIMultiDict
 
 from .. import exceptions
-from .._common import BaseFiletype
+from .._common import T_Content, BaseFiletype, parse_content
 
 T_BasePlugin = TypeVar("BasePlugin")
 T_Subrecord = TypeVar("Subrecord")
 T_SubrecordCollection = TypeVar("SubrecordCollection")
 
+DISCOVERY_CACHE_SIZE = 2 ** 12
+"""The maximum number of memoized discoveries per subrecord collection.
+"""
 
-@attr.s
-class FormID(object):
+NOT_HANDLED_STRUCT = GreedyBytes * "Not Handled"
+"""The structure of subrecords which cannot be discovered.
+"""
+
+
+def _invalidate_dependents(item: Any):
+    """Clears the memoized discoveries of the collections containing a changed item.
+
+    Args:
+        item (Any): The subrecord or collection whose flags changed
+    """
+
+    for collection in list(item.__dict__.get("_dependents", {}).values()):
+        collection.__dict__.pop("_discovery_cache", None)
+
+
+_interned_forms: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def intern_forms(forms: Iterable[str]) -> Tuple[str, ...]:
+    """Validates forms and returns the shared tuple of equal forms.
+
+    Args:
+        forms (Iterable[str]): The forms to intern
+
+    Raises:
+        ValueError: If `forms` is not a list (or tuple) of uppercase strings
+
+    Returns:
+        Tuple[str, ...]: The interned forms
+    """
+
+    if isinstance(forms, (list, tuple)):
+        key = tuple(forms)
+        try:
+            # NOTE: only validated forms are interned
+            interned = _interned_forms.get(key)
+        except TypeError:
+            interned = None
+        if interned is not None:
+            return interned
+
+    if not isinstance(forms, (list, tuple)) or not all(
+        isinstance(entry, str) and entry.upper() == entry for entry in forms
+    ):
+        raise ValueError(
+            f"forms must be a list of uppercase strings, recieved {forms!r} "
+            f"which is a {type(forms)!r}"
+        )
+    return _interned_forms.setdefault(key, key)
+
+
+class FormID(tuple):
     """The standardized form id object.
 
+    Note:
+        Form ids are compact immutable ``(form_id, forms)`` tuples as plugins
+        decode one per form id field.
+        Forms are validated and interned once (see :func:`intern_forms`), so form
+        ids decoded by the same adapter share a single forms tuple.
+
     Raises:
         ValueError: If forms is not a list of uppercase strings
     """
 
-    form_id = attr.ib(type=int)
-    forms = attr.ib(type=List[str], default=attr.Factory(list))
+    __slots__ = ()
+
+    def __new__(cls, form_id: int, forms: Iterable[str] = ()) -> "FormID":
+        return tuple.__new__(cls, (form_id, intern_forms(forms)))
 
-    @forms.validator
-    def validate(self, attribute: str, value: Any):
-        """Validates forms.
+    @classmethod
+    def from_interned(cls, form_id: int, forms: Tuple[str, ...]) -> "FormID":
+        """Creates a form id from already interned forms, skipping validation.
 
         Args:
-            attribute (str): Should always be ``forms``
-            value (Any): Should be a list of uppercase strings
+            form_id (int): The form id
+            forms (Tuple[str, ...]): The interned forms (see :func:`intern_forms`)
 
-        Raises:
-            ValueError: If `value` is not a list
-            ValueError: If all entries in `value` are not uppercase strings
+        Returns:
+            FormID: The form id
         """
 
-        if not isinstance(value, list) or not all(
-            isinstance(entry, str) and entry.upper() == entry for entry in value
-        ):
-            raise ValueError(
-                f"forms must be a list of uppercase strings, recieved {value!r} "
-                f"which is a {type(value)!r}"
-            )
+        return tuple.__new__(cls, (form_id, forms))
+
+    @property
+    def form_id(self) -> int:
+        """The raw form id.
+
+        Returns:
+            int: The raw form id
+        """
+
+        return self[0]
+
+    @property
+    def forms(self) -> Tuple[str, ...]:
+        """The record types the form id may refer to.
+
+        Returns:
+            Tuple[str, ...]: The record types the form id may refer to
+        """
+
+        return self[1]
+
+    def __getnewargs__(self) -> Tuple[int, Tuple[str, ...]]:
+        return tuple(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(form_id={self[0]!r}, forms={list(self[1])!r})"
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        # NOTE: form ids never equal plain tuples
+        if other.__class__ is not self.__class__:
+            return False
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = tuple.__hash__
 
 
 @attr.s
@@ -181,6 +292,7 @@ class Subrecord(object):
         """
 
         (self.optional, self.multiple) = self.parse_flag(flag)
+        _invalidate_dependents(self)
         return self
 
 
@@ -317,10 +429,69 @@ class SubrecordCollection(object):
                 if item.name == target:
                     return item
             elif isinstance(item, self.__class__):
-                result = self._lookahead(item.items, target)
+                result = item._lookahead_from(0, target)
                 if result:
                     return result
 
+    def _lookahead_from(self, start: int, target: str) -> Subrecord:
+        """Memoized :func:`~SubrecordCollection._lookahead` over the collection's items.
+
+        Note:
+            The results only depend on the names of the items (not their flags), so
+            the table is built up once per collection.
+
+        Args:
+            start (int): The index of the first item to search
+            target (str): The target to search for
+
+        Returns:
+            Subrecord: The first matching subrecord, or None
+        """
+
+        table = self.__dict__.get("_lookahead_table")
+        if table is None:
+            table = self._lookahead_table = {}
+        key = (start, target)
+        if key not in table:
+            table[key] = self._lookahead(self.items[start:], target)
+        return table[key]
+
+    def _iter_nested(self) -> Generator[Any, None, None]:
+        """Iterates over the subrecords and collections nested in the collection.
+
+        Yields:
+            Any: The nested subrecords and collections
+        """
+
+        for item in self.items:
+            yield item
+            if isinstance(item, self.__class__):
+                yield from item._iter_nested()
+
+    def _discovery_key(self, names: list) -> tuple:
+        """Builds the key discoveries after the given names are memoized by.
+
+        Note:
+            Names are run-length encoded and runs are capped at one more than the
+            number of nested items.
+            Every repetition of a name either advances the parse to a later item or
+            is taken by a multiple item without changing the parse, so longer runs
+            reach the same state and share a key.
+
+        Args:
+            names (list): The previously discovered subrecord names
+
+        Returns:
+            tuple: The capped (name, count) runs of the names
+        """
+
+        limit = self.__dict__.get("_run_limit")
+        if limit is None:
+            limit = self._run_limit = sum(1 for _ in self._iter_nested()) + 1
+        return tuple(
+            (name, len(list(islice(run, limit)))) for (name, run) in groupby(names)
+        )
+
     def _parse(  # noqa: C901
         self, names: list, strict: bool = True, level: int = 0
     ) -> Tuple[list, int]:
@@ -376,13 +547,13 @@ class SubrecordCollection(object):
                                 f"{item!r} is required for {self!r}"
                             )
                         else:
-                            if not self._lookahead(self.items[item_idx:], name):
+                            if not self._lookahead_from(item_idx, name):
                                 raise exceptions.UnexpectedSubrecord(
                                     f"{name!r} is not expected for {self!r}"
                                 )
                     item_idx += 1
             elif isinstance(item, self.__class__):
-                if item._lookahead(item.items, name):
+                if item._lookahead_from(0, name):
                     (nested, idx) = item._parse(
                         names[name_idx:], strict=strict, level=(level + 1)
                     )
@@ -429,11 +600,22 @@ class SubrecordCollection(object):
         """
 
         (self.optional, self.multiple) = self.parse_flag(flag)
+        _invalidate_dependents(self)
         return self
 
     def discover(self, names: list, target: str, strict: bool = True) -> Subrecord:
         """Discovers the next expected subrecord given a target.
 
+        Note:
+            Discoveries (including the raised exceptions) are memoized per
+            collection by the parse state of the previously discovered names (see
+            :func:`~SubrecordCollection._discovery_key`), the target and
+            strictness.
+            Records of the same type mostly share their subrecord layout, so after
+            the first few records discovery is a single table lookup.
+            Changing the flags of a nested item through ``be`` only clears the
+            memoized discoveries of the collections containing it.
+
         Args:
             names (list): The previously discovered subrecord names
             target (str): The target to discover next
@@ -468,16 +650,47 @@ class SubrecordCollection(object):
                     else:
                         return item
                 elif isinstance(item, self.__class__):
-                    if not item.optional or self._lookahead(item.items, target):
+                    if not item.optional or item._lookahead_from(0, target):
                         result = handle_strict(item.items, target)
                         if result:
                             return result
 
-        (rest, _) = self._parse(names, strict=strict)
-        if strict:
-            # apply post-parsing ordering enforcement
-            handle_strict(rest, target)
-        return self._lookahead(rest, target)
+        cache = self.__dict__.get("_discovery_cache")
+        if cache is None:
+            cache = self._discovery_cache = {}
+            for item in self._iter_nested():
+                item.__dict__.setdefault("_dependents", {})[id(self)] = self
+
+        key = (self._discovery_key(names), target, strict)
+        if key in cache:
+            discovered = cache[key]
+            if isinstance(discovered, exceptions.UnexpectedSubrecord):
+                raise exceptions.UnexpectedSubrecord(*discovered.args)
+            return discovered
+
+        try:
+            (rest, _) = self._parse(names, strict=strict)
+            if strict:
+                # apply post-parsing ordering enforcement
+                handle_strict(rest, target)
+            discovered = self._lookahead(rest, target)
+        except exceptions.UnexpectedSubrecord as exc:
+            discovered = exc
+
+        if len(cache) >= DISCOVERY_CACHE_SIZE:
+            cache.clear()
+        cache[key] = discovered
+        if isinstance(discovered, exceptions.UnexpectedSubrecord):
+            raise discovered
+        return discovered
+
+    def clear_caches(self):
+        """Clears the memoized lookaheads and discoveries of the collection.
+        """
+
+        self.__dict__.pop("_lookahead_table", None)
+        self.__dict__.pop("_discovery_cache", None)
+        self.__dict__.pop("_run_limit", None)
 
     def handle_working(
         self,
@@ -510,7 +723,7 @@ class SubrecordCollection(object):
 
         subrecord_name = subrecord_name.upper()
         discovered = self.discover(working_record, subrecord_name, strict=strict)
-        subrecord_struct = GreedyBytes * "Not Handled"
+        subrecord_struct = NOT_HANDLED_STRUCT
         if isinstance(discovered, Subrecord):
             subrecord_struct = discovered.struct
         parsed = Container(
@@ -520,12 +733,168 @@ class SubrecordCollection(object):
         return (parsed, [subrecord_name])
 
 
+class RecordRegistry(Mapping):
+    """A registry of the subrecord collections of record types.
+
+    Collections are built on first lookup (building a collection constructs all of
+    its subrecord structures and runs their validators), so only the record types
+    which are actually parsed are built.
+    Record types sharing a builder share a single collection, and every collection
+    memoizes its lookaheads and discoveries (see
+    :func:`~SubrecordCollection.discover`).
+    """
+
+    def __init__(self, builders: Dict[str, Callable[[], SubrecordCollection]]):
+        """Creates a registry from the given builders.
+
+        Args:
+            builders (Dict[str, Callable[[], SubrecordCollection]]): The builder of
+                the subrecord collection of each record type
+        """
+
+        self.builders = builders
+        self._collections: Dict[Callable[[], SubrecordCollection], Any] = {}
+
+    def __getitem__(self, record_type: str) -> SubrecordCollection:
+        builder = self.builders[record_type]
+        collection = self._collections.get(builder)
+        if collection is None:
+            # NOTE: concurrent first lookups keep whichever collection is stored first
+            collection = self._collections.setdefault(builder, builder())
+        return collection
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.builders)
+
+    def __len__(self) -> int:
+        return len(self.builders)
+
+    def is_built(self, record_type: str) -> bool:
+        """Determines if the collection of a record type has already been built.
+
+        Args:
+            record_type (str): The record type
+
+        Returns:
+            bool: True if the collection has been built
+        """
+
+        return self.builders.get(record_type) in self._collections
+
+    def prebuild(self, record_types: Iterable[str] = None):
+        """Builds the collections of record types ahead of their first lookup.
+
+        Args:
+            record_types (Iterable[str], optional): Defaults to None. The record
+                types to build, defaults to all record types
+        """
+
+        for record_type in record_types or self.builders:
+            self[record_type]
+
+    def clear_caches(self):
+        """Clears the memoized lookaheads and discoveries of all built collections.
+        """
+
+        for collection in self._collections.values():
+            collection.clear_caches()
+
+
+class RecordHeader(NamedTuple):
+    """The fixed size header of a record, read without touching the record's data.
+    """
+
+    type: bytes
+    data_size: int
+    flags: int
+    form_id: int
+    offset: int
+
+
+@attr.s
+class FormScanReport(object):
+    """The summary of a record header scan of a plugin.
+    """
+
+    masters = attr.ib(type=List[str], default=attr.Factory(list))
+    """The masters of the plugin (in order).
+
+    Returns:
+        List[str]: The masters of the plugin
+    """
+
+    records = attr.ib(type=int, default=0)
+    """The number of records (excluding the header record).
+
+    Returns:
+        int: The number of records
+    """
+
+    new_forms = attr.ib(type=int, default=0)
+    """The number of records whose form ids belong to the plugin itself.
+
+    Returns:
+        int: The number of new forms
+    """
+
+    new_form_types = attr.ib(type=Dict[str, int], default=attr.Factory(dict))
+    """The number of new forms per record type.
+
+    Returns:
+        Dict[str, int]: The number of new forms per record type
+    """
+
+    min_form_id = attr.ib(type=Optional[int], default=None)
+    """The lowest form id of the new forms.
+
+    Returns:
+        Optional[int]: The lowest new form id, or None if there are no new forms
+    """
+
+    max_form_id = attr.ib(type=Optional[int], default=None)
+    """The highest form id of the new forms.
+
+    Returns:
+        Optional[int]: The highest new form id, or None if there are no new forms
+    """
+
+    @property
+    def plugin_index(self) -> int:
+        """The master index form ids of the plugin's own forms start with.
+
+        Returns:
+            int: The master index of the plugin itself
+        """
+
+        return len(self.masters)
+
+    @property
+    def overrides(self) -> int:
+        """The number of records overriding (or injecting into) forms of masters.
+
+        Returns:
+            int: The number of overriding records
+        """
+
+        return self.records - self.new_forms
+
+    @property
+    def adds_forms(self) -> bool:
+        """True if the plugin defines any forms of its own.
+
+        Returns:
+            bool: True if the plugin defines new forms
+        """
+
+        return self.new_forms > 0
+
+
 @attr.s
 class BasePlugin(BaseFiletype, abc.ABC, Generic[T_BasePlugin]):
     """The base class all Plugins should subclass.
     """
 
-    content = attr.ib(type=bytes, repr=False)
+    content = attr.ib(type=T_Content, repr=False)
     filepath = attr.ib(type=str, default=None)
     record_registry = attr.ib(type=CIMultiDict, default=CIMultiDict(), repr=False)
 
@@ -541,15 +910,15 @@ class BasePlugin(BaseFiletype, abc.ABC, Generic[T_BasePlugin]):
     @property
     def container(self) -> Container:
         if not hasattr(self, "_container"):
-            self._container = self.plugin_struct.parse(self.content)
+            self._container = parse_content(self.plugin_struct, self.content)
         return self._container
 
     @classmethod
-    def parse(cls, content: bytes, filepath: str = None) -> T_BasePlugin:
+    def parse(cls, content: T_Content, filepath: str = None) -> T_BasePlugin:
         """Create a `BasePlugin` from a byte array.
 
         Args:
-            content (bytes): The byte content of the archive
+            content (T_Content): The byte content (or memory map) of the plugin
             filepath (str, optional): Defaults to None. Sets the filepath attribute for
                 user's reference
 
@@ -559,7 +928,7 @@ class BasePlugin(BaseFiletype, abc.ABC, Generic[T_BasePlugin]):
         Returns:
             T_BasePlugin: A created `BasePlugin`
         """
-        if not isinstance(content, bytes):
+        if not isinstance(content, (bytes, mmap.mmap)):
             raise ValueError(
                 f"given content must be of bytes, recieved {type(content)!r}"
             )
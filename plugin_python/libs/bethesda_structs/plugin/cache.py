@@ -0,0 +1,702 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import os
+import mmap
+import json
+import array
+import pickle
+import struct
+import hashlib
+from typing import Any, Dict, List, Tuple, Iterable, Optional, Generator
+from pathlib import Path
+
+import attr
+from construct import Container
+
+from ._common import RecordHeader
+
+CACHE_VERSION = 1
+"""The version of cache files, cache files of other versions are rebuilt.
+"""
+
+CACHE_MAGIC = b"BSPC"
+"""The magic of cache files.
+"""
+
+CACHE_SUFFIX = ".bspc"
+"""The suffix of cache files.
+"""
+
+DEFAULT_MAX_SIZE = 2 ** 30
+"""The default size budget (in bytes) of a cache directory.
+"""
+
+HASH_CHUNK_SIZE = 2 ** 20
+"""The size of the chunks plugins are read in when hashing their content.
+"""
+
+_cache_header_struct = struct.Struct("<4sIIQd4x")
+"""The fixed size header of cache files.
+
+Holds the magic, the version, the size of the metadata and the size and
+modification time of the cached plugin.
+"""
+
+_section_alignment = 8
+
+
+def hash_content(content: Any) -> str:
+    """Hashes the content of a plugin.
+
+    Args:
+        content (Any): The byte content (or memory map) of the plugin
+
+    Returns:
+        str: The hex digest of the content
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    view = memoryview(content)
+    try:
+        for offset in range(0, len(view), HASH_CHUNK_SIZE):
+            digest.update(view[offset : offset + HASH_CHUNK_SIZE])
+    finally:
+        view.release()
+    return digest.hexdigest()
+
+
+def hash_file(filepath: str) -> str:
+    """Hashes the content of a plugin file.
+
+    Args:
+        filepath (str): The path of the plugin
+
+    Returns:
+        str: The hex digest of the file's content
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CachedPlugin(object):
+    """The record index and selected decoded subrecords of a plugin, mapped from a
+    cache file.
+
+    Nothing but the metadata is read when the cache file is opened, the record
+    index is a view of the memory mapped cache file and decoded subrecords are
+    unpickled when they are first accessed.
+
+    Note:
+        Cached plugins hold their cache file open until they are closed (they can
+        be used as context managers).
+    """
+
+    def __init__(self, cache_path: str, meta: dict, content: mmap.mmap, offset: int):
+        """Maps a cached plugin from the content of a cache file.
+
+        Args:
+            cache_path (str): The path of the cache file
+            meta (dict): The metadata of the cache file
+            content (mmap.mmap): The memory mapped cache file
+            offset (int): The offset of the sections within the cache file
+        """
+
+        self.cache_path = cache_path
+        self.meta = meta
+        self._content = content
+        self._plugin = None
+        self._form_indexes: Optional[Dict[int, int]] = None
+        self._decoded: Dict[Tuple[int, str], Any] = {}
+
+        self._view = memoryview(content)
+        self._views = []
+        sections = meta["sections"]
+        count = meta["records"]
+
+        def section(name: str, size: int, cast_format: str = None) -> memoryview:
+            start = offset + sections[name]
+            view = self._view[start : start + size]
+            self._views.append(view)
+            if cast_format is not None:
+                view = view.cast(cast_format)
+                self._views.append(view)
+            return view
+
+        self._types = section("types", count * 4)
+        self._data_sizes = section("data_sizes", count * 4, "I")
+        self._flags = section("flags", count * 4, "I")
+        self._form_ids = section("form_ids", count * 4, "I")
+        self._offsets = section("offsets", count * 8, "Q")
+        self._values: Dict[str, Tuple[memoryview, memoryview]] = {}
+        for subrecord_type in meta["subrecords"]:
+            value_offsets = section(f"{subrecord_type}.offsets", (count + 1) * 8, "Q")
+            self._values[subrecord_type] = (
+                value_offsets,
+                section(f"{subrecord_type}.values", value_offsets[count]),
+            )
+
+    @classmethod
+    def from_path(cls, cache_path: str) -> "CachedPlugin":
+        """Maps a cached plugin from a cache file.
+
+        Args:
+            cache_path (str): The path of the cache file
+
+        Raises:
+            ValueError: If the cache file is not a valid cache file
+
+        Returns:
+            CachedPlugin: The mapped cached plugin
+        """
+
+        with open(cache_path, "rb") as stream:
+            content = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (_, _, meta) = PluginCache.read_meta(content)
+            meta_size = _cache_header_struct.unpack_from(content, 0)[2]
+            return cls(
+                cache_path, meta, content, PluginCache.get_sections_offset(meta_size)
+            )
+        except Exception:
+            content.close()
+            raise
+
+    @property
+    def path(self) -> str:
+        """The path of the cached plugin.
+
+        Returns:
+            str: The path of the cached plugin
+        """
+
+        return self.meta["path"]
+
+    @property
+    def name(self) -> str:
+        """The filename of the cached plugin.
+
+        Returns:
+            str: The filename of the cached plugin
+        """
+
+        return os.path.basename(self.path)
+
+    @property
+    def masters(self) -> List[str]:
+        """The masters of the cached plugin (in order).
+
+        Returns:
+            List[str]: The masters of the cached plugin
+        """
+
+        return self.meta["masters"]
+
+    @property
+    def subrecords(self) -> List[str]:
+        """The subrecord types whose decoded values are cached.
+
+        Returns:
+            List[str]: The cached subrecord types
+        """
+
+        return self.meta["subrecords"]
+
+    def __len__(self) -> int:
+        return self.meta["records"]
+
+    def __enter__(self) -> "CachedPlugin":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Closes the cache file (and the cached plugin if it was opened).
+        """
+
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._view.release()
+        self._content.close()
+        if self._plugin is not None:
+            self._plugin.close()
+        self._plugin = None
+
+    def get_header(self, index: int) -> RecordHeader:
+        """Gets the header of a record.
+
+        Args:
+            index (int): The index of the record (in order of the plugin)
+
+        Returns:
+            RecordHeader: The header of the record
+        """
+
+        return RecordHeader(
+            bytes(self._types[index * 4 : (index + 1) * 4]),
+            self._data_sizes[index],
+            self._flags[index],
+            self._form_ids[index],
+            self._offsets[index],
+        )
+
+    def iter_record_headers(self) -> Generator[RecordHeader, None, None]:
+        """Iterates over the headers of all records (excluding the header record).
+
+        Yields:
+            RecordHeader: The header of each record (in order of the plugin)
+        """
+
+        for index in range(len(self)):
+            yield self.get_header(index)
+
+    def find(self, form_id: int) -> Optional[int]:
+        """Finds the record of a form id.
+
+        Args:
+            form_id (int): The form id of the record
+
+        Returns:
+            Optional[int]: The index of the (first) record of the form id, None if
+                there is no such record
+        """
+
+        if self._form_indexes is None:
+            self._form_indexes = {}
+            for (index, record_form_id) in enumerate(self._form_ids):
+                self._form_indexes.setdefault(record_form_id, index)
+        return self._form_indexes.get(form_id)
+
+    def get_value(self, index: int, subrecord_type: str) -> Any:
+        """Gets the decoded value of a record's subrecord.
+
+        Args:
+            index (int): The index of the record
+            subrecord_type (str): The subrecord type
+
+        Raises:
+            ValueError: If the subrecord type is not cached
+
+        Returns:
+            Any: The decoded value of the (first) subrecord of the type, None if
+                the record has no such subrecord
+        """
+
+        subrecord_type = subrecord_type.upper()
+        if subrecord_type not in self._values:
+            raise ValueError(f"subrecord {subrecord_type!r} is not cached")
+
+        key = (index, subrecord_type)
+        if key not in self._decoded:
+            (value_offsets, values) = self._values[subrecord_type]
+            (start, end) = (value_offsets[index], value_offsets[index + 1])
+            self._decoded[key] = None
+            if end > start:
+                with values[start:end] as data:
+                    self._decoded[key] = pickle.loads(data)
+        return self._decoded[key]
+
+    def iter_values(self, subrecord_type: str) -> Generator[Any, None, None]:
+        """Iterates over the decoded values of a subrecord type of all records.
+
+        Args:
+            subrecord_type (str): The subrecord type
+
+        Raises:
+            ValueError: If the subrecord type is not cached
+
+        Yields:
+            Any: The decoded value of each record (in order of the plugin)
+        """
+
+        for index in range(len(self)):
+            yield self.get_value(index, subrecord_type)
+
+    def parse_record(self, index: int) -> Container:
+        """Parses a record from the cached plugin.
+
+        Note:
+            The cached plugin is memory mapped on the first parse.
+            Compressed records are fully inflated (see
+            :func:`~.fnv.FNVPlugin.read_record_data`).
+
+        Args:
+            index (int): The index of the record
+
+        Raises:
+            ValueError: If the cached plugin can no longer be handled
+
+        Returns:
+            Container: The parsed record
+        """
+
+        if self._plugin is None:
+            # NOTE: imported here to avoid a circular import of the plugin package
+            from . import get_plugin
+
+            self._plugin = get_plugin(self.path)
+            if self._plugin is None:
+                raise ValueError(f"no plugin can handle {self.path!r}")
+        return self._plugin._parse_record(
+            self._plugin.content, self.get_header(index)
+        )
+
+
+@attr.s
+class PluginCache(object):
+    """A persistent cache of plugin record indexes and decoded subrecords.
+
+    Every plugin is cached in a single file holding the headers of its records (as
+    arrays) and the pickled values of selected subrecords.
+    Cache files are keyed by the plugin's size, modification time and content hash,
+    so plugins which were only touched are not parsed again.
+    Reopening a cached plugin only reads the cache file's metadata (see
+    :class:`CachedPlugin`).
+
+    Note:
+        Cache files hold pickled values and are specific to the machine they were
+        written on, so the cache directory must be private to the user.
+
+    Example:
+        >>> cache = PluginCache("/home/username/.cache/bethesda_structs")
+        >>> with cache.open(
+        ...     "/home/username/Fallout New Vegas/Data/FalloutNV.esm",
+        ...     subrecords=["EDID", "FULL"],
+        ... ) as cached:
+        ...     cached.get_value(cached.find(0x0000000F), "EDID")
+        'Caps001'
+    """
+
+    directory = attr.ib(type=str, converter=os.fspath)
+    """The directory cache files are stored in.
+
+    Returns:
+        str: The cache directory
+    """
+
+    max_size = attr.ib(type=int, default=DEFAULT_MAX_SIZE)
+    """The size budget (in bytes) of the cache directory.
+
+    Returns:
+        int: The size budget of the cache directory
+    """
+
+    @staticmethod
+    def get_sections_offset(meta_size: int) -> int:
+        """Gets the (aligned) offset of the sections of a cache file.
+
+        Args:
+            meta_size (int): The size of the encoded metadata
+
+        Returns:
+            int: The offset of the sections
+        """
+
+        offset = _cache_header_struct.size + meta_size
+        return offset + (-offset % _section_alignment)
+
+    @staticmethod
+    def read_meta(content: Any) -> Tuple[int, float, dict]:
+        """Reads the header and metadata of a cache file.
+
+        Args:
+            content (Any): The leading bytes (or memory map) of the cache file
+
+        Raises:
+            ValueError: If the content is not a cache file of the current version
+
+        Returns:
+            Tuple[int, float, dict]: A tuple of (plugin size, plugin modification
+                time, metadata)
+        """
+
+        if len(content) < _cache_header_struct.size:
+            raise ValueError("truncated cache file header")
+        (magic, version, meta_size, size, mtime) = _cache_header_struct.unpack_from(
+            content, 0
+        )
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            raise ValueError("not a cache file of the current version")
+
+        meta_offset = _cache_header_struct.size
+        meta_data = bytes(content[meta_offset : meta_offset + meta_size])
+        if len(meta_data) < meta_size:
+            raise ValueError("truncated cache file metadata")
+        return (size, mtime, json.loads(meta_data.decode("utf8")))
+
+    def get_cache_path(self, filepath: str) -> Path:
+        """Gets the path of the cache file of a plugin.
+
+        Args:
+            filepath (str): The path of the plugin
+
+        Returns:
+            Path: The path of the plugin's cache file
+        """
+
+        key = os.path.normcase(os.path.abspath(filepath)).encode("utf8")
+        return Path(self.directory) / (
+            hashlib.blake2b(key, digest_size=16).hexdigest() + CACHE_SUFFIX
+        )
+
+    def _read_entry(self, cache_path: Path) -> Optional[Tuple[int, float, dict]]:
+        """Reads the header and metadata of a cache file if it is valid.
+
+        Args:
+            cache_path (Path): The path of the cache file
+
+        Returns:
+            Optional[Tuple[int, float, dict]]: A tuple of (plugin size, plugin
+                modification time, metadata), None if the cache file is missing or
+                invalid
+        """
+
+        try:
+            with cache_path.open("rb") as stream:
+                header = stream.read(_cache_header_struct.size)
+                (_, _, meta_size, *_) = _cache_header_struct.unpack(header)
+                return self.read_meta(header + stream.read(meta_size))
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def _write(
+        self, filepath: str, cache_path: Path, subrecords: List[str]
+    ) -> os.stat_result:
+        """Parses a plugin and writes its cache file.
+
+        Args:
+            filepath (str): The path of the plugin
+            cache_path (Path): The path of the cache file
+            subrecords (List[str]): The subrecord types whose values to cache
+
+        Raises:
+            ValueError: If the given file is not a supported plugin
+
+        Returns:
+            os.stat_result: The stat of the plugin the cache file was written for
+        """
+
+        # NOTE: imported here to avoid a circular import of the plugin package
+        from . import get_plugin
+
+        stat = os.stat(filepath)
+        plugin = get_plugin(filepath)
+        if plugin is None:
+            raise ValueError(f"no plugin can handle {filepath!r}")
+
+        try:
+            record_headers = plugin.iter_record_headers(plugin.content)
+            header = next(record_headers, None)
+            if header is None or header.type != b"TES4":
+                raise ValueError(
+                    f"{filepath!r} does not start with a TES4 header record"
+                )
+            masters = plugin._read_masters(plugin.content, header)
+            headers = list(record_headers)
+
+            values = {
+                subrecord_type: (array.array("Q", [0]), bytearray())
+                for subrecord_type in subrecords
+            }
+            if len(subrecords) > 0:
+                for record in plugin.query(subrecords=subrecords):
+                    decoded = {}
+                    for subrecord in record.subrecords:
+                        if subrecord.parsed is not None:
+                            decoded.setdefault(
+                                subrecord.type.upper(), subrecord.parsed.value
+                            )
+                    for (subrecord_type, (value_offsets, data)) in values.items():
+                        if subrecord_type in decoded:
+                            data += pickle.dumps(
+                                decoded[subrecord_type],
+                                protocol=pickle.HIGHEST_PROTOCOL,
+                            )
+                        value_offsets.append(len(data))
+            content_hash = hash_content(plugin.content)
+        finally:
+            plugin.close()
+
+        sections = [
+            ("types", b"".join(header.type for header in headers)),
+            ("data_sizes", array.array("I", [header.data_size for header in headers])),
+            ("flags", array.array("I", [header.flags for header in headers])),
+            ("form_ids", array.array("I", [header.form_id for header in headers])),
+            ("offsets", array.array("Q", [header.offset for header in headers])),
+        ]
+        for (subrecord_type, (value_offsets, data)) in values.items():
+            sections.append((f"{subrecord_type}.offsets", value_offsets))
+            sections.append((f"{subrecord_type}.values", data))
+
+        section_offsets = {}
+        offset = 0
+        for (name, data) in sections:
+            section_offsets[name] = offset
+            offset += len(memoryview(data).cast("B"))
+            offset += -offset % _section_alignment
+
+        meta = json.dumps(
+            {
+                "path": filepath,
+                "hash": content_hash,
+                "masters": masters,
+                "records": len(headers),
+                "subrecords": subrecords,
+                "sections": section_offsets,
+            }
+        ).encode("utf8")
+
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with temp_path.open("wb") as stream:
+            stream.write(
+                _cache_header_struct.pack(
+                    CACHE_MAGIC, CACHE_VERSION, len(meta), stat.st_size, stat.st_mtime
+                )
+            )
+            stream.write(meta)
+            stream.write(bytes(-stream.tell() % _section_alignment))
+            for (_, data) in sections:
+                stream.write(data)
+                stream.write(bytes(-stream.tell() % _section_alignment))
+        os.replace(temp_path, cache_path)
+        return stat
+
+    def open(self, filepath: str, subrecords: Iterable[str] = None) -> CachedPlugin:
+        """Opens the cached plugin of a plugin, parsing the plugin if necessary.
+
+        Note:
+            Plugins whose size and modification time are unchanged are not read at
+            all, plugins whose modification time changed are hashed (and only parsed
+            again if their content changed).
+            Requesting subrecord types which are not cached yet parses the plugin
+            again, caching the union of the subrecord types.
+
+        Args:
+            filepath (str): The path of the plugin
+            subrecords (Iterable[str], optional): Defaults to None. The subrecord
+                types whose decoded values to cache
+
+        Raises:
+            FileNotFoundError: If the given path does not exist
+            ValueError: If the given file is not a supported plugin
+
+        Returns:
+            CachedPlugin: The cached plugin
+        """
+
+        filepath = os.path.abspath(os.fspath(filepath))
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"file {filepath!r} does not exist")
+
+        subrecords = sorted(
+            {subrecord_type.upper() for subrecord_type in subrecords or []}
+        )
+        cache_path = self.get_cache_path(filepath)
+        stat = os.stat(filepath)
+
+        entry = self._read_entry(cache_path)
+        is_valid = False
+        if entry is not None:
+            (size, mtime, meta) = entry
+            if meta["path"] == filepath and size == stat.st_size:
+                is_valid = mtime == stat.st_mtime
+                if not is_valid and hash_file(filepath) == meta["hash"]:
+                    # NOTE: the plugin was only touched, keep its cache file
+                    self._touch_entry(cache_path, stat)
+                    is_valid = True
+
+            if is_valid and set(subrecords) <= set(meta["subrecords"]):
+                os.utime(cache_path)
+                return CachedPlugin.from_path(str(cache_path))
+            elif is_valid:
+                subrecords = sorted(set(subrecords) | set(meta["subrecords"]))
+
+        self._write(filepath, cache_path, subrecords)
+        self.evict(keep=[cache_path])
+        return CachedPlugin.from_path(str(cache_path))
+
+    def _touch_entry(self, cache_path: Path, stat: os.stat_result):
+        """Updates the plugin modification time stored in a cache file.
+
+        Args:
+            cache_path (Path): The path of the cache file
+            stat (os.stat_result): The current stat of the plugin
+        """
+
+        with cache_path.open("r+b") as stream:
+            header = bytearray(stream.read(_cache_header_struct.size))
+            (magic, version, meta_size, *_) = _cache_header_struct.unpack(header)
+            stream.seek(0)
+            stream.write(
+                _cache_header_struct.pack(
+                    magic, version, meta_size, stat.st_size, stat.st_mtime
+                )
+            )
+
+    def get_size(self) -> int:
+        """Gets the size of all cache files.
+
+        Returns:
+            int: The size (in bytes) of all cache files
+        """
+
+        return sum(
+            cache_path.stat().st_size
+            for cache_path in Path(self.directory).glob(f"*{CACHE_SUFFIX}")
+        )
+
+    def evict(self, keep: Iterable[Path] = None) -> List[Path]:
+        """Removes the least recently used cache files until the size budget is met.
+
+        Note:
+            Cache files which are still open (on platforms preventing their removal)
+            are skipped.
+
+        Args:
+            keep (Iterable[Path], optional): Defaults to None. The cache files to
+                never remove
+
+        Returns:
+            List[Path]: The removed cache files
+        """
+
+        keep = {Path(cache_path) for cache_path in keep or []}
+        entries = []
+        for cache_path in Path(self.directory).glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = cache_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, cache_path))
+
+        total_size = sum(size for (_, size, _) in entries)
+        removed = []
+        for (_, size, cache_path) in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if cache_path in keep:
+                continue
+            try:
+                cache_path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            removed.append(cache_path)
+        return removed
+
+    def clear(self):
+        """Removes all cache files.
+        """
+
+        for cache_path in Path(self.directory).glob(f"*{CACHE_SUFFIX}"):
+            try:
+                cache_path.unlink()
+            except OSError:
+                continue
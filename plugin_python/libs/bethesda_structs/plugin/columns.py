@@ -0,0 +1,497 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import struct
+from typing import Any, Dict, List, Tuple, Union, Callable, Iterable, Optional
+
+from construct import (
+    Pass,
+    Enum,
+    Array,
+    Bytes,
+    Padded,
+    Struct,
+    Renamed,
+    Construct,
+    FlagsEnum,
+    FormatField,
+    StringEncoded,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from ._common import (
+    FormID,
+    Subrecord,
+    BasePlugin,
+    RecordHeader,
+    SubrecordCollection,
+)
+from .fnv._common import FNVFormID
+
+T_Columns = Union[Dict[str, Any], "numpy.ndarray"]
+T_Layout = List[Tuple[Optional[str], str]]
+
+FIELD_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "l": "i4",
+    "L": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "e": "f2",
+    "f": "f4",
+    "d": "f8",
+    "?": "?",
+}
+"""The NumPy types of the (little-endian) struct formats of fixed size fields.
+"""
+
+RAW_ADAPTERS = (Enum, FlagsEnum, FNVFormID)
+"""The adapters whose fields are exported as their underlying integers.
+"""
+
+
+def _join_path(path: Optional[str], name: Optional[str]) -> Optional[str]:
+    """Joins a field path and the name of a child field.
+
+    Args:
+        path (Optional[str]): The path of the parent, None for unnamed fields
+        name (Optional[str]): The name of the child, None for unnamed fields
+
+    Returns:
+        Optional[str]: The path of the child, None for unnamed fields
+    """
+
+    if path is None or name is None:
+        return None
+    return name if len(path) == 0 else f"{path}.{name}"
+
+
+def _field_name(subrecord_type: str, path: str) -> str:
+    """Gets the name of a field given its subrecord type and path.
+
+    Args:
+        subrecord_type (str): The uppercase subrecord type
+        path (str): The path of the field within the subrecord
+
+    Returns:
+        str: The name of the field
+    """
+
+    return f"{subrecord_type}.{path}" if len(path) > 0 else subrecord_type
+
+
+def get_layout(construct: Construct, path: str = "") -> Optional[T_Layout]:
+    """Gets the fixed layout of a structure.
+
+    Note:
+        Enums, flags and form ids are laid out as their underlying integers, any
+        other adapted (or variably sized) field makes the structure not fixed.
+
+    Args:
+        construct (Construct): The structure
+        path (str, optional): Defaults to "". The path of the structure
+
+    Returns:
+        Optional[T_Layout]: A list of (field path, struct format) tuples (the path of
+            unnamed fields and padding is None), None if the structure is not fixed
+    """
+
+    while isinstance(construct, Renamed):
+        construct = construct.subcon
+
+    if isinstance(construct, FormatField):
+        (byte_order, field_format) = (construct.fmtstr[:1], construct.fmtstr[1:])
+        if byte_order != "<" or field_format not in FIELD_TYPES:
+            return None
+        return [(path, field_format)]
+    elif isinstance(construct, RAW_ADAPTERS):
+        return get_layout(construct.subcon, path)
+    elif isinstance(construct, Bytes) and isinstance(construct.length, int):
+        return [(path, f"{construct.length}s")]
+    elif isinstance(construct, Padded) and construct.subcon is Pass:
+        if not isinstance(construct.length, int):
+            return None
+        return [(None, f"{construct.length}x")]
+    elif isinstance(construct, Array) and isinstance(construct.count, int):
+        layout = []
+        for index in range(construct.count):
+            item_layout = get_layout(construct.subcon, _join_path(path, str(index)))
+            if item_layout is None:
+                return None
+            layout.extend(item_layout)
+        return layout
+    elif isinstance(construct, Struct):
+        layout = []
+        for subcon in construct.subcons:
+            subcon_layout = get_layout(subcon, _join_path(path, subcon.name))
+            if subcon_layout is None:
+                return None
+            layout.extend(subcon_layout)
+        return layout
+    return None
+
+
+def has_field(construct: Construct, path: str) -> bool:
+    """Determines if a structure may hold a field.
+
+    Note:
+        Only named fields of structures and items of fixed size arrays are checked,
+        any other (such as optional or repeated) structure may hold any field.
+
+    Args:
+        construct (Construct): The structure
+        path (str): The path of the field
+
+    Returns:
+        bool: False if the structure cannot hold the field
+    """
+
+    for name in path.split(".") if len(path) > 0 else []:
+        while isinstance(construct, (Renamed,) + RAW_ADAPTERS):
+            construct = construct.subcon
+        if isinstance(construct, Struct):
+            subcons = [subcon for subcon in construct.subcons if subcon.name == name]
+            if len(subcons) <= 0:
+                return False
+            construct = subcons[0]
+        elif isinstance(construct, Array) and isinstance(construct.count, int):
+            if not name.isdigit() or int(name) >= construct.count:
+                return False
+            construct = construct.subcon
+        elif isinstance(construct, (Bytes, Padded, FormatField, StringEncoded)):
+            return False
+        else:
+            return True
+    return True
+
+
+def _iter_definitions(
+    collection: SubrecordCollection, subrecord_type: str
+) -> Iterable[Subrecord]:
+    """Iterates over the definitions of a subrecord type within a collection.
+
+    Args:
+        collection (SubrecordCollection): The collection of a record type
+        subrecord_type (str): The uppercase subrecord type
+
+    Yields:
+        Subrecord: Each definition of the subrecord type
+    """
+
+    for item in collection.items:
+        if isinstance(item, Subrecord):
+            if item.name == subrecord_type:
+                yield item
+        else:
+            yield from _iter_definitions(item, subrecord_type)
+
+
+def _get_value(value: Any, path: str) -> Any:
+    """Gets a field of a parsed value.
+
+    Args:
+        value (Any): The parsed value of a subrecord
+        path (str): The path of the field
+
+    Raises:
+        ValueError: If the field does not exist
+
+    Returns:
+        Any: The value of the field (the integer of form ids)
+    """
+
+    for name in path.split(".") if len(path) > 0 else []:
+        try:
+            value = value[int(name)] if isinstance(value, list) else value[name]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise ValueError(f"field {path!r} does not exist in {value!r}")
+    return value.form_id if isinstance(value, FormID) else value
+
+
+class _SubrecordColumns(object):
+    """The columns exported from the subrecords of a single subrecord type.
+    """
+
+    def __init__(
+        self,
+        collection: SubrecordCollection,
+        subrecord_type: str,
+        paths: List[str],
+        count: int,
+    ):
+        """Creates the (preallocated) columns of a subrecord type.
+
+        Args:
+            collection (SubrecordCollection): The collection of the record type
+            subrecord_type (str): The uppercase subrecord type
+            paths (List[str]): The paths of the fields to export
+            count (int): The number of exported records
+
+        Raises:
+            ValueError: If the subrecord type is not defined by the collection, or
+                a field of a fixed layout subrecord does not exist
+        """
+
+        definitions = list(_iter_definitions(collection, subrecord_type))
+        if len(definitions) <= 0:
+            raise ValueError(
+                f"subrecord {subrecord_type!r} is not defined by "
+                f"{collection.name!r}"
+            )
+
+        (self.subrecord_type, self.paths, self.count) = (subrecord_type, paths, count)
+        self.definition = definitions[0]
+        # NOTE: subrecord types defined more than once (with different structures)
+        # are discovered by the names of the subrecords preceeding them
+        self.needs_discovery = any(
+            definition.struct is not self.definition.struct
+            for definition in definitions[1:]
+        )
+
+        self.layout = get_layout(self.definition.struct)
+        if self.needs_discovery and any(
+            get_layout(definition.struct) != self.layout
+            for definition in definitions[1:]
+        ):
+            self.layout = None
+
+        if self.layout is None:
+            for path in paths:
+                if not any(
+                    has_field(definition.struct, path) for definition in definitions
+                ):
+                    raise ValueError(
+                        f"field {_field_name(subrecord_type, path)!r} does not exist"
+                    )
+            self.values = {path: [None] * count for path in paths}
+            return
+
+        self.format = "<" + "".join(field_format for (_, field_format) in self.layout)
+        self.size = struct.calcsize(self.format)
+        self.buffer = bytearray(self.size * count)
+        (self.offsets, self.indexes) = ({}, {})
+        (offset, index) = (0, 0)
+        for (path, field_format) in self.layout:
+            if path is not None:
+                self.offsets[path] = (offset, field_format)
+                self.indexes[path] = index
+                index += 1
+            offset += struct.calcsize("<" + field_format)
+
+        for path in paths:
+            if path not in self.offsets:
+                raise ValueError(
+                    f"field {_field_name(subrecord_type, path)!r} does not exist (or "
+                    "is not a single value)"
+                )
+
+    def handle(
+        self,
+        record_index: int,
+        subrecord_data: bytes,
+        working_record: List[str],
+        collection: SubrecordCollection,
+    ) -> bool:
+        """Exports the fields of a subrecord.
+
+        Args:
+            record_index (int): The index of the subrecord's record
+            subrecord_data (bytes): The data of the subrecord
+            working_record (List[str]): The names of the preceeding subrecords
+            collection (SubrecordCollection): The collection of the record type
+
+        Returns:
+            bool: False if the subrecord could not be parsed
+        """
+
+        if self.layout is not None:
+            # NOTE: shorter (older) layouts leave their missing fields zeroed
+            data = subrecord_data[: self.size]
+            offset = record_index * self.size
+            self.buffer[offset : offset + len(data)] = data
+            return True
+
+        try:
+            if self.needs_discovery:
+                (parsed, _) = collection.handle_working(
+                    self.subrecord_type, subrecord_data, working_record
+                )
+                value = parsed.value
+            else:
+                value = self.definition.struct.parse(subrecord_data)
+        except Exception:
+            return False
+
+        for path in self.paths:
+            try:
+                self.values[path][record_index] = _get_value(value, path)
+            except ValueError:
+                # NOTE: subrecords which could not be discovered are not handled
+                pass
+        return True
+
+    def get_columns(self) -> Dict[str, Any]:
+        """Gets the exported columns.
+
+        Returns:
+            Dict[str, Any]: The column of each field path (NumPy arrays if NumPy is
+                available, otherwise lists)
+        """
+
+        if self.layout is None:
+            if numpy is None:
+                return self.values
+            columns = {}
+            for (path, values) in self.values.items():
+                columns[path] = numpy.empty(self.count, dtype=object)
+                columns[path][:] = values
+            return columns
+
+        if numpy is None:
+            rows = list(struct.iter_unpack(self.format, self.buffer))
+            return {
+                path: [row[self.indexes[path]] for row in rows] for path in self.paths
+            }
+
+        dtype = numpy.dtype(
+            {
+                "names": self.paths,
+                "formats": [
+                    (
+                        f"S{self.offsets[path][1][:-1]}"
+                        if self.offsets[path][1].endswith("s")
+                        else "<" + FIELD_TYPES[self.offsets[path][1]]
+                    )
+                    for path in self.paths
+                ],
+                "offsets": [self.offsets[path][0] for path in self.paths],
+                "itemsize": self.size,
+            }
+        )
+        # NOTE: the preallocated buffer is viewed as is, not copied
+        rows = numpy.frombuffer(self.buffer, dtype=dtype, count=self.count)
+        return {path: rows[path] for path in self.paths}
+
+
+def export_columns(
+    plugin: BasePlugin,
+    record_type: str,
+    fields: Iterable[str],
+    where: Callable[[RecordHeader], bool] = None,
+    as_dict: bool = False,
+) -> T_Columns:
+    """Exports fields of the records of a type as columns in one batched pass.
+
+    Fields are given as a subrecord type followed by the (dotted) path of a field
+    within its structure, such as ``DATA.base_damage`` (or just ``EDID`` for
+    subrecords holding a single value).
+    A ``form_id`` column holding the form id of each record is always exported
+    first, the columns of fields are named by their paths (with an uppercase
+    subrecord type).
+
+    Subrecords with a fixed layout (see :func:`get_layout`) are not parsed, their
+    data is copied into a preallocated buffer which is viewed as a
+    `NumPy <https://numpy.org>`_ structured array, so their fields are exported as
+    numeric columns (enums, flags and form ids as their underlying integers).
+    Fields of other subrecords are parsed and exported as object columns.
+
+    Note:
+        Only the first subrecord of each type within a record is exported.
+        Fields of records missing a subrecord are zero (or None for object
+        columns).
+        Without NumPy, columns are returned as a dictionary of lists.
+
+    Args:
+        plugin (BasePlugin): The plugin to export records from
+        record_type (str): The type of the records to export
+        fields (Iterable[str]): The paths of the fields to export
+        where (Callable[[RecordHeader], bool], optional): Defaults to None. A
+            predicate records' headers must pass
+        as_dict (bool, optional): Defaults to False. Returns a dictionary of columns
+            instead of a structured array
+
+    Raises:
+        ValueError: If the record type or a subrecord type is not defined, or a
+            field does not exist
+
+    Returns:
+        T_Columns: A structured array (or dictionary) of the exported columns
+
+    Example:
+        >>> plugin = bethesda_structs.plugin.get_plugin("FalloutNV.esm")
+        >>> weapons = export_columns(
+        ...     plugin, "WEAP", ["DATA.base_damage", "DATA.weight", "DNAM.reach"]
+        ... )
+        >>> weapons["DATA.base_damage"].mean()
+        24.71...
+    """
+
+    collection = plugin.get_record_collection(record_type)
+    if collection is None:
+        raise ValueError(f"record type {record_type!r} is not defined")
+
+    record_type = record_type.upper().encode("ascii")
+    headers = [
+        header
+        for header in plugin.iter_record_headers(plugin.content)
+        if header.type == record_type and (where is None or where(header))
+    ]
+
+    subrecord_paths: Dict[str, List[str]] = {}
+    for field in fields:
+        (subrecord_type, _, path) = field.partition(".")
+        paths = subrecord_paths.setdefault(subrecord_type.upper(), [])
+        if path not in paths:
+            paths.append(path)
+    subrecord_columns = {
+        subrecord_type: _SubrecordColumns(
+            collection, subrecord_type, paths, len(headers)
+        )
+        for (subrecord_type, paths) in subrecord_paths.items()
+    }
+
+    for (record_index, header) in enumerate(headers):
+        (working_record, exported) = ([], set())
+        for (subrecord_type, subrecord_data) in plugin.iter_subrecord_data(
+            plugin.read_record_data(plugin.content, header)
+        ):
+            subrecord_type = subrecord_type.upper()
+            columns = subrecord_columns.get(subrecord_type)
+            if columns is not None and subrecord_type not in exported:
+                exported.add(subrecord_type)
+                if not columns.handle(
+                    record_index, subrecord_data, working_record, collection
+                ):
+                    break
+                if len(exported) == len(subrecord_columns):
+                    break
+            working_record.append(subrecord_type)
+
+    form_ids = [header.form_id for header in headers]
+    columns = {"form_id": form_ids}
+    if numpy is not None:
+        columns["form_id"] = numpy.array(form_ids, dtype=numpy.uint32)
+    for (subrecord_type, paths) in subrecord_paths.items():
+        subrecord_values = subrecord_columns[subrecord_type].get_columns()
+        for path in paths:
+            columns[_field_name(subrecord_type, path)] = subrecord_values[path]
+
+    if as_dict or numpy is None:
+        return columns
+
+    array = numpy.empty(
+        len(headers),
+        dtype=[(name, column.dtype) for (name, column) in columns.items()],
+    )
+    for (name, column) in columns.items():
+        array[name] = column
+    return array
@@ -0,0 +1,404 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import array
+import hashlib
+from typing import Dict, List, Tuple, Optional, Generator, NamedTuple
+
+import attr
+from construct import Container
+
+from ._common import BasePlugin, RecordHeader
+
+DIGEST_SIZE = 8
+"""The size of the digests records are compared by.
+"""
+
+OWN_FORMS_INDEX = 0x400
+"""The normalized master index of a plugin's own forms (above any master index).
+"""
+
+STATUS_ADDED = "added"
+STATUS_REMOVED = "removed"
+STATUS_CHANGED = "changed"
+
+
+class SubrecordChange(NamedTuple):
+    """The occurrences of a subrecord type which differ between two records.
+    """
+
+    type: str
+    old: List[Container]
+    new: List[Container]
+
+
+@attr.s
+class RecordChange(object):
+    """A record which was added, removed or changed between two plugin versions.
+    """
+
+    status = attr.ib(type=str)
+    """The kind of change (``added``, ``removed`` or ``changed``).
+
+    Returns:
+        str: The kind of change
+    """
+
+    record_type = attr.ib(type=str)
+    """The type of the record.
+
+    Returns:
+        str: The type of the record
+    """
+
+    form_id = attr.ib(type=int)
+    """The form id of the record (local to the new plugin, or the old plugin for
+    removed records).
+
+    Returns:
+        int: The form id of the record
+    """
+
+    master = attr.ib(type=Optional[str])
+    """The master the form belongs to.
+
+    Returns:
+        Optional[str]: The master the form belongs to, None for the plugin's own
+            forms
+    """
+
+    old_header = attr.ib(type=Optional[RecordHeader], default=None, repr=False)
+    """The header of the record in the old plugin.
+
+    Returns:
+        Optional[RecordHeader]: The old header, None for added records
+    """
+
+    new_header = attr.ib(type=Optional[RecordHeader], default=None, repr=False)
+    """The header of the record in the new plugin.
+
+    Returns:
+        Optional[RecordHeader]: The new header, None for removed records
+    """
+
+
+@attr.s
+class _RecordDigests(object):
+    """The digests of all records of a plugin, sorted by normalized form id.
+    """
+
+    masters = attr.ib(type=List[str])
+    keys = attr.ib(type=List[int], repr=False)
+    offsets = attr.ib(type=array.array, repr=False)
+    digests = attr.ib(type=array.array, repr=False)
+
+
+@attr.s
+class PluginDiff(object):
+    """A record level diff between two versions of a plugin.
+
+    Both plugins are read in a single sequential pass over their record headers,
+    hashing each record's raw (possibly compressed) data along with its type and
+    flags.
+    Records are then joined by form id through a merge of the two sorted digest
+    lists, so only the digests, offsets and form ids of records are kept in memory
+    (never their content).
+    Subrecords are only parsed for records whose digests differ (see
+    :func:`~PluginDiff.diff_subrecords`).
+
+    Note:
+        Form ids are normalized by the name of the master they belong to, so
+        records still match if the masters of the plugin were reordered.
+        Version control info (revision and version) is ignored.
+
+    Example:
+        >>> with get_plugin("/home/username/Backup/MyMod.esp") as old, get_plugin(
+        ...     "/home/username/Data/MyMod.esp"
+        ... ) as new:
+        ...     diff = PluginDiff(old, new)
+        ...     [(change.status, change.record_type) for change in diff.iter_changes()]
+        [('changed', 'WEAP'), ('added', 'MISC')]
+    """
+
+    old = attr.ib(type=BasePlugin)
+    """The old version of the plugin.
+
+    Returns:
+        BasePlugin: The old version of the plugin
+    """
+
+    new = attr.ib(type=BasePlugin)
+    """The new version of the plugin.
+
+    Returns:
+        BasePlugin: The new version of the plugin
+    """
+
+    def __attrs_post_init__(self):
+        self._old_digests = self._read_digests(self.old)
+        self._new_digests = self._read_digests(self.new, self._old_digests.masters)
+
+    @property
+    def old_masters(self) -> List[str]:
+        """The masters of the old version of the plugin.
+
+        Returns:
+            List[str]: The masters of the old version
+        """
+
+        return self._old_digests.masters
+
+    @property
+    def new_masters(self) -> List[str]:
+        """The masters of the new version of the plugin.
+
+        Returns:
+            List[str]: The masters of the new version
+        """
+
+        return self._new_digests.masters
+
+    @staticmethod
+    def _read_digests(
+        plugin: BasePlugin, other_masters: List[str] = None
+    ) -> _RecordDigests:
+        """Hashes the records of a plugin in one pass over its record headers.
+
+        Args:
+            plugin (BasePlugin): The plugin to hash the records of
+            other_masters (List[str], optional): Defaults to None. The masters of the
+                already read version of the plugin, whose master indexes the form ids
+                are normalized to
+
+        Raises:
+            ValueError: If the plugin does not start with a header record or a record
+                or group is truncated
+
+        Returns:
+            _RecordDigests: The digests of the plugin's records
+        """
+
+        content = plugin.content
+        header_size = plugin.record_header_struct.size
+        record_headers = plugin.iter_record_headers(content)
+        header = next(record_headers, None)
+        if header is None or header.type != b"TES4":
+            raise ValueError("content does not start with a TES4 header record")
+        masters = plugin._read_masters(content, header)
+
+        # NOTE: master indexes are normalized to the masters of the first plugin
+        # read (followed by masters only this plugin has)
+        owners = [master.lower() for master in (other_masters or masters)]
+        owner_indexes = {owner: index for (index, owner) in enumerate(owners)}
+        for master in masters:
+            owner_indexes.setdefault(master.lower(), len(owner_indexes))
+        remap = [owner_indexes[master.lower()] for master in masters]
+
+        keys = []
+        offsets = array.array("Q")
+        digests = array.array("Q")
+        view = memoryview(content)
+        try:
+            for (position, record_header) in enumerate(record_headers):
+                master_index = record_header.form_id >> 24
+                owner = (
+                    remap[master_index]
+                    if master_index < len(remap)
+                    else OWN_FORMS_INDEX
+                )
+                keys.append(
+                    (((owner << 24) | (record_header.form_id & 0xFFFFFF)) << 32)
+                    | position
+                )
+
+                # NOTE: only the type, flags and data are hashed, the version
+                # control info of records is ignored
+                offset = record_header.offset
+                data_offset = offset + header_size
+                hasher = hashlib.blake2b(
+                    view[offset : offset + 4], digest_size=DIGEST_SIZE
+                )
+                hasher.update(view[offset + 8 : offset + 12])
+                hasher.update(view[data_offset : data_offset + record_header.data_size])
+                offsets.append(offset)
+                digests.append(int.from_bytes(hasher.digest(), "little"))
+        finally:
+            view.release()
+
+        keys.sort()
+        return _RecordDigests(masters, keys, offsets, digests)
+
+    def _build_change(
+        self,
+        status: str,
+        old_position: Optional[int] = None,
+        new_position: Optional[int] = None,
+    ) -> RecordChange:
+        """Builds the change of a record from its positions in the plugins.
+
+        Args:
+            status (str): The kind of change
+            old_position (Optional[int], optional): Defaults to None. The position of
+                the record in the old plugin
+            new_position (Optional[int], optional): Defaults to None. The position of
+                the record in the new plugin
+
+        Returns:
+            RecordChange: The change of the record
+        """
+
+        (old_header, new_header) = (None, None)
+        if old_position is not None:
+            old_header = self._header_at(
+                self.old, self._old_digests.offsets[old_position]
+            )
+        if new_position is not None:
+            new_header = self._header_at(
+                self.new, self._new_digests.offsets[new_position]
+            )
+
+        (header, masters) = (new_header, self.new_masters)
+        if header is None:
+            (header, masters) = (old_header, self.old_masters)
+        master_index = header.form_id >> 24
+        return RecordChange(
+            status,
+            header.type.decode("ascii", errors="replace"),
+            header.form_id,
+            masters[master_index] if master_index < len(masters) else None,
+            old_header=old_header,
+            new_header=new_header,
+        )
+
+    @staticmethod
+    def _header_at(plugin: BasePlugin, offset: int) -> RecordHeader:
+        """Reads the header of a record at a given offset.
+
+        Args:
+            plugin (BasePlugin): The plugin containing the record
+            offset (int): The offset of the record
+
+        Returns:
+            RecordHeader: The header of the record
+        """
+
+        (record_type, data_size, flags, form_id, *_) = (
+            plugin.record_header_struct.unpack_from(plugin.content, offset)
+        )
+        return RecordHeader(record_type, data_size, flags, form_id, offset)
+
+    def iter_changes(self) -> Generator[RecordChange, None, None]:
+        """Iterates over the records which differ between the plugins.
+
+        Yields:
+            RecordChange: The added, removed and changed records (in order of their
+                normalized form ids)
+        """
+
+        (old_keys, new_keys) = (self._old_digests.keys, self._new_digests.keys)
+        (old_digests, new_digests) = (
+            self._old_digests.digests,
+            self._new_digests.digests,
+        )
+        (old_index, new_index) = (0, 0)
+        while old_index < len(old_keys) or new_index < len(new_keys):
+            old_form_id = new_form_id = None
+            if old_index < len(old_keys):
+                old_form_id = old_keys[old_index] >> 32
+            if new_index < len(new_keys):
+                new_form_id = new_keys[new_index] >> 32
+
+            if new_form_id is None or (
+                old_form_id is not None and old_form_id < new_form_id
+            ):
+                yield self._build_change(
+                    STATUS_REMOVED, old_position=(old_keys[old_index] & 0xFFFFFFFF)
+                )
+                old_index += 1
+            elif old_form_id is None or new_form_id < old_form_id:
+                yield self._build_change(
+                    STATUS_ADDED, new_position=(new_keys[new_index] & 0xFFFFFFFF)
+                )
+                new_index += 1
+            else:
+                old_position = old_keys[old_index] & 0xFFFFFFFF
+                new_position = new_keys[new_index] & 0xFFFFFFFF
+                if old_digests[old_position] != new_digests[new_position]:
+                    yield self._build_change(
+                        STATUS_CHANGED,
+                        old_position=old_position,
+                        new_position=new_position,
+                    )
+                old_index += 1
+                new_index += 1
+
+    def get_summary(self) -> Dict[str, int]:
+        """Counts the changes of each kind.
+
+        Returns:
+            Dict[str, int]: The number of added, removed and changed records
+        """
+
+        summary = {STATUS_ADDED: 0, STATUS_REMOVED: 0, STATUS_CHANGED: 0}
+        for change in self.iter_changes():
+            summary[change.status] += 1
+        return summary
+
+    def parse_change(
+        self, change: RecordChange
+    ) -> Tuple[Optional[Container], Optional[Container]]:
+        """Parses both versions of a changed record.
+
+        Args:
+            change (RecordChange): The change to parse the records of
+
+        Returns:
+            Tuple[Optional[Container], Optional[Container]]: A tuple of (old record,
+                new record), None for the missing side of added or removed records
+        """
+
+        (old_record, new_record) = (None, None)
+        if change.old_header is not None:
+            old_record = self.old.parse_record(self.old.content, change.old_header)
+        if change.new_header is not None:
+            new_record = self.new.parse_record(self.new.content, change.new_header)
+        return (old_record, new_record)
+
+    def diff_subrecords(self, change: RecordChange) -> List[SubrecordChange]:
+        """Determines which subrecords of a changed record differ.
+
+        Note:
+            Subrecords are matched by their type and occurrence, a record whose data
+            was only recompressed has no differing subrecords.
+
+        Args:
+            change (RecordChange): The change to diff the subrecords of
+
+        Returns:
+            List[SubrecordChange]: The differing subrecord types (in order of their
+                first occurrence)
+        """
+
+        def group_subrecords(record: Container) -> Dict[str, List[Container]]:
+            grouped = {}
+            for subrecord in record.subrecords if record is not None else []:
+                grouped.setdefault(subrecord.type, []).append(subrecord)
+            return grouped
+
+        (old_record, new_record) = self.parse_change(change)
+        (old_grouped, new_grouped) = (
+            group_subrecords(old_record),
+            group_subrecords(new_record),
+        )
+
+        changes = []
+        for subrecord_type in {**old_grouped, **new_grouped}:
+            (old, new) = (
+                old_grouped.get(subrecord_type, []),
+                new_grouped.get(subrecord_type, []),
+            )
+            if [subrecord.data for subrecord in old] != [
+                subrecord.data for subrecord in new
+            ]:
+                changes.append(SubrecordChange(subrecord_type, old, new))
+        return changes
@@ -3,7 +3,11 @@
 
 import io
 import os
-from typing import List, Generator
+import mmap
+import zlib
+import struct
+import itertools
+from typing import Set, List, Tuple, Callable, Iterable, Generator
 
 from construct import (
     If,
@@ -28,12 +32,19 @@ from construct import (
     GreedyBytes,
     GreedyRange,
     PaddedString,
+    ListContainer,
 )
 from multidict import CIMultiDict
 
 from ._common import FNVFormID
 from .records import RecordMapping
-from .._common import BasePlugin
+from .._common import (
+    BasePlugin,
+    RecordHeader,
+    FormScanReport,
+    SubrecordCollection,
+)
+from ..._common import SNIFF_SIZE, T_Content
 
 
 class FNVPlugin(BasePlugin):
@@ -71,45 +82,51 @@ class FNVPlugin(BasePlugin):
         :class:`~construct.core.Struct`: The structure of FO3/FNV subrecords
     """
 
+    record_flags_struct = FlagsEnum(
+        Int32ul,
+        master=0x00000001,
+        _unknown_0=0x00000002,
+        _unknown_1=0x00000004,
+        _unknown_2=0x00000008,
+        form_initialized=0x00000010,
+        deleted=0x00000020,
+        constant=0x00000040,
+        fire_disabled=0x00000080,
+        inaccessible=0x00000100,
+        casts_shadows=0x00000200,
+        persistent=0x00000400,
+        initially_disabled=0x00000800,
+        ignored=0x00001000,
+        no_voice_filter=0x00002000,
+        cannot_save=0x00004000,
+        visible_when_distant=0x00008000,
+        random_anim_start=0x00010000,
+        dangerous=0x00020000,
+        compressed=0x00040000,
+        cant_wait=0x00080000,
+        _unknown_3=0x00100000,
+        _unknown_4=0x00200000,
+        _unknown_5=0x00400000,
+        _unknown_6=0x00800000,
+        destructible=0x01000000,
+        obstacle=0x02000000,
+        navmesh_filter=0x04000000,
+        navmesh_box=0x08000000,
+        non_pipboy=0x10000000,
+        child_can_use=0x20000000,
+        navmesh_ground=0x40000000,
+        _unknown_7=0x80000000,
+    )
+    """The structure for FO3/FNV record flags.
+
+    Returns:
+        :class:`~construct.core.FlagsEnum`: The structure of FO3/FNV record flags
+    """
+
     record_struct = Struct(
         "type" / PaddedString(4, "utf8"),
         "data_size" / Int32ul,
-        "flags"
-        / FlagsEnum(
-            Int32ul,
-            master=0x00000001,
-            _unknown_0=0x00000002,
-            _unknown_1=0x00000004,
-            _unknown_2=0x00000008,
-            form_initialized=0x00000010,
-            deleted=0x00000020,
-            constant=0x00000040,
-            fire_disabled=0x00000080,
-            inaccessible=0x00000100,
-            casts_shadows=0x00000200,
-            persistent=0x00000400,
-            initially_disabled=0x00000800,
-            ignored=0x00001000,
-            no_voice_filter=0x00002000,
-            cannot_save=0x00004000,
-            visible_when_distant=0x00008000,
-            random_anim_start=0x00010000,
-            dangerous=0x00020000,
-            compressed=0x00040000,
-            cant_wait=0x00080000,
-            _unknown_3=0x00100000,
-            _unknown_4=0x00200000,
-            _unknown_5=0x00400000,
-            _unknown_6=0x00800000,
-            destructible=0x01000000,
-            obstacle=0x02000000,
-            navmesh_filter=0x04000000,
-            navmesh_box=0x08000000,
-            non_pipboy=0x10000000,
-            child_can_use=0x20000000,
-            navmesh_ground=0x40000000,
-            _unknown_7=0x80000000,
-        ),
+        "flags" / record_flags_struct,
         "id" / Int32ul,
         "revision" / Int32ul,
         "version" / Int16ul,
@@ -216,10 +233,23 @@ class FNVPlugin(BasePlugin):
         :class:`~construct.core.Struct`: The structure of FO3/FNV plugins
     """
 
+    record_header_struct = struct.Struct("<4sIIIIHH")
+    """The fixed size header shared by FO3/FNV records and groups.
+
+    Returns:
+        :class:`struct.Struct`: The structure of FO3/FNV record and group headers
+    """
+
+    compressed_flag = 0x00040000
+    """The record flag of records whose data is zlib compressed.
+
+    Returns:
+        int: The compressed record flag
+    """
+
     # NOTE: working record is mangaled in order to protect state during
     # subrecord parsing for record state
     __working_record = {}
-    __only_parse_record_types: List[str] = []
 
     @classmethod
     def can_handle(cls, filepath: str) -> bool:
@@ -228,50 +258,573 @@ class FNVPlugin(BasePlugin):
         Args:
             filepath (str): The filepath to evaluate
 
+        Returns:
+            bool: True if file can be handled, otherwise False (also when the file
+                does not exist)
+        """
+
+        if not os.path.isfile(filepath):
+            return False
+
+        with open(filepath, "rb") as stream:
+            return cls.can_handle_header(stream.read(SNIFF_SIZE))
+
+    @classmethod
+    def can_handle_header(cls, header: bytes) -> bool:
+        """Determines if a file can be handled given its leading bytes.
+
+        Note:
+            Only the fixed size header of the leading ``TES4`` record is looked at,
+            the record itself is not parsed.
+
+        Args:
+            header (bytes): The leading bytes of the file
+
+        Returns:
+            bool: True if the file can be handled, otherwise False
+        """
+
+        return (
+            len(header) >= 22
+            and header[:4] == b"TES4"
+            and struct.unpack_from("<H", header, 20)[0] == 15
+        )
+
+    @classmethod
+    def parse_header(cls, filepath: str) -> Container:
+        """Parses the header record of a given file.
+
+        Note:
+            Only the header record is read from the file, and only its ``HEDR``
+            subrecord is parsed (the ``parsed`` value of all other subrecords is
+            None).
+
+        Args:
+            filepath (str): The path of the plugin
+
+        Raises:
+            FileNotFoundError: When the given `filepath` cannot be found
+            ValueError: If the file does not start with a header record or the
+                header record is truncated
+
+        Returns:
+            Container: The parsed header record
+        """
+
+        (content, header) = cls._read_header_record(filepath)
+        return cls._parse_record(
+            content, header, subrecord_types={"HEDR"}, include_skipped=True
+        )
+
+    @classmethod
+    def iter_record_headers(
+        cls, content: T_Content
+    ) -> Generator[RecordHeader, None, None]:
+        """Iterates over the headers of all records, skipping the records' data.
+
+        Note:
+            Groups are entered by stepping over their header, so every record
+            (including the leading header record) is visited in one sequential pass
+            over the content without parsing any subrecords or decompressing any
+            data.
+
+        Args:
+            content (T_Content): The byte content (or memory map) of the plugin
+
+        Raises:
+            ValueError: If a record or group is truncated
+
+        Yields:
+            RecordHeader: The header of each record (in order of the content)
+        """
+
+        unpack_from = cls.record_header_struct.unpack_from
+        header_size = cls.record_header_struct.size
+        (offset, content_size) = (0, len(content))
+        while offset < content_size:
+            if (content_size - offset) < header_size:
+                raise ValueError(f"truncated record header at offset {offset!r}")
+            (record_type, data_size, flags, form_id, *_) = unpack_from(content, offset)
+            if record_type == b"GRUP":
+                if data_size < header_size or (offset + data_size) > content_size:
+                    raise ValueError(f"truncated group at offset {offset!r}")
+                offset += header_size
+                continue
+
+            data_offset = offset + header_size
+            if (data_offset + data_size) > content_size:
+                raise ValueError(f"truncated record at offset {offset!r}")
+            yield RecordHeader(record_type, data_size, flags, form_id, offset)
+            offset = data_offset + data_size
+
+    @classmethod
+    def _read_masters(cls, content: T_Content, header: RecordHeader) -> List[str]:
+        """Reads the masters of a plugin from its header record's subrecords.
+
+        Args:
+            content (T_Content): The byte content (or memory map) of the plugin
+            header (RecordHeader): The header of the plugin's header record
+
+        Raises:
+            ValueError: If a subrecord of the header record is truncated
+
+        Returns:
+            List[str]: The masters of the plugin (in order)
+        """
+
+        masters = []
+        offset = header.offset + cls.record_header_struct.size
+        data_end = offset + header.data_size
+        large_size = None
+        while (offset + 6) <= data_end:
+            (subrecord_type, data_size) = struct.unpack_from("<4sH", content, offset)
+            offset += 6
+            if large_size is not None:
+                # NOTE: ``XXXX`` subrecords hold the size of the following subrecord
+                (data_size, large_size) = (large_size, None)
+            if (offset + data_size) > data_end or (
+                subrecord_type == b"XXXX" and data_size < 4
+            ):
+                raise ValueError(
+                    f"subrecord {subrecord_type!r} of the header record is truncated"
+                )
+
+            if subrecord_type == b"XXXX":
+                large_size = struct.unpack_from("<I", content, offset)[0]
+            elif subrecord_type == b"MAST":
+                masters.append(
+                    bytes(content[offset : offset + data_size])
+                    .rstrip(b"\x00")
+                    .decode("utf8", errors="replace")
+                )
+            offset += data_size
+        return masters
+
+    @classmethod
+    def _read_header_record(cls, filepath: str) -> Tuple[bytes, RecordHeader]:
+        """Reads only the leading header record of a plugin file.
+
+        Args:
+            filepath (str): The path of the plugin
+
         Raises:
             FileNotFoundError: When the given `filepath` cannot be found
+            ValueError: If the file does not start with a header record or the
+                header record is truncated
 
         Returns:
-            bool: True if file can be handled, otherwise False
+            Tuple[bytes, RecordHeader]: A tuple of (header record content, header)
         """
 
         if not os.path.isfile(filepath):
             raise FileNotFoundError(f"file {filepath!r} does not exist")
 
-        cls.__only_parse_record_types = []
-        header = cls.record_struct.parse_file(filepath)
+        header_size = cls.record_header_struct.size
+        with open(filepath, "rb") as stream:
+            content = stream.read(header_size)
+            if len(content) < header_size or content[:4] != b"TES4":
+                raise ValueError(
+                    f"{filepath!r} does not start with a TES4 header record"
+                )
+            (_, data_size, flags, form_id, *_) = cls.record_header_struct.unpack(
+                content
+            )
+            content += stream.read(data_size)
+
+        if len(content) < (header_size + data_size):
+            raise ValueError(f"header record of {filepath!r} is truncated")
+        return (content, RecordHeader(b"TES4", data_size, flags, form_id, 0))
 
-        # NOTE: must clear class working record after every "full" file parse
-        # otherwise, subsequent parses will have fragmented data when trying to discover
-        # and parse subrecords
-        cls.__working_record = {}
-        return header.type == "TES4" and header.version == 15
-    
     @classmethod
-    def parse_header(cls, filepath: str) -> bool:
-        """Determines if a given file can be handled by the plugin.
+    def read_masters(cls, filepath: str) -> List[str]:
+        """Reads the masters of a plugin file from its header record only.
+
+        Note:
+            Only the leading header record is read from the file, which makes this
+            suitable for building the masters of entire load orders.
 
         Args:
-            filepath (str): The filepath to evaluate
+            filepath (str): The path of the plugin
+
+        Raises:
+            FileNotFoundError: When the given `filepath` cannot be found
+            ValueError: If the file does not start with a header record or the
+                header record is truncated
+
+        Returns:
+            List[str]: The masters of the plugin (in order)
+        """
+
+        (content, header) = cls._read_header_record(filepath)
+        return cls._read_masters(content, header)
+
+    @classmethod
+    def scan_content(cls, content: T_Content) -> FormScanReport:
+        """Counts the forms a plugin defines by scanning its record headers.
+
+        A record is a new form if the master index (the highest byte) of its form id
+        is the plugin's own index, which is the number of its masters.
+        Only the header record's subrecords are read, all other records are skipped
+        (see :func:`~FNVPlugin.iter_record_headers`).
+
+        Args:
+            content (T_Content): The byte content (or memory map) of the plugin
+
+        Raises:
+            ValueError: If the content does not start with a header record or a
+                record or group is truncated
+
+        Returns:
+            FormScanReport: The summary of the scan
+        """
+
+        record_headers = cls.iter_record_headers(content)
+        header = next(record_headers, None)
+        if header is None or header.type != b"TES4":
+            raise ValueError("content does not start with a TES4 header record")
+
+        report = FormScanReport(masters=cls._read_masters(content, header))
+        plugin_index = report.plugin_index
+        new_form_types = {}
+        for record_header in record_headers:
+            report.records += 1
+            form_id = record_header.form_id
+            if (form_id >> 24) != plugin_index:
+                continue
+
+            report.new_forms += 1
+            new_form_types[record_header.type] = (
+                new_form_types.get(record_header.type, 0) + 1
+            )
+            if report.min_form_id is None or form_id < report.min_form_id:
+                report.min_form_id = form_id
+            if report.max_form_id is None or form_id > report.max_form_id:
+                report.max_form_id = form_id
+
+        report.new_form_types = {
+            record_type.decode("ascii", errors="replace"): count
+            for (record_type, count) in new_form_types.items()
+        }
+        return report
+
+    @classmethod
+    def scan_forms(cls, filepath: str) -> FormScanReport:
+        """Counts the forms a plugin file defines by scanning its record headers.
+
+        Note:
+            The file is memory mapped, so only the pages holding record headers are
+            read from disk (see :func:`~FNVPlugin.scan_content`).
+
+        Args:
+            filepath (str): The path of the plugin
 
         Raises:
             FileNotFoundError: When the given `filepath` cannot be found
+            ValueError: If the file is not a plugin or a record or group is truncated
 
         Returns:
-            bool: True if file can be handled, otherwise False
+            FormScanReport: The summary of the scan
+
+        Example:
+            >>> report = FNVPlugin.scan_forms("/home/username/Data/MyMod.esp")
+            >>> (report.new_forms, hex(report.min_form_id), hex(report.max_form_id))
+            (12, '0x1000800', '0x100080b')
         """
 
         if not os.path.isfile(filepath):
             raise FileNotFoundError(f"file {filepath!r} does not exist")
 
-        cls.__only_parse_record_types = ["HEDR"]
-        header = cls.record_struct.parse_file(filepath)
+        with open(filepath, "rb") as stream:
+            try:
+                content = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return cls.scan_content(stream.read())
+            with content:
+                return cls.scan_content(content)
+
+    @classmethod
+    def parse_record(cls, content: T_Content, header: RecordHeader) -> Container:
+        """Parses a single record (and its subrecords) given its header.
+
+        Note:
+            Compressed records are inflated to the decompressed size their data is
+            prefixed with (see :func:`~FNVPlugin.read_record_data`).
+
+        Args:
+            content (T_Content): The byte content (or memory map) of the plugin
+            header (RecordHeader): The header of the record to parse (see
+                :func:`~FNVPlugin.iter_record_headers`)
+
+        Returns:
+            Container: The parsed record
+        """
+
+        return cls._parse_record(content, header)
+
+    @classmethod
+    def iter_subrecord_data(
+        cls, data: bytes
+    ) -> Generator[Tuple[str, bytes], None, None]:
+        """Iterates over the raw subrecords of a record's (decompressed) data.
+
+        Note:
+            ``XXXX`` subrecords are consumed, the size they hold is used as the data
+            size of the following subrecord.
+
+        Args:
+            data (bytes): The data of the record
+
+        Yields:
+            Tuple[str, bytes]: A tuple of (subrecord type, subrecord data)
+        """
+
+        (offset, data_end, large_size) = (0, len(data), None)
+        while (offset + 6) <= data_end:
+            (subrecord_type, data_size) = struct.unpack_from("<4sH", data, offset)
+            offset += 6
+            if large_size is not None:
+                (data_size, large_size) = (large_size, None)
+
+            if subrecord_type == b"XXXX":
+                large_size = struct.unpack_from("<I", data, offset)[0]
+            else:
+                yield (
+                    subrecord_type.rstrip(b"\x00").decode("utf8"),
+                    data[offset : offset + data_size],
+                )
+            offset += data_size
+
+    @classmethod
+    def get_record_collection(cls, record_type: str) -> SubrecordCollection:
+        """Gets the subrecord collection defining a record type.
+
+        Args:
+            record_type (str): The record type
+
+        Returns:
+            SubrecordCollection: The subrecord collection of the record type, None
+                if the record type is not defined
+        """
+
+        return RecordMapping.get(record_type.upper())
+
+    @classmethod
+    def read_record_data(cls, content: T_Content, header: RecordHeader) -> bytes:
+        """Reads the (decompressed) data of a record given its header.
+
+        Args:
+            content (T_Content): The byte content (or memory map) of the plugin
+            header (RecordHeader): The header of the record
+
+        Returns:
+            bytes: The data of the record
+        """
 
-        # NOTE: must clear class working record after every "full" file parse
-        # otherwise, subsequent parses will have fragmented data when trying to discover
-        # and parse subrecords
-        cls.__working_record = {}
-        return header
+        data_offset = header.offset + cls.record_header_struct.size
+        data = bytes(content[data_offset : data_offset + header.data_size])
+        if header.flags & cls.compressed_flag:
+            # NOTE: compressed data is prefixed by its decompressed size
+            data = zlib.decompress(data[4:])
+        return data
+
+    @classmethod
+    def _parse_record(
+        cls,
+        content: T_Content,
+        header: RecordHeader,
+        subrecord_types: Set[str] = None,
+        include_skipped: bool = False,
+        strict: bool = True,
+    ) -> Container:
+        """Parses a single record, parsing only the given subrecord types.
+
+        Note:
+            Skipped subrecords are still added to the record's working record, so
+            the discovery of the parsed subrecords matches a full parse (skipped
+            subrecords themselves are not discovered).
+            Unlike :attr:`~FNVPlugin.record_struct`, no class level state is used
+            which makes this safe to interleave (as generators do).
+
+        Args:
+            content (T_Content): The byte content (or memory map) of the plugin
+            header (RecordHeader): The header of the record to parse
+            subrecord_types (Set[str], optional): Defaults to None. The uppercase
+                subrecord types to parse, defaults to all subrecord types
+            include_skipped (bool, optional): Defaults to False. Includes skipped
+                subrecords (with a ``parsed`` value of None) in the record's
+                subrecords
+            strict (bool, optional): Defaults to True. Enforce strict subrecord
+                discovery
+
+        Returns:
+            Container: The parsed record (structured like
+                :attr:`~FNVPlugin.record_struct`)
+        """
+
+        (record_type, _, _, _, revision, version, unknown) = (
+            cls.record_header_struct.unpack_from(content, header.offset)
+        )
+        data = cls.read_record_data(content, header)
+        record_type = record_type.rstrip(b"\x00").decode("utf8")
+        collection = cls.get_record_collection(record_type)
+        (working_record, subrecords) = ([], ListContainer())
+        for (subrecord_type, subrecord_data) in cls.iter_subrecord_data(data):
+            subrecord_name = subrecord_type.upper()
+            parsed = None
+            if subrecord_types is None or subrecord_name in subrecord_types:
+                if collection:
+                    try:
+                        (parsed, _) = collection.handle_working(
+                            subrecord_name,
+                            subrecord_data,
+                            working_record,
+                            strict=strict,
+                        )
+                    except Exception:
+                        # NOTE: matches the ``GreedyRange`` of full parses, which
+                        # stops at the first subrecord that fails to parse
+                        break
+            elif not include_skipped:
+                working_record.append(subrecord_name)
+                continue
+
+            working_record.append(subrecord_name)
+            subrecords.append(
+                Container(
+                    type=subrecord_type,
+                    data_size=len(subrecord_data),
+                    data=subrecord_data,
+                    parsed=parsed,
+                )
+            )
+
+        return Container(
+            type=record_type,
+            data_size=header.data_size,
+            flags=cls.record_flags_struct.parse(struct.pack("<I", header.flags)),
+            id=header.form_id,
+            revision=revision,
+            version=version,
+            _unknown_0=unknown,
+            data=data,
+            subrecords=subrecords,
+        )
+
+    @classmethod
+    def query_content(
+        cls,
+        content: T_Content,
+        record_types: Iterable[str] = None,
+        subrecords: Iterable[str] = None,
+        where: Callable[[RecordHeader], bool] = None,
+        include_header: bool = False,
+        strict: bool = True,
+    ) -> Generator[Container, None, None]:
+        """Parses the records of a plugin matching a query.
+
+        Records are filtered by their fixed size headers first (see
+        :func:`~FNVPlugin.iter_record_headers`), so the data of records which are
+        not of the requested types or fail the predicate is never read or
+        decompressed.
+        Of the matching records only the requested subrecord types are parsed.
+
+        Args:
+            content (T_Content): The byte content (or memory map) of the plugin
+            record_types (Iterable[str], optional): Defaults to None. The record
+                types to parse, defaults to all record types
+            subrecords (Iterable[str], optional): Defaults to None. The subrecord
+                types to parse (and include in the records' subrecords), defaults to
+                all subrecord types
+            where (Callable[[RecordHeader], bool], optional): Defaults to None. A
+                predicate records' headers must pass (such as a flags or form id
+                range check)
+            include_header (bool, optional): Defaults to False. Includes the header
+                record (regardless of ``record_types``)
+            strict (bool, optional): Defaults to True. Enforce strict subrecord
+                discovery
+
+        Raises:
+            ValueError: If a record or group is truncated
+
+        Yields:
+            Container: The parsed record of each matching record (in order of the
+                content)
+        """
+
+        if record_types is not None:
+            record_types = {
+                record_type.upper().encode("ascii") for record_type in record_types
+            }
+        if subrecords is not None:
+            subrecords = {subrecord_type.upper() for subrecord_type in subrecords}
+
+        record_headers = cls.iter_record_headers(content)
+        header = next(record_headers, None)
+        if header is not None and header.type == b"TES4":
+            if include_header:
+                yield cls._parse_record(content, header, subrecords, strict=strict)
+        elif header is not None:
+            record_headers = itertools.chain([header], record_headers)
+
+        for header in record_headers:
+            if record_types is not None and header.type not in record_types:
+                continue
+            if where is not None and not where(header):
+                continue
+            yield cls._parse_record(content, header, subrecords, strict=strict)
+
+    def query(
+        self,
+        record_types: Iterable[str] = None,
+        subrecords: Iterable[str] = None,
+        where: Callable[[RecordHeader], bool] = None,
+        include_header: bool = False,
+        strict: bool = True,
+    ) -> Generator[Container, None, None]:
+        """Parses the records of the plugin matching a query.
+
+        Note:
+            Unlike :func:`~BasePlugin.iter_records`, the plugin is never parsed
+            as a whole (see :func:`~FNVPlugin.query_content`).
+
+        Args:
+            record_types (Iterable[str], optional): Defaults to None. The record
+                types to parse, defaults to all record types
+            subrecords (Iterable[str], optional): Defaults to None. The subrecord
+                types to parse (and include in the records' subrecords), defaults to
+                all subrecord types
+            where (Callable[[RecordHeader], bool], optional): Defaults to None. A
+                predicate records' headers must pass (such as a flags or form id
+                range check)
+            include_header (bool, optional): Defaults to False. Includes the header
+                record (regardless of ``record_types``)
+            strict (bool, optional): Defaults to True. Enforce strict subrecord
+                discovery
+
+        Raises:
+            ValueError: If a record or group is truncated
+
+        Yields:
+            Container: The parsed record of each matching record
+
+        Example:
+            >>> plugin = bethesda_structs.plugin.get_plugin("FalloutNV.esm")
+            >>> for record in plugin.query(
+            ...     record_types=["WEAP"],
+            ...     subrecords=["EDID", "FULL"],
+            ...     where=lambda header: (header.form_id >> 24) == 0,
+            ... ):
+            ...     print([subrecord.parsed.value for subrecord in record.subrecords])
+        """
+
+        return self.query_content(
+            self.content,
+            record_types=record_types,
+            subrecords=subrecords,
+            where=where,
+            include_header=include_header,
+            strict=strict,
+        )
 
     @classmethod
     def parse_subrecord(
@@ -296,9 +849,6 @@ class FNVPlugin(BasePlugin):
 
         (record_type, subrecord_type) = (record_type.upper(), subrecord_type.upper())
 
-        if len(cls.__only_parse_record_types) > 0 and subrecord_type not in cls.__only_parse_record_types:
-            return None
-
         # handle reset of working record state
         if record_id not in cls.__working_record:
             cls.__working_record[record_id] = []
@@ -24,7 +24,7 @@ from construct import (
     PaddedString,
 )
 
-from .._common import FormID, Subrecord, SubrecordCollection
+from .._common import FormID, Subrecord, intern_forms, SubrecordCollection
 
 
 class FNVFormID(Adapter):
@@ -39,7 +39,8 @@ class FNVFormID(Adapter):
         """
 
         super().__init__(Int32ul, *args, **kwargs)
-        self.forms = forms
+        # NOTE: forms are validated once here instead of on every decoded form id
+        self.forms = intern_forms(forms)
 
     def _decode(self, obj: Construct, context: Container, path: str) -> FormID:
         """Decodes a given `obj` to a ``FormID``.
@@ -53,7 +54,7 @@ class FNVFormID(Adapter):
             FormID: The resulting form id
         """
 
-        return FormID(obj, self.forms)
+        return FormID.from_interned(obj, self.forms)
 
     def _encode(self, obj: Construct, context: Container, path: str) -> bytes:
         """Encodes a ``FormID`` back to bytes.
@@ -0,0 +1,592 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import os
+import sys
+import json
+import array
+import heapq
+import base64
+import bisect
+from typing import Dict, List, Tuple, Iterable, Optional, Generator
+from pathlib import Path
+
+import attr
+
+from .._common import parallel_map
+
+INDEX_VERSION = 1
+"""The version of persisted override indexes, indexes of other versions are rebuilt.
+"""
+
+
+def encode_form_ids(form_ids: array.array) -> str:
+    """Encodes form ids for persisting.
+
+    Args:
+        form_ids (array.array): The form ids to encode
+
+    Returns:
+        str: The base64 encoded (little-endian) form ids
+    """
+
+    if sys.byteorder != "little":
+        form_ids = array.array(form_ids.typecode, form_ids)
+        form_ids.byteswap()
+    return base64.b64encode(form_ids.tobytes()).decode("ascii")
+
+
+def decode_form_ids(encoded: str) -> array.array:
+    """Decodes persisted form ids.
+
+    Args:
+        encoded (str): The base64 encoded (little-endian) form ids
+
+    Returns:
+        array.array: The decoded form ids
+    """
+
+    form_ids = array.array("I")
+    form_ids.frombytes(base64.b64decode(encoded))
+    if sys.byteorder != "little":
+        form_ids.byteswap()
+    return form_ids
+
+
+@attr.s
+class PluginForms(object):
+    """The masters and form ids of the records of a plugin.
+    """
+
+    path = attr.ib(type=str)
+    """The path of the plugin.
+
+    Returns:
+        str: The path of the plugin
+    """
+
+    size = attr.ib(type=int, default=0)
+    """The size of the plugin when its records were listed.
+
+    Returns:
+        int: The size of the plugin
+    """
+
+    mtime = attr.ib(type=float, default=0.0)
+    """The modification time of the plugin when its records were listed.
+
+    Returns:
+        float: The modification time of the plugin
+    """
+
+    masters = attr.ib(type=List[str], default=attr.Factory(list))
+    """The masters of the plugin (in order).
+
+    Returns:
+        List[str]: The masters of the plugin
+    """
+
+    form_ids = attr.ib(
+        type=array.array, default=attr.Factory(lambda: array.array("I")), repr=False
+    )
+    """The (sorted and distinct) form ids of the plugin's records, relative to its
+    masters.
+
+    Returns:
+        array.array: The form ids of the plugin's records
+    """
+
+    @property
+    def name(self) -> str:
+        """The filename of the plugin.
+
+        Returns:
+            str: The filename of the plugin
+        """
+
+        return os.path.basename(self.path)
+
+    @classmethod
+    def from_path(cls, path: str) -> "PluginForms":
+        """Lists the masters and form ids of a plugin from its record headers.
+
+        Note:
+            The plugin is memory mapped and only the header record's subrecords are
+            read, all other records are skipped (see
+            :func:`~bethesda_structs.plugin.fnv.FNVPlugin.iter_record_headers`).
+
+        Args:
+            path (str): The path of the plugin
+
+        Raises:
+            FileNotFoundError: If the given path does not exist
+            ValueError: If the given file is not a supported plugin or is truncated
+
+        Returns:
+            PluginForms: The listed masters and form ids
+        """
+
+        path = os.fspath(path)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"file {path!r} does not exist")
+
+        # NOTE: imported here to avoid a circular import of the plugin package
+        from . import get_plugin
+
+        plugin = get_plugin(path)
+        if plugin is None:
+            raise ValueError(f"no plugin can handle {path!r}")
+
+        stat = os.stat(path)
+        try:
+            record_headers = plugin.iter_record_headers(plugin.content)
+            header = next(record_headers, None)
+            if header is None or header.type != b"TES4":
+                raise ValueError(f"{path!r} does not start with a TES4 header record")
+            masters = plugin._read_masters(plugin.content, header)
+            form_ids = array.array(
+                "I",
+                sorted(set(record_header.form_id for record_header in record_headers)),
+            )
+        finally:
+            plugin.close()
+
+        return cls(
+            path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            masters=masters,
+            form_ids=form_ids,
+        )
+
+    def is_current(self) -> bool:
+        """Determines if the listed form ids are still current.
+
+        Returns:
+            bool: True if the plugin's size and modification time are unchanged
+        """
+
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    def to_dict(self) -> dict:
+        """Serializes the listing for persisting.
+
+        Returns:
+            dict: The serialized listing
+        """
+
+        return {
+            "path": self.path,
+            "size": self.size,
+            "mtime": self.mtime,
+            "masters": self.masters,
+            "form_ids": encode_form_ids(self.form_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PluginForms":
+        """Deserializes a persisted listing.
+
+        Args:
+            data (dict): The serialized listing
+
+        Returns:
+            PluginForms: The deserialized listing
+        """
+
+        return cls(
+            data["path"],
+            size=data["size"],
+            mtime=data["mtime"],
+            masters=data["masters"],
+            form_ids=decode_form_ids(data["form_ids"]),
+        )
+
+
+@attr.s
+class OverrideIndex(object):
+    """A load order wide index of which plugins define or override each form.
+
+    Form ids of each plugin are resolved through its masters to the plugin defining
+    the form, so a form is identified by its defining plugin and object id (the
+    lower 24 bits of its form id).
+    The resolved form ids of all plugins are merged with a k-way merge into sorted
+    arrays, so lookups are a binary search.
+    Only plugins whose size or modification time changed are listed again on
+    :func:`~OverrideIndex.update`.
+
+    Example:
+        >>> index = bethesda_structs.plugin.OverrideIndex.build(
+        ...     [
+        ...         "/home/username/Fallout New Vegas/Data/FalloutNV.esm",
+        ...         "/home/username/Fallout New Vegas/Data/MyMod.esp",
+        ...     ],
+        ...     cache_path="/home/username/.cache/override_index.json",
+        ... )
+        >>> index.get_plugins("FalloutNV.esm", 0x0001A5B6)
+        ['FalloutNV.esm', 'MyMod.esp']
+    """
+
+    plugins = attr.ib(type=List[PluginForms], default=attr.Factory(list))
+    """The plugins in load order.
+
+    Returns:
+        List[PluginForms]: The plugins in load order
+    """
+
+    _owners = attr.ib(
+        type=List[str], default=attr.Factory(list), init=False, repr=False
+    )
+    _owner_indexes = attr.ib(
+        type=Dict[str, int], default=attr.Factory(dict), init=False, repr=False
+    )
+    _keys = attr.ib(type=array.array, default=None, init=False, repr=False)
+    _starts = attr.ib(type=array.array, default=None, init=False, repr=False)
+    _plugin_indexes = attr.ib(type=array.array, default=None, init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        """Initializes the non-init attributes.
+        """
+
+        self._rebuild_index()
+
+    def _get_owner_index(self, name: str) -> int:
+        """Gets the index of the plugin defining forms, registering missing masters.
+
+        Args:
+            name (str): The filename of the defining plugin
+
+        Returns:
+            int: The index of the defining plugin
+        """
+
+        key = name.lower()
+        if key not in self._owner_indexes:
+            # NOTE: masters missing from the load order are indexed after all plugins
+            self._owner_indexes[key] = len(self._owners)
+            self._owners.append(name)
+        return self._owner_indexes[key]
+
+    def _resolve_plugin(self, plugin_index: int) -> List[int]:
+        """Resolves the form ids of a plugin.
+
+        Args:
+            plugin_index (int): The index of the plugin in the load order
+
+        Returns:
+            List[int]: The sorted ``(resolved form id << 16) | plugin index`` values
+        """
+
+        plugin = self.plugins[plugin_index]
+        remap = [self._get_owner_index(master) for master in plugin.masters]
+
+        # NOTE: sorted form ids are grouped by master index, so each group is
+        # resolved as a whole and the groups are ordered by their resolved owner
+        blocks = []
+        form_ids = plugin.form_ids
+        start = 0
+        while start < len(form_ids):
+            master_index = form_ids[start] >> 24
+            end = bisect.bisect_left(form_ids, (master_index + 1) << 24, lo=start)
+            # NOTE: form ids above the plugin's masters are the plugin's own forms
+            owner = remap[master_index] if master_index < len(remap) else plugin_index
+            base = (owner << 40) | plugin_index
+            blocks.append(
+                (
+                    owner,
+                    [
+                        base | ((form_id & 0xFFFFFF) << 16)
+                        for form_id in form_ids[start:end]
+                    ],
+                )
+            )
+            start = end
+
+        blocks.sort(key=lambda block: block[0])
+        if len(set(owner for (owner, _) in blocks)) < len(blocks):
+            # NOTE: a master listed twice resolves to the same owner twice
+            return list(heapq.merge(*(values for (_, values) in blocks)))
+        resolved = []
+        for (_, values) in blocks:
+            resolved.extend(values)
+        return resolved
+
+    def _rebuild_index(self):
+        """Rebuilds the resolved form id to plugin indexes mapping.
+        """
+
+        self._owners = [plugin.name for plugin in self.plugins]
+        self._owner_indexes = {}
+        for (plugin_index, name) in enumerate(self._owners):
+            self._owner_indexes.setdefault(name.lower(), plugin_index)
+
+        keys = array.array("Q")
+        starts = array.array("L")
+        plugin_indexes = array.array("H")
+        previous = None
+        for value in heapq.merge(
+            *(
+                self._resolve_plugin(plugin_index)
+                for plugin_index in range(len(self.plugins))
+            )
+        ):
+            key = value >> 16
+            if key != previous:
+                keys.append(key)
+                starts.append(len(plugin_indexes))
+                previous = key
+            plugin_indexes.append(value & 0xFFFF)
+        starts.append(len(plugin_indexes))
+        (self._keys, self._starts, self._plugin_indexes) = (
+            keys,
+            starts,
+            plugin_indexes,
+        )
+
+    def _lookup(self, key: int) -> List[int]:
+        """Looks up the plugin indexes of a resolved form id.
+
+        Args:
+            key (int): The resolved form id
+
+        Returns:
+            List[int]: The indexes of the plugins (in load order)
+        """
+
+        position = bisect.bisect_left(self._keys, key)
+        if position >= len(self._keys) or self._keys[position] != key:
+            return []
+        return list(
+            self._plugin_indexes[self._starts[position] : self._starts[position + 1]]
+        )
+
+    def _resolve(self, plugin: str, form_id: int) -> Optional[int]:
+        """Resolves a form id relative to the masters of a plugin.
+
+        Args:
+            plugin (str): The filename of the plugin
+            form_id (int): The form id relative to the plugin's masters
+
+        Returns:
+            Optional[int]: The resolved form id, None if the plugin is not indexed
+        """
+
+        plugin_index = self._owner_indexes.get(plugin.lower())
+        if plugin_index is None or plugin_index >= len(self.plugins):
+            return None
+
+        masters = self.plugins[plugin_index].masters
+        master_index = form_id >> 24
+        owner = plugin_index
+        if master_index < len(masters):
+            owner = self._owner_indexes[masters[master_index].lower()]
+        return (owner << 24) | (form_id & 0xFFFFFF)
+
+    @classmethod
+    def build(
+        cls, paths: Iterable[str], cache_path: str = None, max_workers: int = None
+    ) -> "OverrideIndex":
+        """Builds an index for the given plugins.
+
+        Args:
+            paths (Iterable[str]): The plugins in load order
+            cache_path (str, optional): Defaults to None. The path of a persisted
+                index to reuse the listings of unchanged plugins from (and to save
+                the built index to)
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to list plugins
+
+        Returns:
+            OverrideIndex: The built index
+        """
+
+        index = cls()
+        if cache_path is not None and os.path.isfile(cache_path):
+            index = cls.load(cache_path)
+        index.update(paths, max_workers=max_workers)
+        if cache_path is not None:
+            index.save(cache_path)
+        return index
+
+    def update(
+        self, paths: Iterable[str] = None, max_workers: int = None
+    ) -> List[str]:
+        """Updates the index for the given (or current) plugins.
+
+        Note:
+            Unchanged plugins keep their listings, only the merge of the listings is
+            redone (which reads no files).
+
+        Args:
+            paths (Iterable[str], optional): Defaults to None. The plugins in load
+                order, defaults to the current plugins
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to list plugins
+
+        Raises:
+            FileNotFoundError: If a given plugin does not exist
+            ValueError: If a given file is not a supported plugin
+
+        Returns:
+            List[str]: The paths of the plugins which were listed again
+        """
+
+        paths = (
+            [plugin.path for plugin in self.plugins]
+            if paths is None
+            else [os.fspath(path) for path in paths]
+        )
+        current = {plugin.path: plugin for plugin in self.plugins}
+        stale = [
+            path
+            for path in paths
+            if path not in current or not current[path].is_current()
+        ]
+        listed = dict(
+            zip(stale, parallel_map(PluginForms.from_path, stale, max_workers))
+        )
+
+        self.plugins = [listed.get(path, current.get(path)) for path in paths]
+        self._rebuild_index()
+        return stale
+
+    def get_plugins(self, plugin: str, form_id: int) -> List[str]:
+        """Gets the plugins defining or overriding a form.
+
+        Args:
+            plugin (str): The filename of the plugin the form id is relative to
+            form_id (int): The form id relative to the plugin's masters
+
+        Returns:
+            List[str]: The filenames of the plugins with a record of the form (in load
+                order, so the defining plugin first and the winning plugin last)
+        """
+
+        key = self._resolve(plugin, form_id)
+        if key is None:
+            return []
+        return [self.plugins[plugin_index].name for plugin_index in self._lookup(key)]
+
+    def get_winner(self, plugin: str, form_id: int) -> Optional[str]:
+        """Gets the plugin whose record of a form is used.
+
+        Args:
+            plugin (str): The filename of the plugin the form id is relative to
+            form_id (int): The form id relative to the plugin's masters
+
+        Returns:
+            Optional[str]: The filename of the winning plugin, or None if no plugin
+                has a record of the form
+        """
+
+        plugins = self.get_plugins(plugin, form_id)
+        if len(plugins) <= 0:
+            return None
+        return plugins[-1]
+
+    def iter_forms(
+        self, plugin: str = None
+    ) -> Generator[Tuple[str, int, List[str]], None, None]:
+        """Iterates over the indexed forms.
+
+        Args:
+            plugin (str, optional): Defaults to None. Only iterates over the forms a
+                plugin (given by filename) defines or overrides
+
+        Yields:
+            Tuple[str, int, List[str]]: A tuple of (defining plugin, object id,
+                plugins with a record of the form in load order)
+        """
+
+        plugin_index = None
+        if plugin is not None:
+            plugin_index = self._owner_indexes.get(plugin.lower())
+            if plugin_index is None or plugin_index >= len(self.plugins):
+                return
+
+        for (position, key) in enumerate(self._keys):
+            plugin_indexes = self._plugin_indexes[
+                self._starts[position] : self._starts[position + 1]
+            ]
+            if plugin_index is not None and plugin_index not in plugin_indexes:
+                continue
+            yield (
+                self._owners[key >> 24],
+                key & 0xFFFFFF,
+                [self.plugins[plugin_index].name for plugin_index in plugin_indexes],
+            )
+
+    def iter_conflicts(
+        self, plugin: str = None
+    ) -> Generator[Tuple[str, int, List[str]], None, None]:
+        """Iterates over forms with records in more than one plugin.
+
+        Args:
+            plugin (str, optional): Defaults to None. Only iterates over the conflicts
+                a plugin (given by filename) takes part in
+
+        Yields:
+            Tuple[str, int, List[str]]: A tuple of (defining plugin, object id,
+                plugins with a record of the form in load order)
+        """
+
+        for (owner, object_id, plugins) in self.iter_forms(plugin=plugin):
+            if len(plugins) > 1:
+                yield (owner, object_id, plugins)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def save(self, filepath: str):
+        """Persists the index as JSON.
+
+        Note:
+            Only the listings of plugins are persisted, the merged index is rebuilt
+            on load.
+
+        Args:
+            filepath (str): The path of the file to persist the index to
+        """
+
+        filepath = Path(filepath)
+        temp_filepath = filepath.with_name(filepath.name + ".tmp")
+        with temp_filepath.open("w", encoding="utf8") as stream:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "plugins": [plugin.to_dict() for plugin in self.plugins],
+                },
+                stream,
+            )
+        os.replace(temp_filepath, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "OverrideIndex":
+        """Loads a persisted index.
+
+        Note:
+            Indexes persisted by a different version (or which cannot be read) are
+            loaded as empty indexes.
+
+        Args:
+            filepath (str): The path of the persisted index
+
+        Returns:
+            OverrideIndex: The loaded index
+        """
+
+        try:
+            with open(filepath, "r", encoding="utf8") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return cls()
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(
+            plugins=[PluginForms.from_dict(plugin) for plugin in data["plugins"]]
+        )
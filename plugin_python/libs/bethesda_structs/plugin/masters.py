@@ -0,0 +1,464 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import os
+import json
+from typing import Dict, List, Tuple, Iterable
+from pathlib import Path
+
+import attr
+
+from .._common import SNIFF_SIZE, parallel_map
+
+INDEX_VERSION = 1
+"""The version of persisted master graphs, graphs of other versions are rebuilt.
+"""
+
+
+@attr.s
+class PluginMasters(object):
+    """The masters of a plugin.
+    """
+
+    path = attr.ib(type=str)
+    """The path of the plugin.
+
+    Returns:
+        str: The path of the plugin
+    """
+
+    size = attr.ib(type=int, default=0)
+    """The size of the plugin when its masters were read.
+
+    Returns:
+        int: The size of the plugin
+    """
+
+    mtime = attr.ib(type=float, default=0.0)
+    """The modification time of the plugin when its masters were read.
+
+    Returns:
+        float: The modification time of the plugin
+    """
+
+    masters = attr.ib(type=List[str], default=attr.Factory(list))
+    """The masters of the plugin (in order).
+
+    Returns:
+        List[str]: The masters of the plugin
+    """
+
+    @property
+    def name(self) -> str:
+        """The filename of the plugin.
+
+        Returns:
+            str: The filename of the plugin
+        """
+
+        return os.path.basename(self.path)
+
+    @classmethod
+    def from_path(cls, path: str) -> "PluginMasters":
+        """Reads the masters of a plugin from its header record.
+
+        Args:
+            path (str): The path of the plugin
+
+        Raises:
+            FileNotFoundError: If the given path does not exist
+            ValueError: If the given file is not a supported plugin or its header
+                record is truncated
+
+        Returns:
+            PluginMasters: The read masters
+        """
+
+        # NOTE: imported here to avoid a circular import of the plugin package
+        from . import AVAILABLE_PLUGINS, FNVPlugin
+
+        path = os.fspath(path)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"file {path!r} does not exist")
+
+        with open(path, "rb") as stream:
+            header = stream.read(SNIFF_SIZE)
+        for plugin_type in AVAILABLE_PLUGINS:
+            if plugin_type.can_handle_header(header):
+                break
+        else:
+            # NOTE: games without a plugin yet (such as Skyrim) share the 24 byte
+            # header record of FO3/FNV, Oblivion's 20 byte header is followed by HEDR
+            if header[:4] != b"TES4" or header[20:24] == b"HEDR":
+                raise ValueError(f"no plugin can handle {path!r}")
+            plugin_type = FNVPlugin
+
+        stat = os.stat(path)
+        return cls(
+            path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            masters=plugin_type.read_masters(path),
+        )
+
+    def is_current(self) -> bool:
+        """Determines if the read masters are still current.
+
+        Returns:
+            bool: True if the plugin's size and modification time are unchanged
+        """
+
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    def to_dict(self) -> dict:
+        """Serializes the masters for persisting.
+
+        Returns:
+            dict: The serialized masters
+        """
+
+        return attr.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PluginMasters":
+        """Deserializes persisted masters.
+
+        Args:
+            data (dict): The serialized masters
+
+        Returns:
+            PluginMasters: The deserialized masters
+        """
+
+        return cls(**data)
+
+
+@attr.s
+class MasterGraph(object):
+    """The masters dependency graph of a load order.
+
+    Masters are read from the header record of each plugin only (in parallel), and
+    only plugins whose size or modification time changed are read again on
+    :func:`~MasterGraph.update`.
+
+    Note:
+        Plugins of games sharing the FO3/FNV header record layout (such as Skyrim)
+        are read as well, as only the header record's ``MAST`` subrecords are used.
+
+    Example:
+        >>> graph = bethesda_structs.plugin.MasterGraph.build(
+        ...     [
+        ...         "/home/username/Fallout New Vegas/Data/FalloutNV.esm",
+        ...         "/home/username/Fallout New Vegas/Data/MyMod.esp",
+        ...     ],
+        ...     cache_path="/home/username/.cache/master_graph.json",
+        ... )
+        >>> graph.get_dependents("FalloutNV.esm")
+        ['MyMod.esp']
+    """
+
+    plugins = attr.ib(type=List[PluginMasters], default=attr.Factory(list))
+    """The plugins in load order.
+
+    Returns:
+        List[PluginMasters]: The plugins in load order
+    """
+
+    _positions = attr.ib(
+        type=Dict[str, int], default=attr.Factory(dict), init=False, repr=False
+    )
+    _dependents = attr.ib(
+        type=Dict[str, List[int]], default=attr.Factory(dict), init=False, repr=False
+    )
+
+    def __attrs_post_init__(self):
+        """Initializes the non-init attributes.
+        """
+
+        self._rebuild_graph()
+
+    def _rebuild_graph(self):
+        """Rebuilds the load order positions and the reverse (dependents) edges.
+        """
+
+        self._positions = {}
+        self._dependents = {}
+        for (position, plugin) in enumerate(self.plugins):
+            self._positions.setdefault(plugin.name.lower(), position)
+            for master in plugin.masters:
+                self._dependents.setdefault(master.lower(), []).append(position)
+
+    @classmethod
+    def from_listings(cls, listings: Iterable) -> "MasterGraph":
+        """Creates a graph from existing listings holding the masters of plugins.
+
+        Args:
+            listings (Iterable): The listings in load order, anything with a
+                ``path``, ``size``, ``mtime`` and ``masters`` (such as the
+                :class:`~bethesda_structs.plugin.index.PluginForms` of an
+                :class:`~bethesda_structs.plugin.index.OverrideIndex`)
+
+        Returns:
+            MasterGraph: The created graph
+        """
+
+        return cls(
+            plugins=[
+                PluginMasters(
+                    listing.path,
+                    size=listing.size,
+                    mtime=listing.mtime,
+                    masters=list(listing.masters),
+                )
+                for listing in listings
+            ]
+        )
+
+    @classmethod
+    def build(
+        cls, paths: Iterable[str], cache_path: str = None, max_workers: int = None
+    ) -> "MasterGraph":
+        """Builds the graph of the given plugins.
+
+        Args:
+            paths (Iterable[str]): The plugins in load order
+            cache_path (str, optional): Defaults to None. The path of a persisted
+                graph to reuse the masters of unchanged plugins from (and to save the
+                built graph to)
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to read plugins
+
+        Returns:
+            MasterGraph: The built graph
+        """
+
+        graph = cls()
+        if cache_path is not None and os.path.isfile(cache_path):
+            graph = cls.load(cache_path)
+        graph.update(paths, max_workers=max_workers)
+        if cache_path is not None:
+            graph.save(cache_path)
+        return graph
+
+    def update(
+        self, paths: Iterable[str] = None, max_workers: int = None
+    ) -> List[str]:
+        """Updates the graph for the given (or current) plugins.
+
+        Args:
+            paths (Iterable[str], optional): Defaults to None. The plugins in load
+                order, defaults to the current plugins
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to read plugins
+
+        Raises:
+            FileNotFoundError: If a given plugin does not exist
+            ValueError: If a given file is not a supported plugin or its header
+                record is truncated
+
+        Returns:
+            List[str]: The paths of the plugins which were read again
+        """
+
+        paths = (
+            [plugin.path for plugin in self.plugins]
+            if paths is None
+            else [os.fspath(path) for path in paths]
+        )
+        current = {plugin.path: plugin for plugin in self.plugins}
+        stale = [
+            path
+            for path in paths
+            if path not in current or not current[path].is_current()
+        ]
+        read = dict(
+            zip(stale, parallel_map(PluginMasters.from_path, stale, max_workers))
+        )
+
+        self.plugins = [read.get(path, current.get(path)) for path in paths]
+        self._rebuild_graph()
+        return stale
+
+    def get_missing_masters(self) -> Dict[str, List[str]]:
+        """Gets the masters which are not part of the load order.
+
+        Returns:
+            Dict[str, List[str]]: The missing masters by plugin filename
+        """
+
+        missing = {}
+        for plugin in self.plugins:
+            plugin_missing = [
+                master
+                for master in plugin.masters
+                if master.lower() not in self._positions
+            ]
+            if len(plugin_missing) > 0:
+                missing[plugin.name] = plugin_missing
+        return missing
+
+    def get_ordering_violations(self) -> List[Tuple[str, str]]:
+        """Gets the masters which are loaded after a plugin depending on them.
+
+        Returns:
+            List[Tuple[str, str]]: A list of (plugin filename, master filename) tuples
+                (in load order of the plugins)
+        """
+
+        violations = []
+        for (position, plugin) in enumerate(self.plugins):
+            for master in plugin.masters:
+                master_position = self._positions.get(master.lower())
+                if master_position is not None and master_position > position:
+                    violations.append((plugin.name, master))
+        return violations
+
+    def find_cycles(self) -> List[List[str]]:
+        """Finds groups of plugins which (transitively) depend on each other.
+
+        Note:
+            Strongly connected components are found with an iterative version of
+            Tarjan's algorithm, so deep master chains do not hit the recursion
+            limit.
+
+        Returns:
+            List[List[str]]: The filenames of the plugins of each cycle (in load
+                order)
+        """
+
+        edges = [
+            [
+                self._positions[master.lower()]
+                for master in plugin.masters
+                if master.lower() in self._positions
+            ]
+            for plugin in self.plugins
+        ]
+
+        (counter, indexes, lowlinks) = (0, {}, {})
+        (stack, on_stack, cycles) = ([], set(), [])
+        for root in range(len(self.plugins)):
+            if root in indexes:
+                continue
+
+            work = [(root, 0)]
+            while len(work) > 0:
+                (node, edge_index) = work.pop()
+                if edge_index == 0:
+                    indexes[node] = lowlinks[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+
+                recurse = False
+                for next_index in range(edge_index, len(edges[node])):
+                    target = edges[node][next_index]
+                    if target not in indexes:
+                        work.append((node, next_index + 1))
+                        work.append((target, 0))
+                        recurse = True
+                        break
+                    elif target in on_stack:
+                        lowlinks[node] = min(lowlinks[node], indexes[target])
+                if recurse:
+                    continue
+
+                if lowlinks[node] == indexes[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in edges[node]:
+                        cycles.append(
+                            [self.plugins[member].name for member in sorted(component)]
+                        )
+                if len(work) > 0:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+
+        cycles.sort(key=lambda cycle: self._positions[cycle[0].lower()])
+        return cycles
+
+    def get_dependents(self, plugin: str, transitive: bool = True) -> List[str]:
+        """Gets the plugins depending on a plugin.
+
+        Args:
+            plugin (str): The filename of the plugin
+            transitive (bool, optional): Defaults to True. Includes plugins depending
+                on the plugin through other masters
+
+        Returns:
+            List[str]: The filenames of the dependent plugins (in load order)
+        """
+
+        (seen, pending) = (set(), [plugin.lower()])
+        while len(pending) > 0:
+            for position in self._dependents.get(pending.pop(), []):
+                if position in seen:
+                    continue
+                seen.add(position)
+                if transitive:
+                    pending.append(self.plugins[position].name.lower())
+
+        own_position = self._positions.get(plugin.lower())
+        return [
+            self.plugins[position].name
+            for position in sorted(seen)
+            if position != own_position
+        ]
+
+    def __len__(self) -> int:
+        return len(self.plugins)
+
+    def save(self, filepath: str):
+        """Persists the graph as JSON.
+
+        Args:
+            filepath (str): The path of the file to persist the graph to
+        """
+
+        filepath = Path(filepath)
+        temp_filepath = filepath.with_name(filepath.name + ".tmp")
+        with temp_filepath.open("w", encoding="utf8") as stream:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "plugins": [plugin.to_dict() for plugin in self.plugins],
+                },
+                stream,
+            )
+        os.replace(temp_filepath, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "MasterGraph":
+        """Loads a persisted graph.
+
+        Note:
+            Graphs persisted by a different version (or which cannot be read) are
+            loaded as empty graphs.
+
+        Args:
+            filepath (str): The path of the persisted graph
+
+        Returns:
+            MasterGraph: The loaded graph
+        """
+
+        try:
+            with open(filepath, "r", encoding="utf8") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return cls()
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(
+            plugins=[PluginMasters.from_dict(plugin) for plugin in data["plugins"]]
+        )
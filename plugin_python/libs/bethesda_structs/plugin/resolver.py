@@ -0,0 +1,257 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import array
+from typing import Dict, List, Union, Iterable, Optional
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+T_FormIDs = Union[Iterable[int], "numpy.ndarray"]
+
+LIGHT_PREFIX = 0xFE
+"""The load order index shared by all light plugins.
+"""
+
+LIGHT_SLOTS = 0x1000
+"""The number of light plugin slots.
+"""
+
+UNRESOLVED = -1
+"""The lookup table entry of masters (or slots) which cannot be resolved.
+"""
+
+
+class FormIDResolver(object):
+    """Converts the form ids of a plugin between local and load order global form ids.
+
+    Local form ids are relative to the plugin's masters (the highest byte is the
+    index of a master, or the plugin itself), global form ids are relative to the
+    active load order (the highest byte is the load order index of a full plugin,
+    or ``FE`` followed by the 3 digit slot of a light plugin).
+
+    Conversions are done in bulk through lookup tables indexed by the highest byte
+    (or light slot) of each form id, so arrays of form ids are converted with a few
+    vectorized operations when `NumPy <https://numpy.org>`_ is available (and with
+    a single pass over the form ids otherwise).
+
+    Note:
+        Null form ids (``0``) are kept as is, form ids which cannot be resolved
+        (their master is not active, or the form is not referenced by the plugin)
+        are converted to null form ids unless conversions are strict.
+
+    Example:
+        >>> resolver = FormIDResolver(
+        ...     "MyMod.esp",
+        ...     ["Skyrim.esm", "MyLight.esl"],
+        ...     ["Skyrim.esm", "Update.esm", "MyMod.esp"],
+        ...     light_plugins=["MyLight.esl"],
+        ... )
+        >>> [hex(form_id) for form_id in resolver.to_global([0x01000801, 0x02000800])]
+        ['0xfe000801', '0x2000800']
+    """
+
+    def __init__(
+        self,
+        plugin: str,
+        masters: List[str],
+        plugins: List[str],
+        light_plugins: List[str] = None,
+    ):
+        """Creates a resolver for a plugin within a load order.
+
+        Args:
+            plugin (str): The filename of the plugin
+            masters (List[str]): The masters of the plugin (in order)
+            plugins (List[str]): The active full plugins (in load order)
+            light_plugins (List[str], optional): Defaults to None. The active light
+                plugins (in load order)
+
+        Raises:
+            ValueError: If there are more full plugins or light plugins than can be
+                loaded
+        """
+
+        light_plugins = light_plugins or []
+        if len(plugins) > LIGHT_PREFIX:
+            raise ValueError(f"at most {LIGHT_PREFIX!r} full plugins can be loaded")
+        if len(light_plugins) > LIGHT_SLOTS:
+            raise ValueError(f"at most {LIGHT_SLOTS!r} light plugins can be loaded")
+
+        self.plugin = plugin
+        self.masters = masters
+        self.plugins = plugins
+        self.light_plugins = light_plugins
+
+        # NOTE: the plugin's own forms use every master index after its masters
+        owners = [master.lower() for master in masters] + [plugin.lower()] * (
+            0x100 - len(masters)
+        )
+        full_indexes = {name.lower(): index for (index, name) in enumerate(plugins)}
+        light_indexes = {
+            name.lower(): index for (index, name) in enumerate(light_plugins)
+        }
+
+        # local master index to global prefix and object id mask
+        self._global_prefixes = [0] * 0x100
+        self._global_masks = [0] * 0x100
+        for (master_index, owner) in enumerate(owners):
+            if owner in full_indexes:
+                self._global_prefixes[master_index] = full_indexes[owner] << 24
+                self._global_masks[master_index] = 0xFFFFFF
+            elif owner in light_indexes:
+                self._global_prefixes[master_index] = (LIGHT_PREFIX << 24) | (
+                    light_indexes[owner] << 12
+                )
+                self._global_masks[master_index] = 0xFFF
+            else:
+                self._global_prefixes[master_index] = UNRESOLVED
+
+        # global load order index (or light slot) to local master index
+        local_indexes: Dict[str, int] = {}
+        for (master_index, owner) in enumerate(owners[: len(masters) + 1]):
+            local_indexes.setdefault(owner, master_index)
+        self._full_local = [UNRESOLVED] * 0x100
+        for (index, name) in enumerate(plugins):
+            self._full_local[index] = local_indexes.get(name.lower(), UNRESOLVED)
+        self._light_local = [UNRESOLVED] * LIGHT_SLOTS
+        for (index, name) in enumerate(light_plugins):
+            self._light_local[index] = local_indexes.get(name.lower(), UNRESOLVED)
+
+        if numpy is not None:
+            self._np_global_prefixes = numpy.array(self._global_prefixes, numpy.int64)
+            self._np_global_masks = numpy.array(self._global_masks, numpy.uint32)
+            self._np_full_local = numpy.array(self._full_local, numpy.int64)
+            self._np_light_local = numpy.array(self._light_local, numpy.int64)
+
+    @staticmethod
+    def _check_unresolved(form_ids: T_FormIDs, resolved: T_FormIDs, strict: bool):
+        """Raises if form ids could not be resolved in a strict conversion.
+
+        Args:
+            form_ids (T_FormIDs): The converted form ids
+            resolved (T_FormIDs): The (possibly null) conversions of the form ids
+            strict (bool): True if the conversion is strict
+
+        Raises:
+            ValueError: If a conversion is strict and any non-null form id was
+                converted to a null form id
+        """
+
+        if not strict:
+            return
+        for (form_id, resolved_form_id) in zip(form_ids, resolved):
+            if form_id != 0 and resolved_form_id == 0:
+                raise ValueError(f"form id {int(form_id):#010x} cannot be resolved")
+
+    def to_global(self, form_ids: T_FormIDs, strict: bool = False) -> T_FormIDs:
+        """Converts local form ids to global form ids.
+
+        Args:
+            form_ids (T_FormIDs): The form ids relative to the plugin's masters
+            strict (bool, optional): Defaults to False. Raises if any form id cannot
+                be resolved instead of converting it to a null form id
+
+        Raises:
+            ValueError: If `strict` and a form id belongs to an inactive master
+
+        Returns:
+            T_FormIDs: The global form ids (a ``numpy.ndarray`` of ``uint32`` if
+                NumPy is available, otherwise an ``array.array`` of ``I``)
+        """
+
+        if numpy is not None:
+            form_ids = numpy.asarray(form_ids, dtype=numpy.uint32)
+            master_indexes = form_ids >> 24
+            prefixes = self._np_global_prefixes[master_indexes]
+            resolved = (prefixes.astype(numpy.uint32)) | (
+                form_ids & self._np_global_masks[master_indexes]
+            )
+            resolved[(prefixes == UNRESOLVED) | (form_ids == 0)] = 0
+            if strict and numpy.any((resolved == 0) & (form_ids != 0)):
+                self._check_unresolved(form_ids, resolved, strict)
+            return resolved
+
+        (prefixes, masks) = (self._global_prefixes, self._global_masks)
+        form_ids = array.array("I", form_ids)
+        resolved = array.array(
+            "I",
+            (
+                0
+                if form_id == 0 or prefixes[form_id >> 24] == UNRESOLVED
+                else prefixes[form_id >> 24] | (form_id & masks[form_id >> 24])
+                for form_id in form_ids
+            ),
+        )
+        self._check_unresolved(form_ids, resolved, strict)
+        return resolved
+
+    def to_local(self, form_ids: T_FormIDs, strict: bool = False) -> T_FormIDs:
+        """Converts global form ids to local form ids.
+
+        Args:
+            form_ids (T_FormIDs): The form ids relative to the load order
+            strict (bool, optional): Defaults to False. Raises if any form id cannot
+                be resolved instead of converting it to a null form id
+
+        Raises:
+            ValueError: If `strict` and a form id belongs to a plugin which is
+                neither the plugin nor one of its masters
+
+        Returns:
+            T_FormIDs: The local form ids (a ``numpy.ndarray`` of ``uint32`` if
+                NumPy is available, otherwise an ``array.array`` of ``I``)
+        """
+
+        if numpy is not None:
+            form_ids = numpy.asarray(form_ids, dtype=numpy.uint32)
+            load_indexes = form_ids >> 24
+            is_light = load_indexes == LIGHT_PREFIX
+            master_indexes = numpy.where(
+                is_light,
+                self._np_light_local[(form_ids >> 12) & 0xFFF],
+                self._np_full_local[load_indexes],
+            )
+            object_ids = numpy.where(is_light, form_ids & 0xFFF, form_ids & 0xFFFFFF)
+            resolved = (master_indexes.astype(numpy.uint32) << 24) | object_ids
+            resolved[(master_indexes == UNRESOLVED) | (form_ids == 0)] = 0
+            if strict and numpy.any((resolved == 0) & (form_ids != 0)):
+                self._check_unresolved(form_ids, resolved, strict)
+            return resolved.astype(numpy.uint32)
+
+        def resolve(form_id: int) -> int:
+            if form_id == 0:
+                return 0
+            if (form_id >> 24) == LIGHT_PREFIX:
+                master_index = self._light_local[(form_id >> 12) & 0xFFF]
+                object_id = form_id & 0xFFF
+            else:
+                master_index = self._full_local[form_id >> 24]
+                object_id = form_id & 0xFFFFFF
+            if master_index == UNRESOLVED:
+                return 0
+            return (master_index << 24) | object_id
+
+        form_ids = array.array("I", form_ids)
+        resolved = array.array("I", (resolve(form_id) for form_id in form_ids))
+        self._check_unresolved(form_ids, resolved, strict)
+        return resolved
+
+    def resolve(self, form_id: int) -> Optional[int]:
+        """Converts a single local form id to a global form id.
+
+        Args:
+            form_id (int): The form id relative to the plugin's masters
+
+        Returns:
+            Optional[int]: The global form id, None if it cannot be resolved
+        """
+
+        if form_id == 0:
+            return 0
+        prefix = self._global_prefixes[form_id >> 24]
+        if prefix == UNRESOLVED:
+            return None
+        return prefix | (form_id & self._global_masks[form_id >> 24])
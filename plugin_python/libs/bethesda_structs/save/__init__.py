@@ -0,0 +1,6 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+from .ess import SaveInfo, get_newest_saves, list_save_filepaths
+from .index import SaveEntry, SaveIndex
+from ._common import SaveBodyReader, LZ4BlockDecoder
@@ -0,0 +1,246 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import zlib
+from typing import BinaryIO
+
+READ_BLOCK_SIZE = 2 ** 16
+"""The number of compressed bytes read from a save at once.
+"""
+
+
+class LZ4BlockDecoder(object):
+    """An incremental decoder for the `LZ4 block format
+    <https://github.com/lz4/lz4/blob/dev/doc/lz4_Block_format.md>`_.
+
+    Note:
+        Unlike ``lz4.block.decompress`` the decoder stops as soon as the requested
+        number of bytes have been decoded, so reading the prefix of a large
+        compressed body only reads and decodes the sequences covering the prefix.
+        Decoded output is kept entirely, as matches may reference any earlier output.
+    """
+
+    def __init__(self, stream: BinaryIO, compressed_size: int):
+        """Creates a decoder reading a compressed block from a stream.
+
+        Args:
+            stream (BinaryIO): The stream positioned at the start of the block
+            compressed_size (int): The size of the compressed block
+        """
+
+        self.stream = stream
+        self.remaining = compressed_size
+        self.input = bytearray()
+        self.input_offset = 0
+        self.output = bytearray()
+
+    @property
+    def eof(self) -> bool:
+        """True if the entire block has been decoded.
+
+        Returns:
+            bool: True if the entire block has been decoded
+        """
+
+        return self.remaining <= 0 and self.input_offset >= len(self.input)
+
+    def _fill(self, size: int) -> bool:
+        """Ensures a number of compressed bytes are buffered.
+
+        Args:
+            size (int): The number of compressed bytes needed
+
+        Returns:
+            bool: True if the bytes are available, False if the block is exhausted
+        """
+
+        while (len(self.input) - self.input_offset) < size:
+            if self.remaining <= 0:
+                return False
+            chunk = self.stream.read(min(READ_BLOCK_SIZE, self.remaining))
+            if len(chunk) <= 0:
+                raise ValueError("compressed block is truncated")
+            self.remaining -= len(chunk)
+            # NOTE: consumed input is dropped so the buffer stays bounded
+            del self.input[: self.input_offset]
+            self.input_offset = 0
+            self.input.extend(chunk)
+        return True
+
+    def _read_byte(self) -> int:
+        """Reads a single compressed byte.
+
+        Raises:
+            ValueError: If the block is truncated
+
+        Returns:
+            int: The compressed byte
+        """
+
+        if not self._fill(1):
+            raise ValueError("compressed block is truncated")
+        value = self.input[self.input_offset]
+        self.input_offset += 1
+        return value
+
+    def _read_length(self, length: int) -> int:
+        """Reads the extension bytes of a literal or match length.
+
+        Args:
+            length (int): The length given by the sequence token
+
+        Returns:
+            int: The full length
+        """
+
+        if length == 15:
+            while True:
+                value = self._read_byte()
+                length += value
+                if value != 255:
+                    break
+        return length
+
+    def decode(self, size: int) -> bytearray:
+        """Decodes sequences until at least a given number of bytes are decoded.
+
+        Args:
+            size (int): The number of bytes to decode
+
+        Raises:
+            ValueError: If the block is truncated or references data before its start
+
+        Returns:
+            bytearray: All decoded bytes (may be longer or, if the block is exhausted,
+                shorter than `size`)
+        """
+
+        output = self.output
+        while len(output) < size and self._fill(1):
+            token = self._read_byte()
+
+            literal_size = self._read_length(token >> 4)
+            if not self._fill(literal_size):
+                raise ValueError("compressed block is truncated")
+            output.extend(
+                self.input[self.input_offset : self.input_offset + literal_size]
+            )
+            self.input_offset += literal_size
+
+            # NOTE: the last sequence of a block only consists of literals
+            if not self._fill(2):
+                break
+            offset = self.input[self.input_offset] | (
+                self.input[self.input_offset + 1] << 8
+            )
+            self.input_offset += 2
+            match_size = self._read_length(token & 0x0F) + 4
+            start = len(output) - offset
+            if offset <= 0 or start < 0:
+                raise ValueError(f"invalid match offset {offset!r}")
+
+            # NOTE: matches may overlap the bytes they produce (repeating patterns)
+            while match_size > 0:
+                chunk_size = min(match_size, len(output) - start)
+                output.extend(output[start : start + chunk_size])
+                start += chunk_size
+                match_size -= chunk_size
+        return output
+
+
+class SaveBodyReader(object):
+    """A sequential reader of a save's (possibly compressed) body.
+
+    Only as much of the body as is read is decompressed, so the leading sections of
+    a save can be read without inflating the entire body.
+    """
+
+    COMPRESSION_NONE = 0
+    COMPRESSION_ZLIB = 1
+    COMPRESSION_LZ4 = 2
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        compression: int = COMPRESSION_NONE,
+        compressed_size: int = None,
+    ):
+        """Creates a reader of the body starting at the stream's position.
+
+        Args:
+            stream (BinaryIO): The stream positioned at the start of the body
+            compression (int, optional): Defaults to ``COMPRESSION_NONE``. The
+                compression type of the body
+            compressed_size (int, optional): Defaults to None. The size of the
+                compressed body (required for compressed bodies)
+
+        Raises:
+            ValueError: If the compression type is not supported
+        """
+
+        if compression not in (
+            self.COMPRESSION_NONE,
+            self.COMPRESSION_ZLIB,
+            self.COMPRESSION_LZ4,
+        ):
+            raise ValueError(f"unsupported save compression type {compression!r}")
+
+        self.stream = stream
+        self.compression = compression
+        self.remaining = compressed_size
+        self.position = 0
+        self.buffer = bytearray()
+        self.inflater = None
+        if compression == self.COMPRESSION_ZLIB:
+            self.inflater = zlib.decompressobj()
+        elif compression == self.COMPRESSION_LZ4:
+            self.inflater = LZ4BlockDecoder(stream, compressed_size)
+
+    def _inflate(self, size: int):
+        """Decompresses the body until a number of bytes are buffered.
+
+        Args:
+            size (int): The number of decompressed bytes needed
+        """
+
+        if self.compression == self.COMPRESSION_LZ4:
+            self.buffer = self.inflater.decode(size)
+            return
+
+        while len(self.buffer) < size:
+            pending = self.inflater.unconsumed_tail
+            if len(pending) <= 0:
+                if self.remaining <= 0 or self.inflater.eof:
+                    return
+                pending = self.stream.read(min(READ_BLOCK_SIZE, self.remaining))
+                if len(pending) <= 0:
+                    return
+                self.remaining -= len(pending)
+            self.buffer.extend(
+                self.inflater.decompress(pending, max(size - len(self.buffer), 1))
+            )
+
+    def read(self, size: int) -> bytes:
+        """Reads a number of bytes from the body.
+
+        Args:
+            size (int): The number of bytes to read
+
+        Raises:
+            ValueError: If the body ends before `size` bytes are read
+
+        Returns:
+            bytes: The read bytes
+        """
+
+        if self.compression == self.COMPRESSION_NONE:
+            data = self.stream.read(size)
+        else:
+            self._inflate(self.position + size)
+            data = bytes(self.buffer[self.position : self.position + size])
+        if len(data) < size:
+            raise ValueError(
+                f"save body ended after {(self.position + len(data))!r} bytes"
+            )
+        self.position += size
+        return data
@@ -0,0 +1,299 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import os
+import struct
+import datetime
+from typing import List, Tuple, BinaryIO
+
+import attr
+from construct import (
+    If,
+    Const,
+    Struct,
+    Int16ul,
+    Int32ul,
+    Int64ul,
+    Float32l,
+    Prefixed,
+    GreedyBytes,
+    ExprAdapter,
+    ConstructError,
+)
+
+from ._common import SaveBodyReader
+
+ESS_MAGIC = b"TESV_SAVEGAME"
+"""The magic of Skyrim and Skyrim: Special Edition saves.
+"""
+
+FILETIME_EPOCH = datetime.datetime(1601, 1, 1, tzinfo=datetime.timezone.utc)
+"""The epoch of Windows ``FILETIME`` timestamps.
+"""
+
+
+def decode_wstring(value: bytes) -> str:
+    """Decodes a string stored in a save.
+
+    Note:
+        Saves store strings in the game's code page rather than UTF-8, strings
+        which are not valid UTF-8 are decoded as Windows-1252.
+
+    Args:
+        value (bytes): The raw string
+
+    Returns:
+        str: The decoded string
+    """
+
+    try:
+        return value.decode("utf8")
+    except UnicodeDecodeError:
+        return value.decode("cp1252", errors="replace")
+
+
+WString = ExprAdapter(
+    Prefixed(Int16ul, GreedyBytes),
+    lambda obj, context: decode_wstring(obj),
+    lambda obj, context: obj.encode("utf8"),
+)
+"""The structure of the length prefixed strings of saves.
+"""
+
+
+@attr.s
+class SaveInfo(object):
+    """The header and plugin lists of a Skyrim or Skyrim: Special Edition save.
+
+    Note:
+        Only the leading sections of a save are read.
+        Of a compressed body only the prefix holding the plugin lists is decompressed
+        (see :class:`~bethesda_structs.save._common.SaveBodyReader`).
+
+    **Credit:**
+        - `UESP <https://en.uesp.net/wiki/Skyrim_Mod:Save_File_Format>`_
+    """
+
+    header_struct = Struct(
+        "magic" / Const(ESS_MAGIC),
+        "header_size" / Int32ul,
+        "version" / Int32ul,
+        "save_number" / Int32ul,
+        "player_name" / WString,
+        "player_level" / Int32ul,
+        "player_location" / WString,
+        "game_date" / WString,
+        "player_race" / WString,
+        "player_sex" / Int16ul,
+        "player_experience" / Float32l,
+        "player_level_up_experience" / Float32l,
+        "filetime" / Int64ul,
+        "screenshot_width" / Int32ul,
+        "screenshot_height" / Int32ul,
+        "compression_type" / If(lambda this: this.version >= 12, Int16ul),
+    )
+    """The structure of save headers.
+
+    Returns:
+        :class:`~construct.core.Struct`: The structure of save headers
+    """
+
+    filepath = attr.ib(type=str)
+    version = attr.ib(type=int)
+    save_number = attr.ib(type=int)
+    player_name = attr.ib(type=str)
+    player_level = attr.ib(type=int)
+    player_location = attr.ib(type=str)
+    game_date = attr.ib(type=str)
+    filetime = attr.ib(type=int, repr=False)
+    compression_type = attr.ib(type=int)
+    form_version = attr.ib(type=int)
+    plugins = attr.ib(type=List[str], default=attr.Factory(list), repr=False)
+    light_plugins = attr.ib(type=List[str], default=attr.Factory(list), repr=False)
+
+    @property
+    def saved_at(self) -> datetime.datetime:
+        """The time the save was created.
+
+        Returns:
+            datetime.datetime: The time the save was created (UTC)
+        """
+
+        return FILETIME_EPOCH + datetime.timedelta(microseconds=(self.filetime // 10))
+
+    @classmethod
+    def can_handle_header(cls, header: bytes) -> bool:
+        """Determines if a file can be handled given its leading bytes.
+
+        Args:
+            header (bytes): The leading bytes of the file
+
+        Returns:
+            bool: True if the file can be handled, otherwise False
+        """
+
+        return header[: len(ESS_MAGIC)] == ESS_MAGIC
+
+    @staticmethod
+    def _read_plugin_lists(
+        body: SaveBodyReader, form_version: int
+    ) -> Tuple[List[str], List[str]]:
+        """Reads the full and light plugin lists from the start of a save's body.
+
+        Args:
+            body (SaveBodyReader): The reader positioned after the form version
+            form_version (int): The form version of the save
+
+        Returns:
+            Tuple[List[str], List[str]]: A tuple of (plugins, light plugins)
+        """
+
+        def read_wstrings(count: int) -> List[str]:
+            values = []
+            for _ in range(count):
+                (size,) = struct.unpack("<H", body.read(2))
+                values.append(decode_wstring(body.read(size)))
+            return values
+
+        # NOTE: skips the size of the plugin info section
+        body.read(4)
+        plugins = read_wstrings(body.read(1)[0])
+        light_plugins = []
+        # NOTE: light plugins are listed since form version 78 (Skyrim SE 1.5.3)
+        if form_version >= 78:
+            light_plugins = read_wstrings(struct.unpack("<H", body.read(2))[0])
+        return (plugins, light_plugins)
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO, filepath: str = None) -> "SaveInfo":
+        """Reads the header and plugin lists of a save from a stream.
+
+        Args:
+            stream (BinaryIO): The stream positioned at the start of the save
+            filepath (str, optional): Defaults to None. Sets the filepath attribute
+                for user's reference
+
+        Raises:
+            ValueError: If the stream is not a supported save or is truncated
+
+        Returns:
+            SaveInfo: The read save info
+        """
+
+        start = stream.tell()
+        try:
+            header = cls.header_struct.parse_stream(stream)
+        except ConstructError as exc:
+            raise ValueError(f"invalid save header, {exc!s}") from exc
+
+        # NOTE: Skyrim SE screenshots are RGBA, Skyrim screenshots are RGB
+        pixel_size = 4 if header.version >= 12 else 3
+        stream.seek(
+            start
+            + len(ESS_MAGIC)
+            + 4
+            + header.header_size
+            + (header.screenshot_width * header.screenshot_height * pixel_size)
+        )
+
+        compression_type = header.compression_type or SaveBodyReader.COMPRESSION_NONE
+        compressed_size = None
+        if header.version >= 12:
+            sizes = stream.read(8)
+            if len(sizes) < 8:
+                raise ValueError("save is truncated before its body")
+            (_, compressed_size) = struct.unpack("<II", sizes)
+
+        body = SaveBodyReader(stream, compression_type, compressed_size)
+        form_version = body.read(1)[0]
+        (plugins, light_plugins) = cls._read_plugin_lists(body, form_version)
+        return cls(
+            filepath=filepath,
+            version=header.version,
+            save_number=header.save_number,
+            player_name=header.player_name,
+            player_level=header.player_level,
+            player_location=header.player_location,
+            game_date=header.game_date,
+            filetime=header.filetime,
+            compression_type=compression_type,
+            form_version=form_version,
+            plugins=plugins,
+            light_plugins=light_plugins,
+        )
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "SaveInfo":
+        """Reads the header and plugin lists of a save file.
+
+        Args:
+            filepath (str): The path of the save
+
+        Raises:
+            FileNotFoundError: When the given `filepath` cannot be found
+            ValueError: If the file is not a supported save or is truncated
+
+        Returns:
+            SaveInfo: The read save info
+
+        Example:
+            >>> info = SaveInfo.from_file("/home/username/Saves/Save 1 - Dovahkiin.ess")
+            >>> info.light_plugins[:2]
+            ['ccBGSSSE001-Fish.esm', 'ccQDRSSE001-SurvivalMode.esl']
+        """
+
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"file {filepath!r} does not exist")
+
+        with open(filepath, "rb") as stream:
+            return cls.from_stream(stream, filepath=os.fspath(filepath))
+
+
+def list_save_filepaths(
+    saves_dir: str, extension: str = ".ess"
+) -> List[Tuple[str, os.stat_result]]:
+    """Lists the saves in a directory, newest first.
+
+    Args:
+        saves_dir (str): The directory holding the saves
+        extension (str, optional): Defaults to ".ess". The extension of saves
+
+    Returns:
+        List[Tuple[str, os.stat_result]]: A list of (filepath, stat) tuples sorted by
+            modification time (newest first)
+    """
+
+    saves = []
+    if not os.path.isdir(saves_dir):
+        return saves
+    with os.scandir(saves_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(extension):
+                saves.append((entry.path, entry.stat()))
+    saves.sort(key=lambda save: save[1].st_mtime, reverse=True)
+    return saves
+
+
+def get_newest_saves(saves_dir: str, count: int = 1) -> List[SaveInfo]:
+    """Reads the newest saves of a directory.
+
+    Note:
+        Saves which cannot be read are skipped.
+
+    Args:
+        saves_dir (str): The directory holding the saves
+        count (int, optional): Defaults to 1. The number of saves to read
+
+    Returns:
+        List[SaveInfo]: The read saves (newest first)
+    """
+
+    saves = []
+    for (filepath, _) in list_save_filepaths(saves_dir):
+        if len(saves) >= count:
+            break
+        try:
+            saves.append(SaveInfo.from_file(filepath))
+        except (OSError, ValueError):
+            continue
+    return saves
@@ -0,0 +1,326 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+import os
+import json
+from typing import Dict, List, Tuple, Generator
+from pathlib import Path
+
+import attr
+
+from .ess import SaveInfo, list_save_filepaths
+from .._common import parallel_map
+
+T_LoadOrder = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+INDEX_VERSION = 1
+"""The version of persisted save indexes, indexes of other versions are rebuilt.
+"""
+
+
+@attr.s
+class SaveEntry(object):
+    """The load order baked into a single save.
+    """
+
+    filename = attr.ib(type=str)
+    """The name of the save file.
+
+    Returns:
+        str: The name of the save file
+    """
+
+    size = attr.ib(type=int)
+    """The size of the save when it was read.
+
+    Returns:
+        int: The size of the save
+    """
+
+    mtime = attr.ib(type=float)
+    """The modification time of the save when it was read.
+
+    Returns:
+        float: The modification time of the save
+    """
+
+    save_number = attr.ib(type=int, default=0)
+    """The save number of the save.
+
+    Returns:
+        int: The save number of the save
+    """
+
+    player_name = attr.ib(type=str, default="")
+    """The name of the character the save belongs to.
+
+    Returns:
+        str: The name of the character
+    """
+
+    plugins = attr.ib(type=List[str], default=attr.Factory(list), repr=False)
+    """The full plugins of the save (in load order).
+
+    Returns:
+        List[str]: The full plugins of the save
+    """
+
+    light_plugins = attr.ib(type=List[str], default=attr.Factory(list), repr=False)
+    """The light plugins of the save (in load order).
+
+    Returns:
+        List[str]: The light plugins of the save
+    """
+
+    @classmethod
+    def from_path(cls, filepath: str) -> "SaveEntry":
+        """Reads the load order of a save.
+
+        Args:
+            filepath (str): The path of the save
+
+        Raises:
+            FileNotFoundError: When the given `filepath` cannot be found
+            ValueError: If the file is not a supported save or is truncated
+
+        Returns:
+            SaveEntry: The load order of the save
+        """
+
+        stat = os.stat(filepath)
+        save_info = SaveInfo.from_file(filepath)
+        return cls(
+            os.path.basename(filepath),
+            stat.st_size,
+            stat.st_mtime,
+            save_number=save_info.save_number,
+            player_name=save_info.player_name,
+            plugins=save_info.plugins,
+            light_plugins=save_info.light_plugins,
+        )
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        """Determines if the read load order is still current.
+
+        Args:
+            stat (os.stat_result): The current stat of the save
+
+        Returns:
+            bool: True if the save's size and modification time are unchanged
+        """
+
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    def to_dict(self) -> dict:
+        """Serializes the entry for persisting.
+
+        Returns:
+            dict: The serialized entry
+        """
+
+        return attr.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SaveEntry":
+        """Deserializes a persisted entry.
+
+        Args:
+            data (dict): The serialized entry
+
+        Returns:
+            SaveEntry: The deserialized entry
+        """
+
+        return cls(**data)
+
+
+@attr.s
+class SaveIndex(object):
+    """An index of the load orders baked into the saves of a directory.
+
+    Only saves which are new or whose size or modification time changed are read on
+    :func:`~SaveIndex.update`, so directories with hundreds of saves are only read in
+    full once.
+
+    Example:
+        >>> index = bethesda_structs.save.SaveIndex.build(
+        ...     "/home/username/Documents/My Games/Skyrim Special Edition/Saves",
+        ...     cache_path="/home/username/.cache/save_index.json",
+        ... )
+        >>> [entry.filename for entry in index.iter_entries()][:1]
+        ['Save 120 - Dovahkiin  Whiterun  12.03.45.ess']
+    """
+
+    saves_dir = attr.ib(type=str)
+    """The directory holding the saves.
+
+    Returns:
+        str: The directory holding the saves
+    """
+
+    entries = attr.ib(type=Dict[str, SaveEntry], default=attr.Factory(dict))
+    """The indexed saves by filename.
+
+    Returns:
+        Dict[str, SaveEntry]: The indexed saves by filename
+    """
+
+    @classmethod
+    def build(
+        cls, saves_dir: str, cache_path: str = None, max_workers: int = None
+    ) -> "SaveIndex":
+        """Builds an index of the saves of a directory.
+
+        Args:
+            saves_dir (str): The directory holding the saves
+            cache_path (str, optional): Defaults to None. The path of a persisted
+                index to reuse the entries of unchanged saves from (and to save the
+                built index to)
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to read saves
+
+        Returns:
+            SaveIndex: The built index
+        """
+
+        saves_dir = os.fspath(saves_dir)
+        index = cls(saves_dir)
+        if cache_path is not None and os.path.isfile(cache_path):
+            index = cls.load(cache_path)
+            if index.saves_dir != saves_dir:
+                index = cls(saves_dir)
+        index.update(max_workers=max_workers)
+        if cache_path is not None:
+            index.save(cache_path)
+        return index
+
+    def update(self, max_workers: int = None) -> List[str]:
+        """Updates the index for the current saves of the directory.
+
+        Note:
+            Entries of deleted saves are dropped and saves which cannot be read are
+            left out of the index.
+
+        Args:
+            max_workers (int, optional): Defaults to None. The number of threads used
+                to read saves
+
+        Returns:
+            List[str]: The filenames of the saves which were read
+        """
+
+        saves = list_save_filepaths(self.saves_dir)
+        stale = [
+            filepath
+            for (filepath, stat) in saves
+            if os.path.basename(filepath) not in self.entries
+            or not self.entries[os.path.basename(filepath)].is_current(stat)
+        ]
+
+        def read_entry(filepath: str) -> SaveEntry:
+            try:
+                return SaveEntry.from_path(filepath)
+            except (OSError, ValueError):
+                return None
+
+        current = set(os.path.basename(filepath) for (filepath, _) in saves)
+        for filename in list(self.entries.keys()):
+            if filename not in current:
+                del self.entries[filename]
+
+        read = []
+        for (filepath, entry) in zip(
+            stale, parallel_map(read_entry, stale, max_workers)
+        ):
+            filename = os.path.basename(filepath)
+            self.entries.pop(filename, None)
+            if entry is not None:
+                self.entries[filename] = entry
+                read.append(filename)
+        return read
+
+    def iter_entries(self) -> Generator[SaveEntry, None, None]:
+        """Iterates over the indexed saves, newest first.
+
+        Yields:
+            SaveEntry: The indexed saves (newest first)
+        """
+
+        yield from sorted(
+            self.entries.values(), key=lambda entry: entry.mtime, reverse=True
+        )
+
+    def iter_load_orders(
+        self
+    ) -> Generator[Tuple[T_LoadOrder, List[SaveEntry]], None, None]:
+        """Iterates over the distinct load orders of the indexed saves.
+
+        Note:
+            Saves of a playthrough usually share their load order, grouping them
+            allows each distinct load order to be checked once.
+
+        Yields:
+            Tuple[T_LoadOrder, List[SaveEntry]]: A tuple of ((plugins, light
+                plugins), saves sharing them (newest first)), newest load order first
+        """
+
+        load_orders: Dict[T_LoadOrder, List[SaveEntry]] = {}
+        for entry in self.iter_entries():
+            load_orders.setdefault(
+                (tuple(entry.plugins), tuple(entry.light_plugins)), []
+            ).append(entry)
+        yield from load_orders.items()
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def save(self, filepath: str):
+        """Persists the index as JSON.
+
+        Args:
+            filepath (str): The path of the file to persist the index to
+        """
+
+        filepath = Path(filepath)
+        temp_filepath = filepath.with_name(filepath.name + ".tmp")
+        with temp_filepath.open("w", encoding="utf8") as stream:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "saves_dir": self.saves_dir,
+                    "entries": [entry.to_dict() for entry in self.entries.values()],
+                },
+                stream,
+            )
+        os.replace(temp_filepath, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "SaveIndex":
+        """Loads a persisted index.
+
+        Note:
+            Indexes persisted by a different version (or which cannot be read) are
+            loaded as empty indexes.
+
+        Args:
+            filepath (str): The path of the persisted index
+
+        Returns:
+            SaveIndex: The loaded index
+        """
+
+        try:
+            with open(filepath, "r", encoding="utf8") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return cls("")
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls("")
+        entries = [SaveEntry.from_dict(entry) for entry in data["entries"]]
+        return cls(
+            data["saves_dir"], entries={entry.filename: entry for entry in entries}
+        )
@@ -0,0 +1,91 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://choosealicense.com/licenses/mit/>
+
+from typing import List, Type, Iterable, Optional
+
+from ._common import SNIFF_SIZE, BaseFiletype, open_filetype, open_filetypes
+from .plugin import AVAILABLE_PLUGINS
+from .archive import AVAILABLE_ARCHIVES
+
+AVAILABLE_FILETYPES = AVAILABLE_ARCHIVES + AVAILABLE_PLUGINS
+
+
+def sniff_header(header: bytes) -> Optional[Type[BaseFiletype]]:
+    """Determines the filetype of a file from its leading bytes.
+
+    Args:
+        header (bytes): The leading :data:`~bethesda_structs._common.SNIFF_SIZE`
+            bytes of the file
+
+    Returns:
+        Optional[Type[BaseFiletype]]: The filetype handling the file, or None
+    """
+
+    for filetype in AVAILABLE_FILETYPES:
+        if filetype.can_handle_header(header):
+            return filetype
+
+
+def sniff_file(filepath: str) -> Optional[Type[BaseFiletype]]:
+    """Determines the filetype of a file by reading only its leading bytes.
+
+    Args:
+        filepath (str): The filepath to sniff
+
+    Raises:
+        FileNotFoundError: If the given filepath does not exist
+
+    Returns:
+        Optional[Type[BaseFiletype]]: The filetype handling the file, or None
+    """
+
+    with open(filepath, "rb") as stream:
+        return sniff_header(stream.read(SNIFF_SIZE))
+
+
+def open_file(filepath: str, use_mmap: bool = True) -> Optional[BaseFiletype]:
+    """Opens any supported archive or plugin.
+
+    Args:
+        filepath (str): The filepath to open
+        use_mmap (bool, optional): Defaults to True. Memory maps the file instead of
+            reading its content
+
+    Raises:
+        FileNotFoundError: If the given filepath does not exist
+
+    Returns:
+        Optional[BaseFiletype]: The archive or plugin, or None if the file is not
+            supported
+
+    Example:
+        >>> bethesda_structs.sniff.open_file("/home/username/Data/FalloutNV.esm")
+        FNVPlugin(filepath=PosixPath(...))
+    """
+
+    return open_filetype(filepath, AVAILABLE_FILETYPES, use_mmap=use_mmap)
+
+
+def open_files(
+    filepaths: Iterable[str], use_mmap: bool = True, max_workers: int = None
+) -> List[Optional[BaseFiletype]]:
+    """Opens many supported archives and plugins concurrently.
+
+    Args:
+        filepaths (Iterable[str]): The filepaths to open
+        use_mmap (bool, optional): Defaults to True. Memory maps the files instead of
+            reading their content
+        max_workers (int, optional): Defaults to None. The number of threads used to
+            open files
+
+    Raises:
+        FileNotFoundError: If a given filepath does not exist
+
+    Returns:
+        List[Optional[BaseFiletype]]: The archives and plugins (in order of
+            `filepaths`), None for unsupported files
+    """
+
+    return open_filetypes(
+        filepaths, AVAILABLE_FILETYPES, use_mmap=use_mmap, max_workers=max_workers
+    )